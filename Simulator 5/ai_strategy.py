@@ -1,119 +1,234 @@
 import random
 import math
+import heapq
+import operator
+from collections import deque
 from typing import Dict, List, Tuple, Set, Optional
 
+def attack_win_probability(attacker_armies: int, defender_armies: int) -> float:
+    """Simplified win probability curve based on empirical Risk odds"""
+    if defender_armies > 0:  # Prevent division by zero
+        advantage_ratio = attacker_armies / defender_armies
+    else:
+        advantage_ratio = attacker_armies
+    # Higher advantage = higher win probability, clamped to 0.1-0.9
+    return min(0.9, max(0.1, 0.5 + (advantage_ratio - 1) * 0.2))
+
+# Army counts are small integers, so precompute the curve for the common range
+WIN_PROB_TABLE_SIZE = 64
+WIN_PROB_TABLE = [[attack_win_probability(attacker, defender) for defender in range(WIN_PROB_TABLE_SIZE)]
+                  for attacker in range(WIN_PROB_TABLE_SIZE)]
+
 class AIStrategy:
     """Base class for AI strategies with advanced decision-making capabilities"""
     
+    # Attack scoring coefficients, overridden by strategy styles
+    attack_mult = 1.0  # Overall multiplier applied to every attack score
+    overwhelm_ratio: Optional[int] = None  # Bonus when attacker armies exceed defender armies * ratio
+    overwhelm_bonus = 1.0
+    completion_bonus = 1.0  # Extra multiplier for attacks that complete a continent
+    break_threshold: Optional[float] = None  # Bonus when an opponent controls more than this share
+    break_bonus = 1.0
+    
     def __init__(self, player_name: str, game_board):
         self.player_name = player_name
         self.game_board = game_board
+        # Compare owners by integer ID rather than by name in the hot loops
+        self._pid = game_board.get_player_id(player_name)
+        # Territories never change continent, so resolve the mapping once per game
+        self._territory_to_continent: Dict[str, str] = {}
+        for continent_name, continent in game_board.continents.items():
+            for territory_name in continent.territories:
+                self._territory_to_continent[territory_name] = continent_name
+        # Gateways come from the board; each one is an entry point into its continent
+        self._gateway_territories: frozenset = game_board.gateway_territories
+        self._entry_points: Dict[str, int] = {continent_name: 0 for continent_name in game_board.continents}
+        for territory_name in self._gateway_territories:
+            self._entry_points[self._territory_to_continent[territory_name]] += 1
+        # Neighbours as (name, territory) pairs so hot loops skip the per-neighbour lookups
+        self._adj_objs: Dict[str, Tuple[Tuple[str, object], ...]] = {}
+        for territory_name in game_board.territories:
+            self._adj_objs[territory_name] = tuple(
+                (adj_name, game_board.get_territory(adj_name))
+                for adj_name in game_board.adjacencies.get(territory_name, ())
+                if game_board.get_territory(adj_name)
+            )
+        # Static per-continent and per-territory factors for calculate_strategic_values,
+        # kept as parallel lists indexed by continent/territory position
+        self._continent_names: List[str] = list(game_board.continents)
+        self._continent_size_of: Dict[str, int] = {
+            name: len(continent.territories) for name, continent in game_board.continents.items()
+        }
+        self._continent_sizes: List[int] = []
+        self._continent_bonus_per_entry: List[float] = []
+        self._continent_size_factors: List[float] = []
+        for continent_name in self._continent_names:
+            continent = game_board.continents[continent_name]
+            total_territories = len(continent.territories)
+            self._continent_sizes.append(total_territories)
+            self._continent_bonus_per_entry.append(continent.bonus_armies / self.count_continent_entry_points(continent_name))
+            self._continent_size_factors.append(1.0 + (6 - total_territories) * 0.1)  # Bonus for smaller continents
+        self._territory_names: List[str] = list(game_board.territories)
+        self._territory_continent_idx: List[int] = game_board.territory_continent_ids
+        self._territory_is_gateway: List[bool] = []
+        self._territory_adj_counts: List[int] = []
+        self._territory_connectivity: List[float] = []
+        for territory_name in self._territory_names:
+            self._territory_is_gateway.append(territory_name in self._gateway_territories)
+            adj_count = game_board.adjacency_counts.get(territory_name, 0)
+            self._territory_adj_counts.append(adj_count)
+            self._territory_connectivity.append(max(0.8, 1.0 + (adj_count - 3) * 0.1))
+        # Topology-only value multipliers used by strategy subclasses, keyed by strategy
+        self._static_factor_cache: Dict[str, List[Tuple[str, float]]] = {}
         self.territory_values = {}  # Strategic value of each territory
         self.continent_priorities = {}  # Priority of each continent
         self.target_continent = None  # Current continent being targeted for conquest
-        self.calculate_strategic_values()
+        # Strategic values are recomputed only after the board is marked dirty
+        self._values_dirty = True
+        # Territories owned per (player, continent), kept current via notify_ownership_change
+        self._control_counts: Dict[Tuple[str, str], int] = {}
+        # Territories owned per player; players drop to zero when eliminated
+        self._territory_counts: Dict[str, int] = {}
+        # Territory names owned by each player
+        self._owned_sets: Dict[str, Set[str]] = {}
+        for territory_name, territory in game_board.territories.items():
+            if territory.owner is None:
+                continue
+            self._territory_counts[territory.owner] = self._territory_counts.get(territory.owner, 0) + 1
+            self._owned_sets.setdefault(territory.owner, set()).add(territory_name)
+            continent_name = self._territory_to_continent.get(territory_name)
+            if continent_name:
+                key = (territory.owner, continent_name)
+                self._control_counts[key] = self._control_counts.get(key, 0) + 1
+        # Number of neighbours this player owns for every territory
+        self._owned_neighbor_counts: Dict[str, int] = {}
+        for territory_name, adj_pairs in self._adj_objs.items():
+            self._owned_neighbor_counts[territory_name] = sum(
+                1 for _, adj_terr in adj_pairs if adj_terr.owner == player_name
+            )
+        # (player_name, territories that would complete a continent), set while enumerating attacks
+        self._completing_targets: Optional[Tuple[str, Set[str]]] = None
+        # (player_name, board mutation_id, territory -> threat level)
+        self._threat_cache: Optional[Tuple[str, int, Dict[str, float]]] = None
+        # (player_name, board ownership_hash, territory -> enemy neighbour count)
+        self._enemy_border_cache: Optional[Tuple[str, int, Dict[str, int]]] = None
+        # Continent completion lists, shared for the duration of one top-level decision
+        self._completion_cache: Dict[Tuple[str, str], List[str]] = {}
+        self._completion_set_cache: Dict[Tuple[str, str], frozenset] = {}
+        self.mark_dirty()
+        self.refresh_strategic_values()
+    
+    def mark_dirty(self):
+        """Flag strategic values as stale after a change to the board"""
+        self._values_dirty = True
+    
+    def refresh_strategic_values(self):
+        """Recalculate strategic values only if the board changed since the last calculation"""
+        if self._values_dirty:
+            self.calculate_strategic_values()
+            self._values_dirty = False
     
     def calculate_strategic_values(self):
         """Calculate strategic values for territories and continents based on the current board state"""
-        # Calculate continent priorities based on bonus and ease of defense
-        for continent_name, continent in self.game_board.continents.items():
-            # Calculate how many territories are needed to control the continent
-            total_territories = len(continent.territories)
-            territories_owned = sum(1 for terr_name in continent.territories 
-                                   if self.game_board.get_territory(terr_name).owner == self.player_name)
-            
-            # Calculate number of entry points (borders with other continents)
-            entry_points = self.count_continent_entry_points(continent_name)
-            
-            # Value = (bonus / entry_points) * (territories_owned / total_territories)^2
-            # This favors continents with higher bonuses, fewer entry points, and where we already own territories
-            if entry_points > 0:
-                continent_value = (continent.bonus_armies / entry_points) * ((territories_owned / total_territories) ** 2 + 0.1)
-            else:
-                continent_value = 0  # Should not happen, but prevent division by zero
-                
-            # Adjust for continent size - smaller continents are easier to hold
-            size_factor = 1.0 + (6 - total_territories) * 0.1  # Bonus for smaller continents
-            continent_value *= size_factor
-            
-            self.continent_priorities[continent_name] = continent_value
-        
-        # Calculate territory strategic values
-        for territory_name, territory in self.game_board.territories.items():
-            # Base value calculation
-            base_value = 1.0
-            
-            # Value increases for territories in valuable continents
-            continent = self.get_continent_for_territory(territory_name)
-            if continent:
-                # Higher value if territory is in a high-priority continent
-                continent_factor = self.continent_priorities.get(continent, 1.0) * 1.5
-                base_value *= continent_factor
-            
-            # Value increases for territories that are continent entry/exit points
-            if self.is_continent_gateway(territory_name):
+        # Count our territories per continent in one pass over the board
+        owned_counts = [0] * len(self._continent_names)
+        pid = self._pid
+        for owner_id, continent_idx in zip(self.game_board.owner_ids, self._territory_continent_idx):
+            if continent_idx >= 0 and owner_id == pid:
+                owned_counts[continent_idx] += 1
+        
+        # Value = (bonus / entry_points) * (territories_owned / total_territories)^2, adjusted for size
+        # This favors continents with higher bonuses, fewer entry points, and where we already own territories
+        continent_values = [
+            bonus_per_entry * ((owned / total) ** 2 + 0.1) * size_factor
+            for bonus_per_entry, owned, total, size_factor in zip(
+                self._continent_bonus_per_entry, owned_counts,
+                self._continent_sizes, self._continent_size_factors)
+        ]
+        self.continent_priorities.update(zip(self._continent_names, continent_values))
+        
+        # Territory value = continent factor * gateway bonus * connectivity factor
+        territory_values = self.territory_values
+        for territory_name, continent_idx, is_gateway, connectivity in zip(
+                self._territory_names, self._territory_continent_idx,
+                self._territory_is_gateway, self._territory_connectivity):
+            # Higher value if territory is in a high-priority continent
+            base_value = continent_values[continent_idx] * 1.5 if continent_idx >= 0 else 1.0
+            if is_gateway:
                 base_value *= 1.5  # Gateway territories are 50% more valuable
-            
-            # Value increases for territories with many connections (strategic positions)
-            adj_count = len(self.game_board.adjacencies.get(territory_name, []))
-            connectivity_factor = 1.0 + (adj_count - 3) * 0.1  # Base on average connectivity of ~3
-            base_value *= max(0.8, connectivity_factor)  # Min factor of 0.8
-            
-            self.territory_values[territory_name] = base_value
+            base_value *= connectivity
+            territory_values[territory_name] = base_value
+    
+    def _static_value_factors(self, key: str, factor_fn) -> List[Tuple[str, float]]:
+        """(territory, multiplier) pairs from factor_fn(adj_count, is_gateway), built once per key"""
+        factors = self._static_factor_cache.get(key)
+        if factors is None:
+            factors = []
+            for territory_name, adj_count, is_gateway in zip(
+                    self._territory_names, self._territory_adj_counts, self._territory_is_gateway):
+                factor = factor_fn(adj_count, is_gateway)
+                if factor != 1.0:  # Multiplying by 1.0 would leave the value unchanged
+                    factors.append((territory_name, factor))
+            self._static_factor_cache[key] = factors
+        return factors
     
     def count_continent_entry_points(self, continent_name: str) -> int:
         """Count how many territories in a continent border territories outside the continent"""
-        continent = self.game_board.continents.get(continent_name)
-        if not continent:
+        if continent_name not in self._entry_points:
             return 0
-            
-        entry_points = 0
-        for territory_name in continent.territories:
-            adjacent_territories = self.game_board.adjacencies.get(territory_name, [])
-            for adj_name in adjacent_territories:
-                # Check if adjacent territory is outside this continent
-                adj_continent = self.get_continent_for_territory(adj_name)
-                if adj_continent != continent_name:
-                    entry_points += 1
-                    break  # Count each territory as at most one entry point
-                    
-        return max(1, entry_points)  # Minimum of 1 to avoid division by zero
+        return max(1, self._entry_points[continent_name])  # Minimum of 1 to avoid division by zero
     
     def is_continent_gateway(self, territory_name: str) -> bool:
         """Determine if a territory is a gateway to/from a continent"""
-        territory_continent = self.get_continent_for_territory(territory_name)
-        if not territory_continent:
-            return False
-            
-        adjacent_territories = self.game_board.adjacencies.get(territory_name, [])
-        for adj_name in adjacent_territories:
-            adj_continent = self.get_continent_for_territory(adj_name)
-            if adj_continent != territory_continent:
-                return True
-                
-        return False
+        return territory_name in self._gateway_territories
     
     def get_continent_for_territory(self, territory_name: str) -> Optional[str]:
         """Get the continent a territory belongs to"""
-        for continent_name, continent in self.game_board.continents.items():
-            if territory_name in continent.territories:
-                return continent_name
-        return None
+        return self._territory_to_continent.get(territory_name)
     
     def get_player_continent_control(self, player_name: str) -> Dict[str, float]:
         """Calculate how much of each continent a player controls (0.0-1.0)"""
         control = {}
-        for continent_name, continent in self.game_board.continents.items():
-            total_territories = len(continent.territories)
+        for continent_name, total_territories in zip(self._continent_names, self._continent_sizes):
             if total_territories == 0:
                 control[continent_name] = 0
                 continue
                 
-            owned_territories = sum(1 for terr_name in continent.territories
-                                   if self.game_board.get_territory(terr_name).owner == player_name)
+            owned_territories = self._control_counts.get((player_name, continent_name), 0)
             control[continent_name] = owned_territories / total_territories
         return control
     
+    def get_continent_control_share(self, player_name: str, continent_name: str) -> float:
+        """How much of a single continent a player controls (0.0-1.0)"""
+        total_territories = self._continent_size_of.get(continent_name, 0)
+        if total_territories == 0:
+            return 0
+        return self._control_counts.get((player_name, continent_name), 0) / total_territories
+    
+    def notify_ownership_change(self, territory, old_owner: Optional[str], new_owner: Optional[str]):
+        """Update ownership counters after a territory changes hands"""
+        self.mark_dirty()
+        if old_owner is not None:
+            self._territory_counts[old_owner] -= 1
+            self._owned_sets[old_owner].discard(territory.key)
+        if new_owner is not None:
+            self._territory_counts[new_owner] = self._territory_counts.get(new_owner, 0) + 1
+            self._owned_sets.setdefault(new_owner, set()).add(territory.key)
+        if old_owner != new_owner and self.player_name in (old_owner, new_owner):
+            delta = 1 if new_owner == self.player_name else -1
+            counts = self._owned_neighbor_counts
+            for adj_name, _ in self._adj_objs.get(territory.key, ()):
+                counts[adj_name] += delta
+        
+        continent_name = territory.continent
+        if continent_name not in self.game_board.continents:
+            return
+        if old_owner is not None:
+            self._control_counts[(old_owner, continent_name)] -= 1
+        if new_owner is not None:
+            key = (new_owner, continent_name)
+            self._control_counts[key] = self._control_counts.get(key, 0) + 1
+    
     def choose_target_continent(self, player_name: str):
         """Choose the best continent to focus on conquering"""
         continent_control = self.get_player_continent_control(player_name)
@@ -137,90 +252,165 @@ class AIStrategy:
     
     def get_continent_completion_territories(self, continent_name: str, player_name: str) -> List[str]:
         """Get list of territories needed to complete a continent"""
+        cache_key = (continent_name, player_name)
+        cached = self._completion_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         continent = self.game_board.continents.get(continent_name)
         if not continent:
             return []
             
         needed_territories = []
+        pid = self.game_board.get_player_id(player_name)
         for territory_name in continent.territories:
             territory = self.game_board.get_territory(territory_name)
-            if territory.owner != player_name:
+            if territory.owner_id != pid:
                 needed_territories.append(territory_name)
-                
+        
+        self._completion_cache[cache_key] = needed_territories
         return needed_territories
     
+    def get_continent_completion_set(self, continent_name: str, player_name: str) -> frozenset:
+        """Same as get_continent_completion_territories, as a set for membership tests"""
+        cache_key = (continent_name, player_name)
+        needed_set = self._completion_set_cache.get(cache_key)
+        if needed_set is None:
+            needed_set = frozenset(self.get_continent_completion_territories(continent_name, player_name))
+            self._completion_set_cache[cache_key] = needed_set
+        return needed_set
+    
+    def _reset_turn_caches(self):
+        """Drop evaluations that are only valid within one top-level decision"""
+        self._completion_cache.clear()
+        self._completion_set_cache.clear()
+    
+    def get_continent_completing_territories(self, player_name: str) -> Set[str]:
+        """Get territories that are the last one missing from a continent for this player"""
+        pid = self.game_board.get_player_id(player_name)
+        territories = self.game_board.territories
+        completing = set()
+        for continent in self.game_board.continents.values():
+            missing = None
+            missing_count = 0
+            for territory_name in continent.territories:
+                if territories[territory_name].owner_id != pid:
+                    missing = territory_name
+                    missing_count += 1
+                    if missing_count > 1:
+                        break
+            if missing_count == 1:
+                completing.add(missing)
+        return completing
+    
     def get_best_reinforcement_territories(self, player_name: str, owned_territories: List[str]) -> List[str]:
         """Get prioritized list of territories for reinforcement"""
+        self._reset_turn_caches()
         # Update strategic values based on current game state
-        self.calculate_strategic_values()
+        self.refresh_strategic_values()
         
         # Choose a target continent if we don't have one or need to reconsider
         self.target_continent = self.choose_target_continent(player_name)
-        
-        # Identify front-line territories (border with enemy territory)
-        front_line_territories = []
-        for terr_name in owned_territories:
-            if self.is_front_line_territory(terr_name, player_name):
-                front_line_territories.append(terr_name)
-                
-        # If we have no front line territories, return any owned territories
-        if not front_line_territories:
-            return list(owned_territories)
-        
-        # Calculate prioritized scores for each front-line territory
+        pid = self.game_board.get_player_id(player_name)
+        
+        # Bind hot lookups to locals for the scoring loop
+        territories = self.game_board.territories
+        continents = self.game_board.continents
+        territory_values = self.territory_values
+        target_continent = self.target_continent
+        t2c = self._territory_to_continent
+        adj_objs = self._adj_objs
+        
+        # Identify and score front-line territories (border with enemy territory) in one pass
+        has_front_line = False
         territory_scores = {}
-        for terr_name in front_line_territories:
-            territory = self.game_board.get_territory(terr_name)
+        for terr_name in owned_territories:
+            neighbours = adj_objs.get(terr_name, ())
+            for _, adj_terr in neighbours:
+                if adj_terr.owner_id != pid:
+                    break
+            else:
+                continue  # Interior territory
+            has_front_line = True
+            
+            territory = territories.get(terr_name)
             if not territory:
                 continue
                 
             # Base score is strategic value
-            score = self.territory_values.get(terr_name, 1.0)
+            score = territory_values.get(terr_name, 1.0)
             
             # Bonus for territories with few armies (need defense)
             army_factor = 2.0 / (territory.armies + 1)
             score *= army_factor
             
             # Bonus for territories in target continent
-            if self.target_continent and self.get_continent_for_territory(terr_name) == self.target_continent:
+            continent = t2c.get(terr_name)
+            if target_continent and continent == target_continent:
                 score *= 2.0
                 
             # Bonus for territories that could complete a continent
-            continent = self.get_continent_for_territory(terr_name)
             if continent:
-                continent_obj = self.game_board.continents.get(continent)
-                if continent_obj:
+                if continent in continents:
                     needed_territories = self.get_continent_completion_territories(continent, player_name)
                     # If we're close to completing this continent
                     if 1 <= len(needed_territories) <= 3:
                         # Check if this territory borders enemies in the continent
+                        needed_set = self.get_continent_completion_set(continent, player_name)
                         borders_target = any(
-                            adj_name in needed_territories and
-                            self.game_board.get_territory(adj_name).owner != player_name
-                            for adj_name in self.game_board.adjacencies.get(terr_name, [])
+                            adj_name in needed_set and adj_terr.owner_id != pid
+                            for adj_name, adj_terr in neighbours
                         )
                         if borders_target:
                             score *= 1.5
             
             # Bonus for territories that border vulnerable enemy territories
-            vulnerability_bonus = self.calculate_attack_opportunity_score(terr_name, player_name)
-            score *= (1.0 + vulnerability_bonus)
+            # (a territory with a single army has no attack opportunities)
+            if territory.armies > 1:
+                vulnerability_bonus = self.calculate_attack_opportunity_score(terr_name, player_name)
+                score *= (1.0 + vulnerability_bonus)
             
             territory_scores[terr_name] = score
         
+        # If we have no front line territories, return any owned territories
+        if not has_front_line:
+            return list(owned_territories)
+        
         # Sort territories by score
         sorted_territories = sorted(territory_scores.items(), key=lambda x: x[1], reverse=True)
         return [terr[0] for terr in sorted_territories]
     
     def is_front_line_territory(self, territory_name: str, player_name: str) -> bool:
         """Check if a territory borders enemy territory"""
-        adjacent_territories = self.game_board.adjacencies.get(territory_name, [])
-        for adj_name in adjacent_territories:
-            adj_terr = self.game_board.get_territory(adj_name)
-            if adj_terr and adj_terr.owner != player_name:
+        territory_id = self.game_board.territory_ids.get(territory_name)
+        if territory_id is None:
+            return False
+        pid = self.game_board.get_player_id(player_name)
+        owner_ids = self.game_board.owner_ids
+        for adj_id in self.game_board.adjacency_ids[territory_id]:
+            if owner_ids[adj_id] != pid:
                 return True
         return False
     
+    def get_enemy_border_counts(self, player_name: str) -> Dict[str, int]:
+        """Count enemy-held neighbours of every territory, cached until ownership changes"""
+        version = self.game_board.ownership_hash
+        cached = self._enemy_border_cache
+        if cached is not None and cached[0] == player_name and cached[1] == version:
+            return cached[2]
+        
+        pid = self.game_board.get_player_id(player_name)
+        owner_ids = self.game_board.owner_ids
+        counts = {}
+        for territory_name, neighbour_ids in zip(self._territory_names, self.game_board.adjacency_ids):
+            enemy_count = 0
+            for adj_id in neighbour_ids:
+                if owner_ids[adj_id] != pid:
+                    enemy_count += 1
+            counts[territory_name] = enemy_count
+        self._enemy_border_cache = (player_name, version, counts)
+        return counts
+    
     def calculate_attack_opportunity_score(self, from_territory: str, player_name: str) -> float:
         """Calculate an opportunity score for attacks from this territory"""
         territory_obj = self.game_board.get_territory(from_territory)
@@ -228,30 +418,33 @@ class AIStrategy:
             return 0.0
             
         opportunity_score = 0.0
-        adjacent_territories = self.game_board.adjacencies.get(from_territory, [])
-        
-        for adj_name in adjacent_territories:
-            adj_terr = self.game_board.get_territory(adj_name)
-            if not adj_terr or adj_terr.owner == player_name:
+        pid = territory_obj.owner_id
+        our_armies = territory_obj.armies
+        territory_values = self.territory_values
+        target_continent = self.target_continent
+        t2c = self._territory_to_continent
+        for adj_name, adj_terr in self._adj_objs.get(from_territory, ()):
+            if adj_terr.owner_id == pid:
                 continue
                 
             # Calculate advantage ratio
-            if adj_terr.armies > 0:  # Avoid division by zero
-                advantage = territory_obj.armies / adj_terr.armies
+            enemy_armies = adj_terr.armies
+            if enemy_armies > 0:  # Avoid division by zero
+                advantage = our_armies / enemy_armies
             else:
-                advantage = territory_obj.armies
+                advantage = our_armies
                 
             # Territory is vulnerable if we have significant advantage
             if advantage >= 1.5:
                 # Calculate value of capturing this territory
-                capture_value = self.territory_values.get(adj_name, 1.0)
+                capture_value = territory_values.get(adj_name, 1.0)
                 
                 # Extra value if it's in our target continent
-                if self.target_continent and self.get_continent_for_territory(adj_name) == self.target_continent:
+                continent = t2c.get(adj_name)
+                if target_continent and continent == target_continent:
                     capture_value *= 2.0
                     
                 # Extra value if it would complete a continent
-                continent = self.get_continent_for_territory(adj_name)
                 if continent:
                     needed_territories = self.get_continent_completion_territories(continent, player_name)
                     if len(needed_territories) == 1 and needed_territories[0] == adj_name:
@@ -259,53 +452,73 @@ class AIStrategy:
                 
                 # Factor in both advantage and capture value
                 opportunity_score += (advantage - 1.0) * capture_value
+                # Every term is positive, so once the cap is reached the rest cannot matter
+                if opportunity_score >= 3.0:
+                    return 3.0
         
         return min(3.0, opportunity_score)  # Cap at 3.0 to prevent extreme values
     
-    def get_attack_targets(self, player_name: str, owned_territories: List[str]) -> List[Tuple[str, str, int]]:
-        """Get prioritized list of attack targets as (from_territory, to_territory, attack_armies)"""
-        attack_opportunities = []
-        
-        for from_terr_name in owned_territories:
-            from_terr = self.game_board.get_territory(from_terr_name)
-            if not from_terr or from_terr.armies <= 1:
-                continue
-                
-            adjacent_territories = self.game_board.adjacencies.get(from_terr_name, [])
-            for to_terr_name in adjacent_territories:
-                to_terr = self.game_board.get_territory(to_terr_name)
-                if not to_terr or to_terr.owner == player_name:
+    def get_attack_targets(self, player_name: str, owned_territories: List[str],
+                           top_k: Optional[int] = None) -> List[Tuple[str, str, int]]:
+        """Get prioritized list of attack targets as (from_territory, to_territory, attack_armies), optionally only the best top_k"""
+        self._reset_turn_caches()
+        # Moves and their scores are kept in parallel lists so each move tuple is built only once
+        attack_moves = []
+        attack_scores = []
+        pid = self.game_board.get_player_id(player_name)
+        # Continent-completion targets are the same for every candidate, so find them once
+        self._completing_targets = (player_name, self.get_continent_completing_territories(player_name))
+        
+        territories = self.game_board.territories
+        adj_objs = self._adj_objs
+        calculate_attack_score = self.calculate_attack_score
+        append_move = attack_moves.append
+        append_score = attack_scores.append
+        
+        try:
+            for from_terr_name in owned_territories:
+                from_terr = territories.get(from_terr_name)
+                if not from_terr or from_terr.armies <= 1:
                     continue
-                    
-                # Calculate attack score
-                attack_score = self.calculate_attack_score(from_terr_name, to_terr_name, player_name)
                 
                 # Calculate optimal attack armies (between 1 and min(3, from_terr.armies - 1))
                 available_attack_armies = min(3, from_terr.armies - 1)
-                if available_attack_armies > 0:
-                    attack_opportunities.append((from_terr_name, to_terr_name, available_attack_armies, attack_score))
+                
+                for to_terr_name, to_terr in adj_objs.get(from_terr_name, ()):
+                    if to_terr.owner_id == pid:
+                        continue
+                    
+                    # Calculate attack score
+                    attack_score = calculate_attack_score(from_terr_name, to_terr_name, player_name)
+                    append_move((from_terr_name, to_terr_name, available_attack_armies))
+                    append_score(attack_score)
+        finally:
+            self._completing_targets = None
         
         # Sort by attack score
-        attack_opportunities.sort(key=lambda x: x[3], reverse=True)
-        return [(a[0], a[1], a[2]) for a in attack_opportunities]
+        indices = range(len(attack_moves))
+        if top_k is not None:
+            order = heapq.nlargest(top_k, indices, key=attack_scores.__getitem__)
+        else:
+            order = sorted(indices, key=attack_scores.__getitem__, reverse=True)
+        return [attack_moves[i] for i in order]
     
     def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
         """Calculate a score for an attack from one territory to another"""
         from_terr = self.game_board.get_territory(from_territory)
         to_terr = self.game_board.get_territory(to_territory)
         
-        if not from_terr or not to_terr or from_terr.owner != player_name or to_terr.owner == player_name:
+        pid = self.game_board.get_player_id(player_name)
+        if not from_terr or not to_terr or from_terr.owner_id != pid or to_terr.owner_id == pid:
             return 0.0
             
         # Base score from win probability calculation
-        if to_terr.armies > 0:  # Prevent division by zero
-            advantage_ratio = from_terr.armies / to_terr.armies
+        from_armies = from_terr.armies
+        to_armies = to_terr.armies
+        if 0 <= from_armies < WIN_PROB_TABLE_SIZE and 0 <= to_armies < WIN_PROB_TABLE_SIZE:
+            win_probability = WIN_PROB_TABLE[from_armies][to_armies]
         else:
-            advantage_ratio = from_terr.armies
-            
-        # Attack win probability - simplified formula based on empirical Risk odds
-        # This is a simplified curve where higher advantage = higher win probability
-        win_probability = min(0.9, max(0.1, 0.5 + (advantage_ratio - 1) * 0.2))
+            win_probability = attack_win_probability(from_armies, to_armies)
         
         # Strategic value of capturing this territory
         strategic_value = self.territory_values.get(to_territory, 1.0)
@@ -313,86 +526,146 @@ class AIStrategy:
         # Bonuses for strategic situations
         
         # Bonus if territory is in target continent
-        if self.target_continent and self.get_continent_for_territory(to_territory) == self.target_continent:
+        continent = self.get_continent_for_territory(to_territory)
+        if self.target_continent and continent == self.target_continent:
             strategic_value *= 2.0
         
         # Huge bonus if this would complete a continent
-        continent = self.get_continent_for_territory(to_territory)
-        if continent:
+        completing_targets = self._completing_targets
+        if completing_targets is not None and completing_targets[0] == player_name:
+            completes_continent = to_territory in completing_targets[1]
+        elif continent:
             needed_territories = self.get_continent_completion_territories(continent, player_name)
-            if len(needed_territories) == 1 and needed_territories[0] == to_territory:
-                strategic_value *= 3.0
+            completes_continent = len(needed_territories) == 1 and needed_territories[0] == to_territory
+        else:
+            completes_continent = False
+        if completes_continent:
+            strategic_value *= 3.0
         
         # Bonus if the territory is weakly defended
-        if to_terr.armies <= 2:
+        if to_armies <= 2:
             strategic_value *= 1.5
             
         # Final score combines win probability with strategic value
-        return win_probability * strategic_value
+        score = win_probability * strategic_value
+        
+        # Style-specific adjustments
+        score *= self.attack_mult
+        if self.overwhelm_ratio is not None and from_armies > to_armies * self.overwhelm_ratio:
+            score *= self.overwhelm_bonus
+        if completes_continent:
+            score *= self.completion_bonus
+        if self.break_threshold is not None and continent:
+            # Check whether an opponent controls most of this continent
+            for other_player in self._get_other_players(player_name):
+                other_control = self.get_continent_control_share(other_player, continent)
+                if other_control > self.break_threshold:
+                    score *= self.break_bonus
+                    break
+        
+        if not score:
+            return score  # Illegal or hopeless attack; subclass multipliers would leave it at zero
+        return self._adjust_attack_score(score, from_territory, to_territory, player_name)
+    
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
+        """Apply strategy-specific multipliers to a non-zero attack score"""
+        return score
+    
+    def _get_other_players(self, player_name: str) -> List[str]:
+        """Get list of other players still holding territory"""
+        return [other_player for other_player, count in self._territory_counts.items()
+                if count > 0 and other_player != player_name]
     
     def get_best_fortification_move(self, player_name: str, owned_territories: List[str]) -> Optional[Tuple[str, str, int]]:
         """Find the best fortification move as (from_territory, to_territory, armies_to_move)"""
+        self._reset_turn_caches()
         # Build a graph of connected owned territories
+        owned_set = frozenset(owned_territories)
         territory_graph = {}
         for terr_name in owned_territories:
             territory_graph[terr_name] = []
-            for adj_name in self.game_board.adjacencies.get(terr_name, []):
-                if adj_name in owned_territories:
+            for adj_name in self.game_board.adjacencies.get(terr_name, ()):
+                if adj_name in owned_set:
                     territory_graph[terr_name].append(adj_name)
         
-        # Classify territories: front-line vs. interior
+        # Classify territories as front-line vs. interior and measure their threat in one sweep
         front_line_territories = []
         interior_territories = []
+        threats = {}
+        pid = self.game_board.get_player_id(player_name)
+        territories = self.game_board.territories
         
         for terr_name in owned_territories:
-            if self.is_front_line_territory(terr_name, player_name):
+            is_front = False
+            enemy_armies = 0
+            for _, adj_terr in self._adj_objs.get(terr_name, ()):
+                if adj_terr.owner_id != pid:
+                    is_front = True
+                    enemy_armies += adj_terr.armies
+            if is_front:
                 front_line_territories.append(terr_name)
             else:
                 interior_territories.append(terr_name)
+            territory = territories.get(terr_name)
+            if territory and territory.owner_id == pid:
+                threats[terr_name] = self._threat_level(territory.armies, enemy_armies)
+            else:
+                threats[terr_name] = 0.0
         
+        self._threat_cache = (player_name, self.game_board.mutation_id, threats)
+        return self._choose_fortification_move(player_name, territory_graph,
+                                               front_line_territories, interior_territories, threats)
+    
+    def _choose_fortification_move(self, player_name: str, territory_graph: Dict[str, List[str]],
+                                   front_line_territories: List[str], interior_territories: List[str],
+                                   threats: Dict[str, float]) -> Optional[Tuple[str, str, int]]:
+        """Score interior-to-front moves, falling back to front-to-front moves"""
         # Best fortification moves come from interior to front-line
         best_fortifications = []
-        
-        # For each interior territory with excess armies, find accessible front-line territories
+        fortification_scores = []
+        
+        # Group interior territories into connected regions with a single flood fill.
+        # Paths never continue past a front-line territory, so every interior territory
+        # in a region can reach exactly the front lines bordering that region.
+        front_line_set = set(front_line_territories)
+        region_of = {}
+        region_front_lines = []
+        for seed_name in interior_territories:
+            if seed_name in region_of:
+                continue
+            region_id = len(region_front_lines)
+            region_of[seed_name] = region_id
+            bordering_front_lines = []
+            seen_front_lines = set()
+            queue = deque([seed_name])
+            while queue:
+                current = queue.popleft()
+                for neighbor in territory_graph.get(current, []):
+                    if neighbor in front_line_set:
+                        if neighbor not in seen_front_lines:
+                            seen_front_lines.add(neighbor)
+                            bordering_front_lines.append(neighbor)
+                    elif neighbor not in region_of:
+                        region_of[neighbor] = region_id
+                        queue.append(neighbor)
+            region_front_lines.append(bordering_front_lines)
+        
+        # For each interior territory with excess armies, score the front lines its region reaches
         for from_terr_name in interior_territories:
             from_terr = self.game_board.get_territory(from_terr_name)
             if not from_terr or from_terr.armies <= 1:
                 continue
                 
-            # Find all accessible front-line territories using BFS
-            accessible_front_lines = []
-            visited = {from_terr_name}
-            queue = [(from_terr_name, [])]  # (territory, path)
-            
-            while queue:
-                current, path = queue.pop(0)
-                
-                if current != from_terr_name and current in front_line_territories:
-                    accessible_front_lines.append((current, path + [current]))
-                    continue  # No need to explore beyond a front-line territory
-                
-                for neighbor in territory_graph.get(current, []):
-                    if neighbor not in visited:
-                        visited.add(neighbor)
-                        queue.append((neighbor, path + [neighbor]))
+            # Calculate armies to move (leave at least 1 behind)
+            armies_to_move = max(1, from_terr.armies - 1)
             
-            # For each accessible front-line, calculate fortification score
-            for to_terr_name, path in accessible_front_lines:
-                if len(path) < 1:  # Need at least one step
-                    continue
-                    
-                to_terr = self.game_board.get_territory(to_terr_name)
-                if not to_terr:
-                    continue
-                    
+            for to_terr_name in region_front_lines[region_of[from_terr_name]]:
                 # Calculate fortification score
                 score = self.calculate_fortification_score(from_terr_name, to_terr_name, player_name)
                 
-                # Calculate armies to move (leave at least 1 behind)
-                armies_to_move = max(1, from_terr.armies - 1)
-                
                 # Add to potential fortifications
-                best_fortifications.append((from_terr_name, to_terr_name, armies_to_move, score))
+                best_fortifications.append((from_terr_name, to_terr_name, armies_to_move))
+                fortification_scores.append(score)
         
         # If interior-to-front moves aren't available, look for front-to-front moves
         if not best_fortifications:
@@ -402,13 +675,13 @@ class AIStrategy:
                     continue
                     
                 # Only consider front-line territories with low threat
-                from_threat = self.calculate_territory_threat(from_terr_name, player_name)
+                from_threat = threats[from_terr_name]
                 if from_threat > 0.5:  # Skip high-threat territories as sources
                     continue
                     
                 # Find directly adjacent front-line territories
                 for to_terr_name in territory_graph.get(from_terr_name, []):
-                    if to_terr_name in front_line_territories:
+                    if to_terr_name in front_line_set:
                         to_terr = self.game_board.get_territory(to_terr_name)
                         if not to_terr:
                             continue
@@ -417,22 +690,23 @@ class AIStrategy:
                         score = self.calculate_fortification_score(from_terr_name, to_terr_name, player_name)
                         
                         # Only move armies if destination threat is higher
-                        to_threat = self.calculate_territory_threat(to_terr_name, player_name)
+                        to_threat = threats[to_terr_name]
                         if to_threat > from_threat:
                             # Calculate armies to move (leave at least 1 behind)
                             armies_to_move = max(1, from_terr.armies - 1)
-                            best_fortifications.append((from_terr_name, to_terr_name, armies_to_move, score))
+                            best_fortifications.append((from_terr_name, to_terr_name, armies_to_move))
+                            fortification_scores.append(score)
         
-        # Sort by score and return best move
-        best_fortifications.sort(key=lambda x: x[3], reverse=True)
+        # Return the highest-scoring move (the first one on ties)
         if best_fortifications:
-            return best_fortifications[0][:3]  # Return (from, to, armies)
+            best_index = max(range(len(best_fortifications)), key=fortification_scores.__getitem__)
+            return best_fortifications[best_index]  # Return (from, to, armies)
         return None
     
     def calculate_fortification_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
         """Calculate a score for fortifying from one territory to another"""
         to_terr = self.game_board.get_territory(to_territory)
-        if not to_terr or to_terr.owner != player_name:
+        if not to_terr or to_terr.owner_id != self.game_board.get_player_id(player_name):
             return 0.0
             
         # Base score: strategic value of the destination
@@ -449,74 +723,85 @@ class AIStrategy:
         # Bonus if the territory contributes to continent control
         continent = self.get_continent_for_territory(to_territory)
         if continent:
-            continent_control = self.get_player_continent_control(player_name).get(continent, 0)
+            continent_control = self.get_continent_control_share(player_name, continent)
             if continent_control > 0.5:  # If we control more than half the continent
                 score *= 1.5
         
         return score
     
     def calculate_territory_threat(self, territory_name: str, player_name: str) -> float:
-        """Calculate the threat level to a territory (0.0-1.0)"""
+        """Calculate the threat level to a territory (0.0-1.0), cached until the board changes"""
+        version = self.game_board.mutation_id
+        cached = self._threat_cache
+        if cached is not None and cached[0] == player_name and cached[1] == version:
+            threats = cached[2]
+            threat = threats.get(territory_name)
+            if threat is not None:
+                return threat
+        else:
+            threats = {}
+            self._threat_cache = (player_name, version, threats)
+        
         territory = self.game_board.get_territory(territory_name)
         if not territory or territory.owner != player_name:
-            return 0.0
-            
-        # Count enemy armies in adjacent territories
-        adjacent_territories = self.game_board.adjacencies.get(territory_name, [])
-        enemy_armies = 0
-        for adj_name in adjacent_territories:
-            adj_terr = self.game_board.get_territory(adj_name)
-            if adj_terr and adj_terr.owner != player_name:
-                enemy_armies += adj_terr.armies
-        
+            threat = 0.0
+        else:
+            # Count enemy armies in adjacent territories
+            enemy_armies = 0
+            pid = territory.owner_id
+            for _, adj_terr in self._adj_objs.get(territory_name, ()):
+                if adj_terr.owner_id != pid:
+                    enemy_armies += adj_terr.armies
+            threat = self._threat_level(territory.armies, enemy_armies)
+        
+        threats[territory_name] = threat
+        return threat
+    
+    @staticmethod
+    def _threat_level(own_armies: int, enemy_armies: int) -> float:
+        """Normalize the ratio of adjacent enemy armies to our armies into 0.0-1.0"""
         # Calculate threat ratio (enemy armies vs our armies)
-        if territory.armies > 0:  # Prevent division by zero
-            threat_ratio = enemy_armies / territory.armies
+        if own_armies > 0:  # Prevent division by zero
+            threat_ratio = enemy_armies / own_armies
         else:
             threat_ratio = enemy_armies
             
         # Normalize to 0.0-1.0 range
-        normalized_threat = min(1.0, threat_ratio / 3.0)
-        return normalized_threat
+        return min(1.0, threat_ratio / 3.0)
 
 
 class AggressiveStrategy(AIStrategy):
     """Aggressive AI strategy that prioritizes expansion and attack"""
     
+    # Aggressive AI values attacks more highly
+    attack_mult = 1.3
+    # Aggressive AI particularly favors attacks from strong positions
+    overwhelm_ratio = 2
+    overwhelm_bonus = 1.5  # Strongly favor overwhelming attacks
+    
     def calculate_strategic_values(self):
         super().calculate_strategic_values()
         # Increase value of territories with many connections (attack opportunities)
-        for territory_name in self.territory_values:
-            adj_count = len(self.game_board.adjacencies.get(territory_name, []))
-            self.territory_values[territory_name] *= (1.0 + (adj_count - 3) * 0.15)
-    
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
-        # Start with base score from parent class
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
-        
-        # Aggressive AI values attacks more highly
-        score *= 1.3
-        
-        # Aggressive AI particularly favors attacks from strong positions
-        from_terr = self.game_board.get_territory(from_territory)
-        to_terr = self.game_board.get_territory(to_territory)
-        
-        if from_terr and to_terr:
-            if from_terr.armies > to_terr.armies * 2:
-                score *= 1.5  # Strongly favor overwhelming attacks
-        
-        return score
+        territory_values = self.territory_values
+        for territory_name, factor in self._static_value_factors(
+                "aggressive", lambda adj_count, is_gateway: 1.0 + (adj_count - 3) * 0.15):
+            territory_values[territory_name] *= factor
 
 
 class DefensiveStrategy(AIStrategy):
     """Defensive AI strategy that prioritizes holding continents and fortifying borders"""
     
+    # Defensive AI values attacks less highly, except for completing continents
+    attack_mult = 0.7
+    completion_bonus = 3.0  # Defensive AI really wants to complete continents
+    
     def calculate_strategic_values(self):
         super().calculate_strategic_values()
         # Increase value of territories that are gateways (need to be defended)
-        for territory_name in self.territory_values:
-            if self.is_continent_gateway(territory_name):
-                self.territory_values[territory_name] *= 1.5
+        territory_values = self.territory_values
+        for territory_name, factor in self._static_value_factors(
+                "defensive", lambda adj_count, is_gateway: 1.5 if is_gateway else 1.0):
+            territory_values[territory_name] *= factor
     
     def get_best_reinforcement_territories(self, player_name: str, owned_territories: List[str]) -> List[str]:
         territories = super().get_best_reinforcement_territories(player_name, owned_territories)
@@ -538,69 +823,32 @@ class DefensiveStrategy(AIStrategy):
         territories.sort(key=lambda t: defensive_priority(t), reverse=True)
         
         return territories
-    
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
-        # Start with base score from parent class
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
-        
-        # Defensive AI values attacks less highly, except for completing continents
-        score *= 0.7
-        
-        # Check if this attack would complete a continent
-        continent = self.get_continent_for_territory(to_territory)
-        if continent:
-            needed_territories = self.get_continent_completion_territories(continent, player_name)
-            if len(needed_territories) == 1 and needed_territories[0] == to_territory:
-                score *= 3.0  # Defensive AI really wants to complete continents
-        
-        return score
 
 
 class BalancedStrategy(AIStrategy):
     """Balanced AI strategy with a mix of aggressive and defensive traits"""
     
+    # Balanced AI particularly values breaking up opponent continents
+    break_threshold = 0.6  # If opponent controls most of the continent
+    break_bonus = 1.5  # Prioritize breaking it up
+    
     def __init__(self, player_name: str, game_board):
         super().__init__(player_name, game_board)
         # Randomly lean slightly more aggressive or defensive each game
         self.aggression_factor = random.uniform(0.9, 1.1)
-    
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
-        # Start with base score from parent class
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
-        
-        # Apply the aggression factor
-        score *= self.aggression_factor
-        
-        # Balanced AI particularly values breaking up opponent continents
-        to_continent = self.get_continent_for_territory(to_territory)
-        if to_continent:
-            # Check who controls this continent
-            for other_player in self._get_other_players(player_name):
-                other_control = self.get_player_continent_control(other_player).get(to_continent, 0)
-                if other_control > 0.6:  # If opponent controls most of the continent
-                    score *= 1.5  # Prioritize breaking it up
-                    break
-        
-        return score
-    
-    def _get_other_players(self, player_name: str) -> List[str]:
-        """Get list of other players in the game"""
-        # Note: This is a simplified version, the actual implementation
-        # would need to access the full list of players from the game state
-        other_players = []
-        for territory in self.game_board.territories.values():
-            if territory.owner and territory.owner != player_name and territory.owner not in other_players:
-                other_players.append(territory.owner)
-        return other_players
+        self.attack_mult = self.aggression_factor
 
 
 class OpportunisticStrategy(AIStrategy):
     """Opportunistic AI that targets the weakest opponents and best opportunities"""
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
-        # Start with base score from parent class
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
-        
+    def __init__(self, player_name: str, game_board):
+        super().__init__(player_name, game_board)
+        # Player strengths indexed by player ID, valid while the board's mutation counter is unchanged
+        self._strength_cache: List[int] = []
+        self._strength_cache_version = -1
+    
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Get territory owner
         to_terr = self.game_board.get_territory(to_territory)
         if not to_terr or not to_terr.owner:
@@ -625,23 +873,29 @@ class OpportunisticStrategy(AIStrategy):
     
     def _get_player_strength(self, player_name: str) -> float:
         """Calculate a player's overall strength"""
-        territory_count = 0
-        army_count = 0
-        
-        for territory in self.game_board.territories.values():
-            if territory.owner == player_name:
-                territory_count += 1
-                army_count += territory.armies
-        
-        return territory_count * 2 + army_count
+        if self._strength_cache_version != self.game_board.mutation_id:
+            # Recompute every player's strength in a single pass over the board arrays
+            strengths = [0] * len(self.game_board.player_ids)
+            for owner_id, armies in zip(self.game_board.owner_ids, self.game_board.army_counts):
+                if owner_id >= 0:
+                    # Each territory counts 2 plus its armies
+                    strengths[owner_id] += 2 + armies
+            self._strength_cache = strengths
+            self._strength_cache_version = self.game_board.mutation_id
+        
+        player_id = self.game_board.player_ids.get(player_name)
+        if player_id is None or player_id >= len(self._strength_cache):
+            return 0
+        return self._strength_cache[player_id]
 
 
 class NapoleonStrategy(AggressiveStrategy):
     """Napoleon Bonaparte: Master of aggressive tactics with focus on artillery and rapid maneuvers"""
     
-    def __init__(self, player_name: str, game_board):
+    def __init__(self, player_name: str, game_board, verbose: bool = False):
         super().__init__(player_name, game_board)
-        print(f"{player_name} employs the aggressive tactics of Napoleon Bonaparte!")
+        if verbose:
+            print(f"{player_name} employs the aggressive tactics of Napoleon Bonaparte!")
         # Napoleon favored concentration of force and rapid attacks
         self.aggression_bonus = 1.4
         
@@ -649,14 +903,13 @@ class NapoleonStrategy(AggressiveStrategy):
         super().calculate_strategic_values()
         # Napoleon valued central territories (for rapid movement in any direction)
         # Increase value for territories with many connections
-        for territory_name in self.territory_values:
-            adj_count = len(self.game_board.adjacencies.get(territory_name, []))
-            if adj_count > 4:  # Heavily value well-connected territories
-                self.territory_values[territory_name] *= 1.5
+        territory_values = self.territory_values
+        for territory_name, factor in self._static_value_factors(
+                "napoleon", lambda adj_count, is_gateway: 1.5 if adj_count > 4 else 1.0):  # Heavily value well-connected territories
+            territory_values[territory_name] *= factor
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Napoleon was known for overwhelming force
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
         score *= self.aggression_bonus
         
         # Napoleon focused on breaking enemy strong points
@@ -671,14 +924,11 @@ class NapoleonStrategy(AggressiveStrategy):
         territories = super().get_best_reinforcement_territories(player_name, owned_territories)
         
         # Find territories with the most adjacent enemy territories
+        enemy_counts = self.get_enemy_border_counts(player_name)
+        
         def count_adjacent_enemies(terr_name):
-            adjacent_territories = self.game_board.adjacencies.get(terr_name, [])
-            enemy_count = 0
-            for adj_name in adjacent_territories:
-                adj_terr = self.game_board.get_territory(adj_name)
-                if adj_terr and adj_terr.owner != player_name:
-                    enemy_count += 1
-            return enemy_count
+            # Owned names that aren't board keys (conquests record display names) count as no enemies
+            return enemy_counts.get(terr_name, 0)
         
         # Prioritize territories with many adjacent enemies
         territories.sort(key=count_adjacent_enemies, reverse=True)
@@ -688,20 +938,22 @@ class NapoleonStrategy(AggressiveStrategy):
 class GenghisKhanStrategy(OpportunisticStrategy):
     """Genghis Khan: Master of rapid conquest and overwhelming force"""
     
-    def __init__(self, player_name: str, game_board):
+    def __init__(self, player_name: str, game_board, verbose: bool = False):
         super().__init__(player_name, game_board)
-        print(f"{player_name} employs the swift conquest tactics of Genghis Khan!")
+        if verbose:
+            print(f"{player_name} employs the swift conquest tactics of Genghis Khan!")
         
     def calculate_strategic_values(self):
         super().calculate_strategic_values()
         # Genghis valued mobility - territories with many connections
-        for territory_name in self.territory_values:
-            adj_count = len(self.game_board.adjacencies.get(territory_name, []))
-            self.territory_values[territory_name] *= (1.0 + (adj_count / 10.0))
+        territory_values = self.territory_values
+        for territory_name, factor in self._static_value_factors(
+                "genghis_khan", lambda adj_count, is_gateway: 1.0 + (adj_count / 10.0)):
+            territory_values[territory_name] *= factor
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Genghis Khan was known for rapid expansion
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
+        score = super()._adjust_attack_score(score, from_territory, to_territory, player_name)
         
         # Strong preference for attacking weaker territories
         from_terr = self.game_board.get_territory(from_territory)
@@ -723,19 +975,21 @@ class GenghisKhanStrategy(OpportunisticStrategy):
             return None
             
         source_name, dest_name, armies_to_move = best_move
-        dest_terr = self.game_board.get_territory(dest_name)
+        territories = self.game_board.territories
+        adjacency_counts = self.game_board.adjacency_counts
+        dest_terr = territories.get(dest_name)
         
         if dest_terr:
             # Check if this territory has many connections
-            adj_count = len(self.game_board.adjacencies.get(dest_name, []))
+            adj_count = adjacency_counts.get(dest_name, 0)
             if adj_count < 3:  # Not many connections, seek a better territory
                 # Find a better-connected territory if possible
                 for terr_name in owned_territories:
                     if self.is_front_line_territory(terr_name, player_name):
-                        new_adj_count = len(self.game_board.adjacencies.get(terr_name, []))
+                        new_adj_count = adjacency_counts.get(terr_name, 0)
                         if new_adj_count > adj_count:
                             # Found a better-connected territory
-                            new_terr = self.game_board.get_territory(terr_name)
+                            new_terr = territories.get(terr_name)
                             if new_terr and source_name != terr_name:
                                 return (source_name, terr_name, armies_to_move)
         
@@ -745,9 +999,10 @@ class GenghisKhanStrategy(OpportunisticStrategy):
 class AlexanderStrategy(AggressiveStrategy):
     """Alexander the Great: Bold conqueror focused on rapid expansion"""
     
-    def __init__(self, player_name: str, game_board):
+    def __init__(self, player_name: str, game_board, verbose: bool = False):
         super().__init__(player_name, game_board)
-        print(f"{player_name} channels the bold conquests of Alexander the Great!")
+        if verbose:
+            print(f"{player_name} channels the bold conquests of Alexander the Great!")
         # Alexander was known for personal leadership in battle
         self.bold_attack_threshold = 0.4  # Lower threshold for attacks
         
@@ -755,22 +1010,20 @@ class AlexanderStrategy(AggressiveStrategy):
         super().calculate_strategic_values()
         # Alexander valued capturing key territories and capitals
         # For simplicity, we'll treat higher-value territories as "capitals"
-        top_territories = sorted(self.territory_values.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_territories = heapq.nlargest(5, self.territory_values.items(), key=operator.itemgetter(1))
         for terr_name, _ in top_territories:
             self.territory_values[terr_name] *= 1.8  # Major bonus for "capitals"
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Alexander was known for bold, decisive attacks
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
         
         # Alexander would continue his momentum after a victory
-        ongoing_conquest = False
-        for adj_name in self.game_board.adjacencies.get(to_territory, []):
-            adj_terr = self.game_board.get_territory(adj_name)
-            if adj_terr and adj_terr.owner == player_name:
-                # There's already an adjacent territory we own - part of ongoing conquest
-                ongoing_conquest = True
-                break
+        if player_name == self.player_name:
+            # There's already an adjacent territory we own - part of ongoing conquest
+            ongoing_conquest = self._owned_neighbor_counts.get(to_territory, 0) > 0
+        else:
+            pid = self.game_board.get_player_id(player_name)
+            ongoing_conquest = any(adj_terr.owner_id == pid for _, adj_terr in self._adj_objs.get(to_territory, ()))
         
         if ongoing_conquest:
             score *= 1.4  # Bonus for continuing conquest in same region
@@ -781,7 +1034,8 @@ class AlexanderStrategy(AggressiveStrategy):
         territories = super().get_best_reinforcement_territories(player_name, owned_territories)
         
         # Alexander focused forces at his front lines rather than defending
-        front_line_territories = [t for t in territories if self.is_front_line_territory(t, player_name)]
+        enemy_counts = self.get_enemy_border_counts(player_name)
+        front_line_territories = [t for t in territories if enemy_counts.get(t, 0) > 0]
         if front_line_territories:
             return front_line_territories
         return territories
@@ -790,26 +1044,24 @@ class AlexanderStrategy(AggressiveStrategy):
 class SunTzuStrategy(BalancedStrategy):
     """Sun Tzu: Master of deception, positioning and strategic warfare"""
     
-    def __init__(self, player_name: str, game_board):
+    def __init__(self, player_name: str, game_board, verbose: bool = False):
         super().__init__(player_name, game_board)
-        print(f"{player_name} employs the ancient wisdom of Sun Tzu!")
+        if verbose:
+            print(f"{player_name} employs the ancient wisdom of Sun Tzu!")
         # Sun Tzu valued knowledge of the battlefield
         self.analyzed_territories = {}
         
     def calculate_strategic_values(self):
         super().calculate_strategic_values()
-        # Sun Tzu valued controlling key terrain
-        for territory_name in self.territory_values:
-            # Value territories that control access to others
-            adj_count = len(self.game_board.adjacencies.get(territory_name, []))
-            gateway_bonus = 1.0
-            if self.is_continent_gateway(territory_name):
-                gateway_bonus = 1.6  # Significant bonus for controlling gateways
-            self.territory_values[territory_name] *= gateway_bonus * (1 + (adj_count - 3) * 0.1)
+        # Sun Tzu valued controlling key terrain: territories that control access to others,
+        # with a significant bonus for controlling gateways
+        territory_values = self.territory_values
+        for territory_name, factor in self._static_value_factors(
+                "sun_tzu", lambda adj_count, is_gateway: (1.6 if is_gateway else 1.0) * (1 + (adj_count - 3) * 0.1)):
+            territory_values[territory_name] *= factor
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Sun Tzu focused on attacking when victory was certain
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
         
         from_terr = self.game_board.get_territory(from_territory)
         to_terr = self.game_board.get_territory(to_territory)
@@ -853,33 +1105,30 @@ class SunTzuStrategy(BalancedStrategy):
 class HannibalStrategy(OpportunisticStrategy):
     """Hannibal Barca: Master tactician known for surprise and unconventional strategies"""
     
-    def __init__(self, player_name: str, game_board):
+    def __init__(self, player_name: str, game_board, verbose: bool = False):
         super().__init__(player_name, game_board)
-        print(f"{player_name} adopts the cunning tactics of Hannibal Barca!")
+        if verbose:
+            print(f"{player_name} adopts the cunning tactics of Hannibal Barca!")
         # Hannibal was known for surprise attacks through unexpected routes
         
     def calculate_strategic_values(self):
         super().calculate_strategic_values()
         # Hannibal valued surprise and unexpected approaches
         # Value territories that allow surprise movements
-        for territory_name in self.territory_values:
-            if self.is_continent_gateway(territory_name):
-                self.territory_values[territory_name] *= 1.3  # Bonus for territories that allow unexpected movements
+        territory_values = self.territory_values
+        for territory_name, factor in self._static_value_factors(
+                "hannibal", lambda adj_count, is_gateway: 1.3 if is_gateway else 1.0):  # Bonus for territories that allow unexpected movements
+            territory_values[territory_name] *= factor
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Hannibal was known for unexpected attacks
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
+        score = super()._adjust_attack_score(score, from_territory, to_territory, player_name)
         
         # Hannibal favored attacking where enemies least expected
         # For simplicity, this means attacking from territories that border multiple enemy territories
         from_terr_obj = self.game_board.get_territory(from_territory)
         if from_terr_obj:
-            enemy_borders = 0
-            adjacent_territories = self.game_board.adjacencies.get(from_territory, [])
-            for adj_name in adjacent_territories:
-                adj_terr = self.game_board.get_territory(adj_name)
-                if adj_terr and adj_terr.owner != player_name:
-                    enemy_borders += 1
+            enemy_borders = self.get_enemy_border_counts(player_name).get(from_territory, 0)
             
             if enemy_borders >= 2:  # Territory borders multiple enemies - good for surprise attacks
                 score *= 1.3
@@ -891,14 +1140,11 @@ class HannibalStrategy(OpportunisticStrategy):
         
         # Hannibal often used terrain to his advantage
         # Prioritize territories that border multiple enemy territories
+        enemy_counts = self.get_enemy_border_counts(player_name)
+        
         def multi_border_value(terr_name):
-            enemy_borders = 0
-            adjacent_territories = self.game_board.adjacencies.get(terr_name, [])
-            for adj_name in adjacent_territories:
-                adj_terr = self.game_board.get_territory(adj_name)
-                if adj_terr and adj_terr.owner != player_name:
-                    enemy_borders += 1
-            return enemy_borders
+            # Owned names that aren't board keys (conquests record display names) count as no enemies
+            return enemy_counts.get(terr_name, 0)
         
         # Prioritize territories that can attack multiple enemies
         return sorted(territories, key=multi_border_value, reverse=True)
@@ -907,53 +1153,43 @@ class HannibalStrategy(OpportunisticStrategy):
 class ElizabethStrategy(DefensiveStrategy):
     """Queen Elizabeth I: Master of defensive strategy and resource management"""
     
-    def __init__(self, player_name: str, game_board):
+    def __init__(self, player_name: str, game_board, verbose: bool = False):
         super().__init__(player_name, game_board)
-        print(f"{player_name} employs the shrewd defensive strategy of Queen Elizabeth I!")
+        if verbose:
+            print(f"{player_name} employs the shrewd defensive strategy of Queen Elizabeth I!")
         # Elizabeth was known for defensive positioning and diplomacy
         
     def calculate_strategic_values(self):
         super().calculate_strategic_values()
         # Elizabeth valued consolidating territory
         # Increase value of territories surrounded by friendly territories
-        for territory_name in self.territory_values:
-            secure_factor = self._calculate_security_factor(territory_name, self.player_name)
-            self.territory_values[territory_name] *= (1.0 + secure_factor * 0.5)
-    
-    def _calculate_security_factor(self, territory_name: str, player_name: str) -> float:
-        """Calculate how secure a territory is (surrounded by friendlies)"""
-        adjacent_territories = self.game_board.adjacencies.get(territory_name, [])
-        if not adjacent_territories:
-            return 0.0
-            
-        friendly_count = 0
-        for adj_name in adjacent_territories:
-            adj_terr = self.game_board.get_territory(adj_name)
-            if adj_terr and adj_terr.owner == player_name:
-                friendly_count += 1
-                
-        return friendly_count / len(adjacent_territories)  # 0.0-1.0 security factor
+        territory_values = self.territory_values
+        owned_neighbor_counts = self._owned_neighbor_counts
+        adjacency_counts = self.game_board.adjacency_counts
+        for territory_name in territory_values:
+            adj_count = adjacency_counts.get(territory_name, 0)
+            if adj_count:
+                secure_factor = owned_neighbor_counts[territory_name] / adj_count
+                territory_values[territory_name] *= (1.0 + secure_factor * 0.5)
     
-    def calculate_attack_score(self, from_territory: str, to_territory: str, player_name: str) -> float:
+    def _adjust_attack_score(self, score: float, from_territory: str, to_territory: str, player_name: str) -> float:
         # Elizabeth was cautious about attacks, preferring consolidation
-        score = super().calculate_attack_score(from_territory, to_territory, player_name)
-        
-        # Elizabeth was more likely to attack if it consolidated territory
-        consolidation_factor = 0.0
-        adjacent_territories = self.game_board.adjacencies.get(to_territory, [])
-        for adj_name in adjacent_territories:
-            if adj_name == from_territory:
-                continue  # Skip the attacking territory
-                
-            adj_terr = self.game_board.get_territory(adj_name)
-            if adj_terr and adj_terr.owner == player_name:
-                consolidation_factor += 0.2  # Each adjacent owned territory increases attack value
+        
+        # Elizabeth was more likely to attack if it consolidated territory:
+        # each adjacent owned territory (other than the attacking one) increases attack value
+        territories = self.game_board.territories
+        owned_set = self._owned_sets.get(player_name, frozenset())
+        adjacent_territories = self.game_board.adjacencies.get(to_territory, ())
+        friendly_count = len(owned_set.intersection(adjacent_territories))
+        if from_territory in owned_set and from_territory in adjacent_territories:
+            friendly_count -= 1  # Skip the attacking territory
+        consolidation_factor = 0.2 * friendly_count
         
         score *= (1.0 + consolidation_factor)
         
         # Elizabeth was very cautious about overextending
-        from_terr = self.game_board.get_territory(from_territory)
-        to_terr = self.game_board.get_territory(to_territory)
+        from_terr = territories.get(from_territory)
+        to_terr = territories.get(to_territory)
         
         if from_terr and to_terr and to_terr.armies > 0:
             if from_terr.armies < to_terr.armies * 1.3:  # Reduce score for attacks without clear advantage
@@ -968,8 +1204,9 @@ class ElizabethStrategy(DefensiveStrategy):
         if best_move:
             # If the destination isn't a border territory, look for one
             _, dest_name, _ = best_move
-            if not self.is_front_line_territory(dest_name, player_name):
-                front_line_territories = [t for t in owned_territories if self.is_front_line_territory(t, player_name)]
+            enemy_counts = self.get_enemy_border_counts(player_name)
+            if not enemy_counts.get(dest_name, 0):
+                front_line_territories = [t for t in owned_territories if enemy_counts.get(t, 0) > 0]
                 if front_line_territories:
                     # Find the most threatened border territory
                     most_threatened = max(front_line_territories, 
@@ -982,46 +1219,44 @@ class ElizabethStrategy(DefensiveStrategy):
 
 
 # Factory function to create AI strategy based on player name or preferences
-def create_ai_strategy(player_name: str, game_board, strategy_type=None):
+# Historical leader-based strategies, matched by substring in this order
+_HISTORICAL_STRATEGIES = {
+    "Napoleon": NapoleonStrategy,
+    "Genghis Khan": GenghisKhanStrategy,
+    "Alexander": AlexanderStrategy,
+    "Sun Tzu": SunTzuStrategy,
+    "Hannibal": HannibalStrategy,
+    "Elizabeth": ElizabethStrategy,
+}
+
+# Original strategies assigned by player name when no type is given
+_NAMED_STRATEGIES = {
+    "Alpha": AggressiveStrategy,
+    "Beta": DefensiveStrategy,
+    "Gamma": BalancedStrategy,
+    "Delta": OpportunisticStrategy,
+}
+
+# Strategies selected by explicit strategy type
+_TYPE_STRATEGIES = {
+    "aggressive": AggressiveStrategy,
+    "defensive": DefensiveStrategy,
+    "balanced": BalancedStrategy,
+    "opportunistic": OpportunisticStrategy,
+}
+
+def create_ai_strategy(player_name: str, game_board, strategy_type=None, verbose: bool = False):
     """Create an AI strategy object based on player name or specified type"""
+    for key, strategy_class in _HISTORICAL_STRATEGIES.items():
+        if key in player_name:
+            # Historical leaders announce themselves only when verbose
+            return strategy_class(player_name, game_board, verbose=verbose)
     
-    # Historical leader-based strategies
-    if "Napoleon" in player_name:
-        return NapoleonStrategy(player_name, game_board)
-    elif "Genghis Khan" in player_name:
-        return GenghisKhanStrategy(player_name, game_board)
-    elif "Alexander" in player_name:
-        return AlexanderStrategy(player_name, game_board)
-    elif "Sun Tzu" in player_name:
-        return SunTzuStrategy(player_name, game_board)
-    elif "Hannibal" in player_name:
-        return HannibalStrategy(player_name, game_board)
-    elif "Elizabeth" in player_name:
-        return ElizabethStrategy(player_name, game_board)
+    if strategy_type is not None:
+        return _TYPE_STRATEGIES.get(strategy_type, AIStrategy)(player_name, game_board)
     
-    # Original strategies as fallback
-    elif strategy_type is None:
-        # Assign strategy based on player name
-        if "Alpha" in player_name:
-            return AggressiveStrategy(player_name, game_board)
-        elif "Beta" in player_name:
-            return DefensiveStrategy(player_name, game_board)
-        elif "Gamma" in player_name:
-            return BalancedStrategy(player_name, game_board)
-        elif "Delta" in player_name:
-            return OpportunisticStrategy(player_name, game_board)
-        else:
-            # Default to balanced
-            return BalancedStrategy(player_name, game_board)
-    else:
-        # Create strategy based on specified type
-        if strategy_type == "aggressive":
-            return AggressiveStrategy(player_name, game_board)
-        elif strategy_type == "defensive":
-            return DefensiveStrategy(player_name, game_board)
-        elif strategy_type == "balanced":
-            return BalancedStrategy(player_name, game_board)
-        elif strategy_type == "opportunistic":
-            return OpportunisticStrategy(player_name, game_board)
-        else:
-            return AIStrategy(player_name, game_board)
\ No newline at end of file
+    for key, strategy_class in _NAMED_STRATEGIES.items():
+        if key in player_name:
+            return strategy_class(player_name, game_board)
+    # Default to balanced
+    return BalancedStrategy(player_name, game_board)
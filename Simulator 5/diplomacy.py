@@ -86,16 +86,69 @@ class DiplomacyManager:
         self.treaties: List[Treaty] = []
         self.current_turn = 0
         self.treaty_proposals: Dict[Tuple[str, str], List[Treaty]] = {}  # (from_player, to_player) -> list of proposals
-        self.trust_levels: Dict[Tuple[str, str], float] = {}  # (player1, player2) -> trust level (0.0-1.0)
+        self._proposal_sets: Dict[Tuple[str, str], Set[Treaty]] = {}  # Same proposals, for membership tests
+        self.trust_levels: Dict[frozenset, float] = {}  # {player1, player2} -> trust level (0.0-1.0)
+        # Indexes over active treaties only; self.treaties keeps the full history
+        self._active_treaties: List[Treaty] = []  # In acceptance order; broken treaties are pruned by update_turn
+        self._active_treaty_set: Set[Treaty] = set()
+        self._active_alliances: Dict[frozenset, List[Alliance]] = {}  # {player1, player2} -> alliances
+        self._active_territory_treaties: Dict[frozenset, List[TerritoryTreaty]] = {}  # {player1, player2} -> treaties
+        # player -> treaties in acceptance order; a dict used as an ordered set, for O(1) removal
+        self._active_by_player: Dict[str, Dict[Treaty, None]] = {}
+        self.mutation_id = 0  # Bumped whenever a treaty becomes or stops being active, for cache invalidation
+    
+    def _index_treaty(self, treaty: Treaty):
+        """Add a newly accepted treaty to the active indexes"""
+        self.mutation_id += 1
+        self._active_treaties.append(treaty)
+        self._active_treaty_set.add(treaty)
+        pair = frozenset((treaty.player1, treaty.player2))
+        if isinstance(treaty, Alliance):
+            self._active_alliances.setdefault(pair, []).append(treaty)
+        elif isinstance(treaty, TerritoryTreaty):
+            self._active_territory_treaties.setdefault(pair, []).append(treaty)
+        for player_name in pair:
+            self._active_by_player.setdefault(player_name, {})[treaty] = None
+    
+    def _unindex_treaty(self, treaty: Treaty):
+        """Drop a treaty that is no longer active from the active indexes"""
+        self.mutation_id += 1
+        self._active_treaty_set.discard(treaty)
+        pair = frozenset((treaty.player1, treaty.player2))
+        if isinstance(treaty, Alliance):
+            pair_index = self._active_alliances
+        elif isinstance(treaty, TerritoryTreaty):
+            pair_index = self._active_territory_treaties
+        else:
+            pair_index = None
+        if pair_index is not None:
+            pair_treaties = pair_index[pair]
+            pair_treaties.remove(treaty)
+            if not pair_treaties:
+                del pair_index[pair]
+        for player_name in pair:
+            player_treaties = self._active_by_player.get(player_name)
+            if player_treaties is not None:  # Gone already if the player's treaties are being dropped wholesale
+                player_treaties.pop(treaty, None)
     
     def update_turn(self):
         """Update treaties at the start of a new turn"""
         self.current_turn += 1
         expired_treaties = []
         
-        for treaty in self.treaties:
-            if treaty.is_active() and treaty.decrement_duration():
+        # Count down every active treaty in one pass, dropping broken and expired ones from the list
+        still_active = []
+        for treaty in self._active_treaties:
+            if treaty.status is not TreatyStatus.ACTIVE:
+                continue  # Broken since the last update
+            treaty.turns_remaining -= 1
+            if treaty.turns_remaining <= 0:
+                treaty.status = TreatyStatus.EXPIRED
                 expired_treaties.append(treaty)
+                self._unindex_treaty(treaty)
+            else:
+                still_active.append(treaty)
+        self._active_treaties = still_active
         
         return expired_treaties
     
@@ -104,23 +157,27 @@ class DiplomacyManager:
         from_player, to_player = treaty.get_involved_players()
         if (from_player, to_player) not in self.treaty_proposals:
             self.treaty_proposals[(from_player, to_player)] = []
+            self._proposal_sets[(from_player, to_player)] = set()
         
         self.treaty_proposals[(from_player, to_player)].append(treaty)
+        self._proposal_sets[(from_player, to_player)].add(treaty)
     
     def accept_treaty(self, treaty: Treaty) -> bool:
         """Accept a treaty proposal"""
         from_player, to_player = treaty.get_involved_players()
         
         # Check if proposal exists
-        if (from_player, to_player) in self.treaty_proposals and treaty in self.treaty_proposals[(from_player, to_player)]:
+        if treaty in self._proposal_sets.get((from_player, to_player), ()):
             # Remove from proposals
             self.treaty_proposals[(from_player, to_player)].remove(treaty)
+            self._proposal_sets[(from_player, to_player)].discard(treaty)
             
             # Set creation turn
             treaty.creation_turn = self.current_turn
             
             # Add to active treaties
             self.treaties.append(treaty)
+            self._index_treaty(treaty)
             return True
         
         return False
@@ -130,47 +187,76 @@ class DiplomacyManager:
         from_player, to_player = treaty.get_involved_players()
         
         # Check if proposal exists
-        if (from_player, to_player) in self.treaty_proposals and treaty in self.treaty_proposals[(from_player, to_player)]:
+        if treaty in self._proposal_sets.get((from_player, to_player), ()):
             # Remove from proposals
             self.treaty_proposals[(from_player, to_player)].remove(treaty)
+            self._proposal_sets[(from_player, to_player)].discard(treaty)
             return True
         
         return False
     
     def break_treaty(self, treaty: Treaty):
         """Break an active treaty"""
-        if treaty in self.treaties and treaty.is_active():
+        if treaty in self._active_treaty_set and treaty.is_active():
             treaty.break_treaty()
+            self._unindex_treaty(treaty)
             
             # Decrease trust between the players
             from_player, to_player = treaty.get_involved_players()
             self._decrease_trust(from_player, to_player)
     
+    def on_conquest(self, attacker: str, defender: str, defender_eliminated: bool) -> Tuple[Optional[Alliance], List[Treaty]]:
+        """Break the treaties a conquest ends.
+        The first alliance between the two players is broken; if the defender was eliminated, so is every
+        other treaty they hold. Returns (broken alliance or None, treaties broken by the elimination)."""
+        broken_alliance = self.get_alliance_between(attacker, defender)
+        if broken_alliance:
+            self.break_treaty(broken_alliance)
+        elimination_breaks = []
+        if defender_eliminated:
+            # Take the defender's whole index entry, so breaking each treaty doesn't have to remove it again
+            elimination_breaks = list(self._active_by_player.pop(defender, ()))
+            for treaty in elimination_breaks:
+                self.break_treaty(treaty)
+        return broken_alliance, elimination_breaks
+    
     def has_active_alliance(self, player1: str, player2: str) -> bool:
         """Check if two players have an active alliance"""
-        for treaty in self.treaties:
-            if (treaty.treaty_type == TreatyType.ALLIANCE and 
-                treaty.is_active() and 
-                ((treaty.player1 == player1 and treaty.player2 == player2) or
-                 (treaty.player1 == player2 and treaty.player2 == player1))):
-                return True
-        return False
+        return frozenset((player1, player2)) in self._active_alliances
+    
+    def get_alliance_between(self, player1: str, player2: str) -> Optional[Alliance]:
+        """Get the earliest active alliance between two players, or None"""
+        # The pair's alliances are kept in acceptance order, so the first one is found without a scan
+        pair_alliances = self._active_alliances.get(frozenset((player1, player2)))
+        return pair_alliances[0] if pair_alliances else None
     
     def has_territory_treaty(self, player1: str, territory1: str, player2: str, territory2: str) -> bool:
         """Check if there's an active territory treaty covering these territories"""
-        for treaty in self.treaties:
-            if (isinstance(treaty, TerritoryTreaty) and 
-                treaty.is_active() and 
-                ((treaty.player1 == player1 and treaty.player2 == player2) or
-                 (treaty.player1 == player2 and treaty.player2 == player1)) and
-                treaty.covers_territories(territory1, territory2)):
+        for treaty in self._active_territory_treaties.get(frozenset((player1, player2)), ()):
+            if treaty.covers_territories(territory1, territory2):
                 return True
         return False
     
+    def allies_of(self, player_name: str) -> Set[str]:
+        """Get the players who have an active alliance with a player"""
+        return {other for treaty in self._active_by_player.get(player_name, ())
+                if treaty.treaty_type is TreatyType.ALLIANCE
+                for other in treaty.get_involved_players() if other != player_name}
+    
+    def territory_treaty_pairs(self, player_name: str) -> Set[Tuple[str, str, str]]:
+        """Get (own territory, other player, other territory) for every active territory treaty of a player.
+        Both orderings of each treaty's territories are included, as in covers_territories."""
+        pairs = set()
+        for treaty in self._active_by_player.get(player_name, ()):
+            if treaty.treaty_type is TreatyType.TERRITORY:
+                other = treaty.player2 if treaty.player1 == player_name else treaty.player1
+                pairs.add((treaty.territory1, other, treaty.territory2))
+                pairs.add((treaty.territory2, other, treaty.territory1))
+        return pairs
+    
     def get_player_treaties(self, player_name: str) -> List[Treaty]:
         """Get all active treaties involving a player"""
-        return [treaty for treaty in self.treaties 
-                if treaty.is_active() and treaty.involves_player(player_name)]
+        return list(self._active_by_player.get(player_name, ()))
     
     def get_player_proposals(self, to_player: str) -> List[Tuple[Treaty, str]]:
         """Get all treaty proposals to a player"""
@@ -183,18 +269,17 @@ class DiplomacyManager:
     
     def get_trust_level(self, player1: str, player2: str) -> float:
         """Get the trust level between two players (0.0-1.0)"""
-        key = tuple(sorted([player1, player2]))
-        return self.trust_levels.get(key, 0.5)  # Default to neutral trust
+        return self.trust_levels.get(frozenset((player1, player2)), 0.5)  # Default to neutral trust
     
     def _increase_trust(self, player1: str, player2: str, amount: float = 0.1):
         """Increase trust between two players"""
-        key = tuple(sorted([player1, player2]))
+        key = frozenset((player1, player2))
         current = self.trust_levels.get(key, 0.5)
         self.trust_levels[key] = min(1.0, current + amount)
     
     def _decrease_trust(self, player1: str, player2: str, amount: float = 0.2):
         """Decrease trust between two players"""
-        key = tuple(sorted([player1, player2]))
+        key = frozenset((player1, player2))
         current = self.trust_levels.get(key, 0.5)
         self.trust_levels[key] = max(0.0, current - amount)
     
@@ -203,14 +288,13 @@ class DiplomacyManager:
         # Base assessment score (0.0-1.0)
         score = 0.5
         
-        player1, player2 = treaty.get_involved_players()
-        
         # Factor in trust level
-        trust = self.get_trust_level(player1, player2)
+        trust = self.trust_levels.get(frozenset((treaty.player1, treaty.player2)), 0.5)
         score += (trust - 0.5) * 0.3  # Trust impacts score by ±0.15
         
         # Check treaty type specific factors
-        if isinstance(treaty, TerritoryTreaty):
+        treaty_type = treaty.treaty_type
+        if treaty_type is TreatyType.TERRITORY:
             # For territory treaties, we'd need to evaluate the strategic importance
             if ai_strategy:
                 # If we have an AI strategy, use it to evaluate the territory values
@@ -221,7 +305,7 @@ class DiplomacyManager:
                 # Default behavior without AI strategy
                 score += 0.1  # Slightly favor territory treaties
         
-        elif isinstance(treaty, Alliance):
+        elif treaty_type is TreatyType.ALLIANCE:
             # Alliances are generally more valuable but riskier
             score += 0.2  # More valuable than territory treaties
             
@@ -1,8 +1,12 @@
+import random
+
 class Territory:
     def __init__(self, name: str, continent: str):
         self.name = name
+        self.key = name # Key in GameBoard.territories (name is the display name), set by the board
         self.continent = continent
         self.owner = None
+        self.owner_id = -1  # Integer ID of the owner (see GameBoard.get_player_id), -1 if unowned
         self.armies = 0
 
     def __repr__(self):
@@ -11,7 +15,7 @@ class Territory:
 class Continent:
     def __init__(self, name: str, territories: list[str], bonus_armies: int):
         self.name = name
-        self.territories = territories  # List of territory names
+        self.territories = territories  # Territory names, frozen into a tuple once the board is built
         self.bonus_armies = bonus_armies
 
     def __repr__(self):
@@ -21,8 +25,64 @@ class GameBoard:
     def __init__(self):
         self.territories: dict[str, Territory] = {}
         self.continents: dict[str, Continent] = {}
-        self.adjacencies: dict[str, list[str]] = {} # To store adjacencies
+        self.adjacencies: dict[str, tuple[str, ...]] = {} # To store adjacencies
+        self.player_ids: dict[str, int] = {} # Player name -> small integer ID, assigned on first use
+        self.mutation_id = 0 # Bumped on every ownership or army change, for cache invalidation
+        self.verbose = True # Set to False to silence display_board_state, e.g. in batch simulations
         self._initialize_board()
+        self._build_display_layout()
+        # Parallel per-territory arrays indexed by territory_ids, kept in step with the Territory objects
+        self.territory_ids: dict[str, int] = {name: i for i, name in enumerate(self.territories)}
+        self.territory_list: list[Territory] = list(self.territories.values())
+        self.owner_ids: list[int] = [territory.owner_id for territory in self.territories.values()]
+        self.army_counts: list[int] = [territory.armies for territory in self.territories.values()]
+        # Zobrist keys per territory ID: column 0 for unowned, column player_id + 1 for each player.
+        # A private generator keeps the game's own random stream untouched.
+        self._zobrist_rng = random.Random(0)
+        self._zobrist: list[list[int]] = [[self._zobrist_rng.getrandbits(64)] for _ in self.territories]
+        # XOR of every territory's key for its current owner; equal ownership states hash equal
+        self.ownership_hash = 0
+        for territory_id, territory in enumerate(self.territories.values()):
+            self.ownership_hash ^= self._zobrist[territory_id][territory.owner_id + 1]
+        # Continents never change, so their per-territory index is fixed (-1 outside every continent)
+        self.continent_ids: dict[str, int] = {name: i for i, name in enumerate(self.continents)}
+        self.territory_continent_ids: list[int] = [
+            self.continent_ids.get(territory.continent, -1) for territory in self.territories.values()
+        ]
+        # Territories owned per player within each continent, kept current by set_territory_owner
+        self.continent_ownership: dict[str, dict[str, int]] = {name: {} for name in self.continents}
+        # (continent name, territory count, bonus armies) for every non-empty continent, fixed for the game
+        self.continent_bonus_table: tuple[tuple[str, int, int], ...] = tuple(
+            (name, len(continent.territories), continent.bonus_armies)
+            for name, continent in self.continents.items() if continent.territories
+        )
+        # Neighbour territory IDs for each territory ID, so owner checks can index owner_ids directly
+        self.adjacency_ids: list[tuple[int, ...]] = [
+            tuple(self.territory_ids[adj_name] for adj_name in self.adjacencies.get(name, ())
+                  if adj_name in self.territory_ids)
+            for name in self.territories
+        ]
+        # Per player, the owned territories with at least one neighbour held by someone else
+        # (or by nobody), kept current by set_territory_owner
+        self.frontline: dict[str, set[str]] = {}
+        # Per player, the (owned territory, foreign neighbour) pairs along that front line
+        self.border_edges: dict[str, set[tuple[str, str]]] = {}
+        # Per player, the total armies on their territories, kept current by the army and owner setters
+        self.army_totals: dict[str, int] = {}
+        # Neighbour sets for O(1) adjacency tests; like the tuples, they never change
+        self.adjacency_sets: dict[str, frozenset[str]] = {
+            name: frozenset(adj_names) for name, adj_names in self.adjacencies.items()
+        }
+        # The map never changes during a game, so neighbour counts can be fixed up front
+        self.adjacency_counts: dict[str, int] = {name: len(adj) for name, adj in self.adjacencies.items()}
+        # Territories bordering another continent (continent gateways)
+        self.gateway_territories: frozenset[str] = frozenset(
+            terr_name for terr_name, terr_obj in self.territories.items()
+            if terr_obj.continent in self.continents and any(
+                self.territories[adj_name].continent != terr_obj.continent
+                for adj_name in self.adjacencies.get(terr_name, ())
+            )
+        )
 
     def _initialize_board(self):
         # Define Continents
@@ -100,8 +160,12 @@ class GameBoard:
 
         # Assign territory names to continents
         for terr_name, terr_obj in self.territories.items():
+            terr_obj.key = terr_name
             if terr_obj.continent in self.continents:
                 self.continents[terr_obj.continent].territories.append(terr_name)
+        # Continent membership is fixed from here on
+        for continent_obj in self.continents.values():
+            continent_obj.territories = tuple(continent_obj.territories)
 
         # Define Adjacencies
         # (Territory: [Adjacent Territories])
@@ -160,6 +224,8 @@ class GameBoard:
             "WesternAustralia": ["Indonesia", "NewGuinea", "EasternAustralia"],
             "EasternAustralia": ["NewGuinea", "WesternAustralia"],
         }
+        # The map is static, so neighbour lists are frozen into tuples
+        self.adjacencies = {terr_name: tuple(adj_names) for terr_name, adj_names in self.adjacencies.items()}
 
     def get_territory(self, name: str) -> Territory | None:
         return self.territories.get(name)
@@ -167,48 +233,146 @@ class GameBoard:
     def get_continent(self, name: str) -> Continent | None:
         return self.continents.get(name)
 
+    def get_player_id(self, player_name: str | None) -> int:
+        """Return the integer ID for a player name, registering it if needed"""
+        if player_name is None:
+            return -1
+        player_id = self.player_ids.get(player_name)
+        if player_id is None:
+            player_id = len(self.player_ids)
+            self.player_ids[player_name] = player_id
+            for keys in self._zobrist:
+                keys.append(self._zobrist_rng.getrandbits(64))
+        return player_id
+
+    def set_territory_owner(self, territory: Territory, player_name: str | None):
+        """Change a territory's owner, keeping its integer owner ID in sync"""
+        old_owner = territory.owner
+        old_owner_id = territory.owner_id
+        territory.owner = player_name
+        territory.owner_id = self.get_player_id(player_name)
+        keys = self._zobrist[self.territory_ids[territory.key]]
+        self.ownership_hash ^= keys[old_owner_id + 1] ^ keys[territory.owner_id + 1]
+        continent_counts = self.continent_ownership.get(territory.continent)
+        if continent_counts is not None and old_owner != player_name:
+            if old_owner is not None:
+                continent_counts[old_owner] -= 1
+            if player_name is not None:
+                continent_counts[player_name] = continent_counts.get(player_name, 0) + 1
+        territory_id = self.territory_ids[territory.key]
+        self.owner_ids[territory_id] = territory.owner_id
+        if old_owner != player_name and territory.armies:
+            if old_owner is not None:
+                self.army_totals[old_owner] -= territory.armies
+            if player_name is not None:
+                self.army_totals[player_name] = self.army_totals.get(player_name, 0) + territory.armies
+        if old_owner is not None and old_owner != player_name:
+            self.frontline[old_owner].discard(territory.key)
+        # Only this territory and its neighbours can change front-line status
+        self._refresh_frontline(territory_id)
+        for neighbor_id in self.adjacency_ids[territory_id]:
+            self._refresh_frontline(neighbor_id)
+        self._refresh_border_edges(territory_id, old_owner)
+        self.mutation_id += 1
+
+    def _refresh_border_edges(self, territory_id: int, old_owner: str | None):
+        """Re-evaluate the border edges touching one territory after its owner changed"""
+        territory = self.territory_list[territory_id]
+        name = territory.key
+        owner = territory.owner
+        old_edges = self.border_edges.get(old_owner) if old_owner is not None else None
+        new_edges = self.border_edges.setdefault(owner, set()) if owner is not None else None
+        for neighbor_id in self.adjacency_ids[territory_id]:
+            neighbor = self.territory_list[neighbor_id]
+            if old_edges is not None:
+                old_edges.discard((name, neighbor.key))
+            if new_edges is not None and neighbor.owner != owner:
+                new_edges.add((name, neighbor.key))
+            if neighbor.owner is not None:
+                neighbor_edges = self.border_edges.setdefault(neighbor.owner, set())
+                if neighbor.owner != owner:
+                    neighbor_edges.add((neighbor.key, name))
+                else:
+                    neighbor_edges.discard((neighbor.key, name))
+
+    def _refresh_frontline(self, territory_id: int):
+        """Re-evaluate whether one territory is on its owner's front line"""
+        territory = self.territory_list[territory_id]
+        if territory.owner is None:
+            return
+        owner_id = self.owner_ids[territory_id]
+        owner_ids = self.owner_ids
+        frontline = self.frontline.setdefault(territory.owner, set())
+        if any(owner_ids[neighbor_id] != owner_id for neighbor_id in self.adjacency_ids[territory_id]):
+            frontline.add(territory.key)
+        else:
+            frontline.discard(territory.key)
+
+    def set_armies(self, territory: Territory, armies: int):
+        """Set the number of armies on a territory"""
+        if territory.owner is not None:
+            self.army_totals[territory.owner] = self.army_totals.get(territory.owner, 0) + armies - territory.armies
+        territory.armies = armies
+        self.army_counts[self.territory_ids[territory.key]] = armies
+        self.mutation_id += 1
+
+    def add_armies(self, territory: Territory, count: int):
+        """Add (or with a negative count, remove) armies on a territory"""
+        territory.armies += count
+        if territory.owner is not None:
+            self.army_totals[territory.owner] = self.army_totals.get(territory.owner, 0) + count
+        self.army_counts[self.territory_ids[territory.key]] = territory.armies
+        self.mutation_id += 1
+
+    def _build_display_layout(self):
+        """Precompute the static parts of display_board_state: per-continent headers, row order and name widths"""
+        self._display_layout = []
+        for continent_obj in self.continents.values():
+            header = f"\n--- {continent_obj.name.upper()} (Bonus: {continent_obj.bonus_armies}) ---"
+            rows = []
+            for terr_name in continent_obj.territories:
+                terr_obj = self.get_territory(terr_name)
+                rows.append((terr_obj.name if terr_obj else terr_name, terr_obj))
+            # Sort territories alphabetically by name for consistent display
+            rows.sort(key=lambda x: x[0])
+            # Name column width, with a little padding
+            max_name_len = max((len(name) for name, _ in rows), default=0) + 2
+            self._display_layout.append((header, rows, max_name_len))
+
     def display_board_state(self):
-        print("\n================== BOARD STATE ==================")
-        for continent_name, continent_obj in self.continents.items():
-            print(f"\n--- {continent_obj.name.upper()} (Bonus: {continent_obj.bonus_armies}) ---")
-            if not continent_obj.territories:
-                print("    (No territories listed for this continent)")
+        if not self.verbose:
+            return
+        lines = ["\n================== BOARD STATE =================="]
+        for header, rows, max_name_len in self._display_layout:
+            lines.append(header)
+            if not rows:
+                lines.append("    (No territories listed for this continent)")
                 continue
             
-            # Prepare data for sorted output by territory name
             territory_details = []
-            for terr_name in continent_obj.territories:
-                terr_obj = self.get_territory(terr_name)
+            for name, terr_obj in rows:
                 if terr_obj:
                     owner_display = terr_obj.owner if terr_obj.owner else "Unowned"
-                    territory_details.append((terr_obj.name, owner_display, terr_obj.armies))
+                    territory_details.append((name, owner_display, terr_obj.armies))
                 else:
-                    territory_details.append((terr_name, "ERROR: Not Found", 0))
-            
-            # Sort territories alphabetically by name for consistent display
-            territory_details.sort(key=lambda x: x[0])
-            
-            # Determine column widths for alignment
-            max_name_len = 0
-            max_owner_len = 0
-            for name, owner, armies in territory_details:
-                if len(name) > max_name_len:
-                    max_name_len = len(name)
-                if len(owner) > max_owner_len:
-                    max_owner_len = len(owner)
-            
-            # Add a little padding
-            max_name_len += 2
-            max_owner_len += 2
+                    territory_details.append((name, "ERROR: Not Found", 0))
+            max_owner_len = max(len(owner) for _, owner, _ in territory_details) + 2
 
-            print(f"    {'Territory'.ljust(max_name_len)} {'Owner'.ljust(max_owner_len)} Armies")
-            print(f"    {'-'*max_name_len} {'-'*max_owner_len} ------")
+            lines.append(f"    {'Territory'.ljust(max_name_len)} {'Owner'.ljust(max_owner_len)} Armies")
+            lines.append(f"    {'-'*max_name_len} {'-'*max_owner_len} ------")
             for name, owner, armies in territory_details:
-                print(f"    {name.ljust(max_name_len)} {owner.ljust(max_owner_len)} {str(armies).rjust(6)}")
-        print("===============================================")
+                lines.append(f"    {name.ljust(max_name_len)} {owner.ljust(max_owner_len)} {str(armies).rjust(6)}")
+        lines.append("===============================================")
+        print("\n".join(lines))
+
+    def continents_fully_owned_by(self, player_name: str) -> list[str]:
+        """Return the names of the continents in which the player owns every territory"""
+        continent_ownership = self.continent_ownership
+        return [continent_name for continent_name, continent_size, _ in self.continent_bonus_table
+                if continent_ownership[continent_name].get(player_name, 0) == continent_size]
 
-    def get_adjacent_territories(self, territory_name: str) -> list[str]:
-        return self.adjacencies.get(territory_name, [])
+    def get_adjacent_territories(self, territory_name: str) -> tuple[str, ...]:
+        return self.adjacencies.get(territory_name, ())
 
 # Example Usage (can be removed or moved to main.py later)
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
+import heapq
+import operator
 import random
+from collections import Counter, deque
+from itertools import combinations_with_replacement, islice
 from game_board import GameBoard
 from player import Player
 from ai_strategy import create_ai_strategy  # Import the AI strategy system
-from diplomacy import DiplomacyManager, TerritoryTreaty, Alliance, TreatyType  # Import diplomacy system
+from diplomacy import DiplomacyManager, TerritoryTreaty, Alliance  # Import diplomacy system
 try:
     from game_visualization import GameVisualization
     VISUALIZATION_AVAILABLE = True
@@ -15,10 +19,39 @@ INFANTRY = "Infantry"
 CAVALRY = "Cavalry"
 ARTILLERY = "Artillery" 
 WILD = "Wild"
+# Small integer IDs for card types, used to index Player.card_type_counts
+CARD_TYPE_IDS = {INFANTRY: 0, CAVALRY: 1, ARTILLERY: 2, WILD: 3}
+WILD_ID = CARD_TYPE_IDS[WILD]
+
+# Armies for the first card sets traded in (standard Risk progression); _calculate_card_trade_bonus
+# adds 5 per set after these
+CARD_TRADE_BONUSES = (4, 6, 8, 10, 12, 15)
+
+# Chance of carrying on attacking after a failed attack and after a conquest, indexed by whether
+# the territory was captured
+CONTINUE_ATTACK_CHANCE = (0.5, 0.8)
+
+def compare_dice(attacker_rolls: list[int], defender_rolls: list[int]) -> tuple[int, int]:
+    """Compare dice sorted high to low; returns (attacker_losses, defender_losses). Ties go to the defender."""
+    # No per-die branch: count attacker wins over the paired dice, every other pair is a defender win
+    compared = min(len(attacker_rolls), len(defender_rolls))
+    defender_losses = sum(map(operator.gt, attacker_rolls, defender_rolls))
+    return compared - defender_losses, defender_losses
+
+# (attacker_losses, defender_losses) for every possible roll: keyed by the attacker's 1-3 and the
+# defender's 1-2 dice, each as a tuple sorted high to low. 2,241 entries, built once at import.
+DICE_OUTCOMES = {
+    (attacker_rolls, defender_rolls): compare_dice(attacker_rolls, defender_rolls)
+    for num_attacker_dice in (1, 2, 3)
+    for attacker_rolls in combinations_with_replacement(range(6, 0, -1), num_attacker_dice)
+    for num_defender_dice in (1, 2)
+    for defender_rolls in combinations_with_replacement(range(6, 0, -1), num_defender_dice)
+}
 
 class Card:
     def __init__(self, type_name, territory_name=None):
         self.type = type_name  # Infantry, Cavalry, Artillery, or Wild
+        self.type_id = CARD_TYPE_IDS[type_name]
         self.territory = territory_name  # Territory name or None for wild cards
         
     def __repr__(self):
@@ -27,16 +60,23 @@ class Card:
         return f"{self.type} (Wild Card)"
 
 class GameManager:
-    def __init__(self, player_names_and_colors: list[tuple[str, str]], use_visualization=True):
+    def __init__(self, player_names_and_colors: list[tuple[str, str]], use_visualization=True, verbose=True):
+        # verbose=False silences the per-turn phase output (and the board printouts) for batch simulations
+        self.verbose = verbose
         self.game_board = GameBoard()
+        self.game_board.verbose = verbose
         self.players = [Player(name, color) for name, color in player_names_and_colors]
+        # Eliminated players stay in self.players, so this lookup never needs updating
+        self._players_by_name = {player.name: player for player in self.players}
+        # Compare owners by integer ID; names are kept for display and lookups
+        for player in self.players:
+            player.pid = self.game_board.get_player_id(player.name)
         self.current_player_index = 0
         self.game_phase = "setup_territory_claim" # "setup_army_placement", "playing"
         
         # Initialize AI strategies for each player
-        self.ai_strategies = {}
         for player in self.players:
-            self.ai_strategies[player.name] = create_ai_strategy(player.name, self.game_board)
+            player.ai_strategy = create_ai_strategy(player.name, self.game_board, verbose=verbose)
             
         # Initialize visualization if available
         self.use_visualization = use_visualization and VISUALIZATION_AVAILABLE
@@ -47,6 +87,7 @@ class GameManager:
         # Initialize Risk cards deck
         self.cards_deck = self._initialize_cards_deck()
         self.cards_trade_count = 0  # Track how many card sets have been traded in
+        self._eliminated_this_turn = []  # Players knocked out during the current attack phase, in order
         
         # Initialize diplomacy system
         self.diplomacy = DiplomacyManager()
@@ -75,62 +116,54 @@ class GameManager:
         # Shuffle the deck
         random.shuffle(cards)
         print(f"Created a deck of {len(cards)} Risk cards.")
-        return cards
+        return deque(cards)  # Drawn from the front, traded sets return to the back
 
     def draw_card(self):
         """Draw a card from the deck. If empty, reshuffle all cards except those in players' hands."""
         if not self.cards_deck:
-            print("Reshuffling cards deck...")
+            if self.verbose:
+                print("Reshuffling cards deck...")
             # In a real game, we'd collect all cards that aren't in players' hands
             # For now, just create a new deck
             self.cards_deck = self._initialize_cards_deck()
             
         if self.cards_deck:
-            return self.cards_deck.pop(0)
+            return self.cards_deck.popleft()
         return None  # Should not happen, but just in case
 
     def _calculate_card_trade_bonus(self):
         """Calculate the bonus armies for trading in a set of cards."""
-        # Standard Risk progression: 4, 6, 8, 10, 12, 15, then +5 each time
-        if self.cards_trade_count < 6:
-            bonus_values = [4, 6, 8, 10, 12, 15]
-            return bonus_values[self.cards_trade_count]
-        else:
-            # After the 6th set, each set is worth 5 more than the previous
-            return 15 + (self.cards_trade_count - 5) * 5
-
-    def _check_for_card_set(self, cards):
-        """Check if the given cards form a valid set."""
-        if len(cards) < 3:
+        if self.cards_trade_count < len(CARD_TRADE_BONUSES):
+            return CARD_TRADE_BONUSES[self.cards_trade_count]
+        return 15 + (self.cards_trade_count - 5) * 5
+
+    @staticmethod
+    def _check_for_card_set(type_counts):
+        """Check if a hand with these (infantry, cavalry, artillery, wild) counts holds a valid set."""
+        infantry, cavalry, artillery, wild = type_counts
+        if infantry + cavalry + artillery + wild < 3:
             return False
-            
-        # Count card types
-        type_counts = {INFANTRY: 0, CAVALRY: 0, ARTILLERY: 0, WILD: 0}
-        for card in cards:
-            type_counts[card.type] += 1
-            
-        # Check for 3 of a kind
-        if any(count >= 3 for card_type, count in type_counts.items() if card_type != WILD):
-            return True
-            
-        # Check for one of each (Infantry, Cavalry, Artillery)
-        if all(type_counts[card_type] >= 1 for card_type in [INFANTRY, CAVALRY, ARTILLERY]):
-            return True
-            
-        # Check if wilds can complete a set
-        wild_count = type_counts[WILD]
-        if wild_count > 0:
-            # Check if wilds can complete 3 of a kind
-            for card_type in [INFANTRY, CAVALRY, ARTILLERY]:
-                if type_counts[card_type] + wild_count >= 3:
-                    return True
-                    
-            # Check if wilds can complete one of each
-            missing_types = sum(1 for card_type in [INFANTRY, CAVALRY, ARTILLERY] if type_counts[card_type] == 0)
-            if missing_types <= wild_count:
-                return True
-                
-        return False
+        # Any wild completes a set with two other cards; otherwise need 3 of a kind or one of each
+        return (wild > 0 or infantry >= 3 or cavalry >= 3 or artillery >= 3 or
+                (infantry > 0 and cavalry > 0 and artillery > 0))
+
+    @staticmethod
+    def _find_card_set(cards):
+        """Return the first valid set of 3 cards, in hand order, or None."""
+        type_ids = [card.type_id for card in cards]
+        count = len(cards)
+        for i in range(count - 2):
+            first = type_ids[i]
+            for j in range(i + 1, count - 1):
+                second = type_ids[j]
+                for k in range(j + 1, count):
+                    third = type_ids[k]
+                    # A triple is a set if it has a wild, or its types are all equal or all different
+                    if (first == WILD_ID or second == WILD_ID or third == WILD_ID or
+                            first == second == third or
+                            (first != second and second != third and first != third)):
+                        return (cards[i], cards[j], cards[k])
+        return None
 
     def _handle_card_trading(self, player):
         """Handle card trading for reinforcements."""
@@ -139,25 +172,17 @@ class GameManager:
             
         # Mandatory trading if player has 5+ cards
         must_trade = len(player.cards) >= 5
-        if must_trade:
+        if must_trade and self.verbose:
             print(f"{player.name} must trade in cards (has {len(player.cards)} cards).")
         
-        # Try to find valid card sets
-        valid_sets = []
-        if len(player.cards) >= 3:
-            # Simple approach: check all possible combinations of 3 cards
-            from itertools import combinations
-            for card_set in combinations(player.cards, 3):
-                if self._check_for_card_set(card_set):
-                    valid_sets.append(card_set)
-        
-        if not valid_sets:
+        # The hand's type counts tell us whether any set exists without trying combinations
+        if not self._check_for_card_set(player.card_type_counts):
             if must_trade:
                 print(f"Warning: {player.name} must trade cards but no valid sets found. This should not happen.")
             return 0
             
         # Select a set to trade (for AI, choose the first valid set)
-        selected_set = valid_sets[0]
+        selected_set = self._find_card_set(player.cards)
         
         # Calculate bonus armies
         bonus_armies = self._calculate_card_trade_bonus()
@@ -168,10 +193,12 @@ class GameManager:
         for card in selected_set:
             if card.territory and card.territory in player.territories_owned:
                 territory_bonus += 2
-                print(f"{player.name} gets 2 bonus armies for owning {card.territory} shown on a traded card.")
+                if self.verbose:
+                    print(f"{player.name} gets 2 bonus armies for owning {card.territory} shown on a traded card.")
         
         total_bonus = bonus_armies + territory_bonus
-        print(f"{player.name} traded in cards for {bonus_armies} armies (plus {territory_bonus} territory bonus).")
+        if self.verbose:
+            print(f"{player.name} traded in cards for {bonus_armies} armies (plus {territory_bonus} territory bonus).")
         
         # Remove the cards from player's hand
         player.remove_cards(selected_set)
@@ -220,36 +247,41 @@ class GameManager:
             player.reinforcements = starting_armies
         print(f"Each of the {num_players} players starts with {starting_armies} armies.")
 
+    def _set_territory_owner(self, territory: 'Territory', player_name: str):
+        """Transfer a territory and keep every AI strategy's ownership counters in step"""
+        old_owner = territory.owner
+        self.game_board.set_territory_owner(territory, player_name)
+        for player in self.players:
+            if player.ai_strategy:
+                player.ai_strategy.notify_ownership_change(territory, old_owner, player_name)
+
     def _distribute_territories(self):
         all_territory_names = list(self.game_board.territories.keys())
         random.shuffle(all_territory_names)
         
-        player_index = 0
-        for territory_name in all_territory_names:
-            current_player = self.players[player_index]
-            territory = self.game_board.get_territory(territory_name)
-            if territory:
-                territory.owner = current_player.name
-                # territory.armies = 1 # Initial army placed in the next step
+        # Deal round-robin: player i gets every len(players)-th territory starting at i
+        num_players = len(self.players)
+        territories = self.game_board.territories
+        for player_index, current_player in enumerate(self.players):
+            for territory_name in all_territory_names[player_index::num_players]:
+                self._set_territory_owner(territories[territory_name], current_player.name)
+                # Initial armies are placed in the next step
                 current_player.add_territory(territory_name)
-                # current_player.reinforcements -= 1 # Decrement from total starting armies
-            
-            player_index = (player_index + 1) % len(self.players)
         print("\nTerritories have been distributed.")
 
     def _initial_army_placement_on_claimed_territories(self):
         """Each player places one army on each territory they own."""
+        territories = self.game_board.territories
         for player in self.players:
-            for territory_name in player.territories_owned:
-                territory = self.game_board.get_territory(territory_name)
-                if territory and territory.owner == player.name:
-                    if player.reinforcements > 0:
-                        territory.armies += 1
-                        player.reinforcements -= 1
-                    else:
-                        # This case should ideally not be hit if starting armies are sufficient
-                        # to place at least one on each claimed territory.
-                        print(f"Warning: {player.name} ran out of armies to place 1 on each territory.")
+            # Territories were just dealt, so every one in territories_owned is the player's
+            placeable = min(player.reinforcements, len(player.territories_owned))
+            for territory_name in islice(player.territories_owned, placeable):
+                self.game_board.add_armies(territories[territory_name], 1)
+            player.reinforcements -= placeable
+            for _ in range(len(player.territories_owned) - placeable):
+                # This case should ideally not be hit if starting armies are sufficient
+                # to place at least one on each claimed territory.
+                print(f"Warning: {player.name} ran out of armies to place 1 on each territory.")
         print("Initial 1 army placed on each claimed territory.")
 
     def _setup_place_remaining_armies(self):
@@ -260,13 +292,12 @@ class GameManager:
                 continue
             
             print(f"{player.name} ({player.color}) is placing {player.reinforcements} armies.")
-            territories_list = list(player.territories_owned)
-            while player.reinforcements > 0 and territories_list:
-                # Basic AI: Distribute armies somewhat randomly
-                chosen_territory_name = random.choice(territories_list)
-                player.place_army(chosen_territory_name, self.game_board)
-                # To prevent infinite loop if a territory somehow can't be placed on, though place_army handles it.
-                # For very few territories and many armies, this will concentrate them, which is fine.
+            territories_list = player.territories_owned_tuple
+            # Basic AI: Distribute armies somewhat randomly, drawing every placement up front
+            # For very few territories and many armies, this will concentrate them, which is fine.
+            placements = Counter(random.choice(territories_list) for _ in range(player.reinforcements))
+            for chosen_territory_name, count in placements.items():
+                player.place_army(chosen_territory_name, self.game_board, count)
             if player.reinforcements > 0:
                 # This might happen if a player has armies but somehow no valid territories (should not occur with current logic)
                 print(f"Warning: {player.name} still has {player.reinforcements} armies left but couldn't place them.")
@@ -277,7 +308,8 @@ class GameManager:
 
     def next_turn(self):
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
-        print(f"\n--- {self.get_current_player().name}\\\'s Turn ({self.get_current_player().color}) ---")
+        if self.verbose:
+            print(f"\n--- {self.get_current_player().name}\\\'s Turn ({self.get_current_player().color}) ---")
 
     def _calculate_reinforcements(self, player: Player) -> int:
         """
@@ -290,18 +322,11 @@ class GameManager:
         reinforcements = max(3, territories_owned_count // 3)  # Official Risk rule: 1 per 3 territories, min 3
 
         # Add continent bonuses - if player controls all territories in a continent
-        for continent_name, continent_obj in self.game_board.continents.items():
-            is_owner_of_all = True
-            if not continent_obj.territories:  # Skip if continent has no territories listed (should not happen)
-                continue
-            for territory_name in continent_obj.territories:
-                territory = self.game_board.get_territory(territory_name)
-                if not territory or territory.owner != player.name:
-                    is_owner_of_all = False
-                    break
-            if is_owner_of_all:
-                reinforcements += continent_obj.bonus_armies
-                print(f"{player.name} gets {continent_obj.bonus_armies} bonus armies for controlling {continent_name}.")
+        for continent_name in self.game_board.continents_fully_owned_by(player.name):
+            bonus_armies = self.game_board.continents[continent_name].bonus_armies
+            reinforcements += bonus_armies
+            if self.verbose:
+                print(f"{player.name} gets {bonus_armies} bonus armies for controlling {continent_name}.")
         
         return reinforcements
 
@@ -312,48 +337,57 @@ class GameManager:
         
         num_reinforcements = self._calculate_reinforcements(player)
         player.add_reinforcements(num_reinforcements)
-        print(f"{player.name} gets {num_reinforcements} reinforcements. Total: {player.reinforcements}")
+        if self.verbose:
+            print(f"{player.name} gets {num_reinforcements} reinforcements. Total: {player.reinforcements}")
 
         if not player.territories_owned:
-            print(f"{player.name} has no territories to place reinforcements.")
+            if self.verbose:
+                print(f"{player.name} has no territories to place reinforcements.")
             return
 
-        print(f"{player.name} is placing {player.reinforcements} reinforcements.")
+        if self.verbose:
+            print(f"{player.name} is placing {player.reinforcements} reinforcements.")
         
         # Use AI strategy to determine best reinforcement placements
-        ai_strategy = self.ai_strategies.get(player.name)
+        ai_strategy = player.ai_strategy
         if ai_strategy:
             # Get prioritized territories for reinforcement
             prioritized_territories = ai_strategy.get_best_reinforcement_territories(
-                player.name, list(player.territories_owned)
+                player.name, player.territories_owned_tuple
             )
             
             # Place armies according to the prioritization
             temp_reinforcements_to_place = player.reinforcements
             
             if prioritized_territories:
-                print(f"{player.name} identified {len(prioritized_territories)} front-line territories: {prioritized_territories}")
-                reinforcement_index = 0
+                if self.verbose:
+                    print(f"{player.name} identified {len(prioritized_territories)} front-line territories: {prioritized_territories}")
                 
-                for _ in range(temp_reinforcements_to_place):
-                    if player.reinforcements <= 0:
-                        break
-                        
-                    # Cycle through the prioritized territories
+                # Cycle through the prioritized territories to build the whole placement plan,
+                # then place each territory's share in one go
+                placements = Counter()
+                placement_log = []
+                for reinforcement_index in range(temp_reinforcements_to_place):
                     territory_name = prioritized_territories[reinforcement_index % len(prioritized_territories)]
-                    reinforcement_index += 1
-                    
-                    # Place the army
                     territory = self.game_board.get_territory(territory_name)
                     if territory:
-                        prev_armies = territory.armies
-                        player.place_army(territory_name, self.game_board)
-                        print(f"Placed army on front-line: {territory_name} (now {territory.armies} armies)")
+                        # Same ownership test as Player.place_army; other territories are left as they are
+                        if territory_name in player.territories_owned and territory.owner_id == player.pid:
+                            placements[territory_name] += 1
+                        if self.verbose:
+                            placement_log.append(f"Placed army on front-line: {territory_name} "
+                                                 f"(now {territory.armies + placements[territory_name]} armies)")
+                for territory_name, count in placements.items():
+                    player.place_army(territory_name, self.game_board, count)
+                if placement_log:
+                    print("\n".join(placement_log))
             else:
-                print(f"{player.name} has no front-line territories. Placing randomly.")
+                if self.verbose:
+                    print(f"{player.name} has no front-line territories. Placing randomly.")
                 all_owned_territories = [self.game_board.get_territory(t) for t in player.territories_owned if self.game_board.get_territory(t)]
                 if not all_owned_territories:
-                    print(f"{player.name} has no territories at all to place armies.")
+                    if self.verbose:
+                        print(f"{player.name} has no territories at all to place armies.")
                     return
                     
                 for _ in range(temp_reinforcements_to_place):
@@ -361,48 +395,41 @@ class GameManager:
                         break
                     chosen_territory = random.choice(all_owned_territories)
                     player.place_army(chosen_territory.name, self.game_board)
-                    print(f"Placed army randomly on: {chosen_territory.name} (now {chosen_territory.armies} armies)")
+                    if self.verbose:
+                        print(f"Placed army randomly on: {chosen_territory.name} (now {chosen_territory.armies} armies)")
         else:
             # Fallback to the old method if no AI strategy is available
             # ...existing code for random placement...
-            front_line_territories = []
-            for terr_name in player.territories_owned:
-                is_front_line = False
-                adj_territories = self.game_board.get_adjacent_territories(terr_name)
-                for adj_name in adj_territories:
-                    adj_terr_obj = self.game_board.get_territory(adj_name)
-                    if adj_terr_obj and adj_terr_obj.owner != player.name:
-                        is_front_line = True
-                        break
-                if is_front_line:
-                    front_line_territories.append(self.game_board.get_territory(terr_name))
+            # The board keeps each player's front line current as territories change hands
+            frontline = self.game_board.frontline.get(player.name, set())
+            front_line_territories = [self.game_board.get_territory(terr_name)
+                                      for terr_name in player.territories_owned if terr_name in frontline]
 
             temp_reinforcements_to_place = player.reinforcements
 
             if front_line_territories:
-                print(f"{player.name} identified {len(front_line_territories)} front-line territories: {[t.name for t in front_line_territories]}")
+                if self.verbose:
+                    print(f"{player.name} identified {len(front_line_territories)} front-line territories: {[t.name for t in front_line_territories]}")
+                # Always reinforce the weakest front-line territory. A min-heap on army count
+                # replaces a full re-sort per army; the shuffle breaks ties between equals randomly.
+                random.shuffle(front_line_territories)
+                weakest = [(t.armies, i, t) for i, t in enumerate(front_line_territories)]
+                heapq.heapify(weakest)
                 for _ in range(temp_reinforcements_to_place):
                     if player.reinforcements == 0: break
-                    if not front_line_territories: 
-                        all_owned_territories = [self.game_board.get_territory(t) for t in player.territories_owned if self.game_board.get_territory(t)]
-                        if not all_owned_territories: break
-                        chosen_territory = random.choice(all_owned_territories)
-                        player.place_army(chosen_territory.name, self.game_board)
-                        print(f"Fallback: Placed army on {chosen_territory.name}")
-                        continue
-
-                    front_line_territories.sort(key=lambda t: t.armies)
-                    min_armies = front_line_territories[0].armies
-                    candidates = [t for t in front_line_territories if t.armies == min_armies]
-                    chosen_territory = random.choice(candidates)
+                    _, i, chosen_territory = weakest[0]
                     player.place_army(chosen_territory.name, self.game_board)
-                    print(f"Placed army on front-line: {chosen_territory.name} (now {chosen_territory.armies} armies)")
+                    if self.verbose:
+                        print(f"Placed army on front-line: {chosen_territory.name} (now {chosen_territory.armies} armies)")
+                    heapq.heapreplace(weakest, (chosen_territory.armies, i, chosen_territory))
             else:
                 # No front-line territories, place randomly on any owned territory
-                print(f"{player.name} has no front-line territories. Placing randomly.")
+                if self.verbose:
+                    print(f"{player.name} has no front-line territories. Placing randomly.")
                 all_owned_territories = [self.game_board.get_territory(t) for t in player.territories_owned if self.game_board.get_territory(t)]
                 if not all_owned_territories:
-                    print(f"{player.name} has no territories at all to place armies.")
+                    if self.verbose:
+                        print(f"{player.name} has no territories at all to place armies.")
                     return
 
                 for _ in range(temp_reinforcements_to_place):
@@ -410,524 +437,67 @@ class GameManager:
                     if not all_owned_territories: break
                     chosen_territory = random.choice(all_owned_territories)
                     player.place_army(chosen_territory.name, self.game_board)
-                    print(f"Placed army randomly on: {chosen_territory.name} (now {chosen_territory.armies} armies)")
+                    if self.verbose:
+                        print(f"Placed army randomly on: {chosen_territory.name} (now {chosen_territory.armies} armies)")
 
-        print(f"{player.name} has finished placing reinforcements.")
+        if self.verbose:
+            print(f"{player.name} has finished placing reinforcements.")
         # Update visualization after reinforcement
         if self.use_visualization:
             self.visualization.draw_board(self.players, player, "Reinforcement Complete")
             self.visualization.pause(0.5)
 
-    def _roll_dice(self, num_dice: int) -> list[int]:
-        """Rolls a specified number of dice."""
-        return sorted([random.randint(1, 6) for _ in range(num_dice)], reverse=True)
-
-    def _resolve_attack(self, attacking_player: Player, defending_player: Player, 
-                        attacking_territory: 'Territory', defending_territory: 'Territory', 
-                        attacker_armies_for_attack: int):
-        """
-        Resolves a single attack round (one set of dice rolls).
-        Modified to check for diplomatic treaties before allowing attacks.
-        """
-        # Check for diplomatic treaties before allowing attack
-        if self.diplomacy.has_active_alliance(attacking_player.name, defending_player.name):
-            print(f"{attacking_player.name} cannot attack {defending_player.name} due to an active alliance.")
-            return False
-            
-        if self.diplomacy.has_territory_treaty(
-            attacking_player.name, attacking_territory.name,
-            defending_player.name, defending_territory.name
-        ):
-            # If there's a territory treaty, the attack is not allowed
-            print(f"{attacking_player.name} cannot attack from {attacking_territory.name} to {defending_territory.name} due to a territory treaty.")
-            return False
-            
-        # Original attack resolution logic continues from here
-        if not attacking_territory or not defending_territory:
-            return False
-
-        # Determine number of dice
-        # Attacker: 1 to 3 dice, must have more armies than dice rolled
-        num_attacker_dice = 0
-        if attacker_armies_for_attack >= 3 and attacking_territory.armies > 3: # Need >3 armies to roll 3 dice (3 attacking, 1 stays)
-            num_attacker_dice = 3
-        elif attacker_armies_for_attack >= 2 and attacking_territory.armies > 2: # Need >2 armies to roll 2 dice
-            num_attacker_dice = 2
-        elif attacker_armies_for_attack >= 1 and attacking_territory.armies > 1: # Need >1 army to roll 1 die
-            num_attacker_dice = 1
-        else:
-            print(f"Attack cancelled: {attacking_player.name} does not have enough armies in {attacking_territory.name} to attack with {attacker_armies_for_attack} units.")
-            return False # Not enough armies to attack as intended
-
-        # Defender: 1 or 2 dice, based on armies in territory
-        num_defender_dice = 0
-        if defending_territory.armies >= 2:
-            num_defender_dice = 2
-        elif defending_territory.armies == 1:
-            num_defender_dice = 1
-        else: # Should not happen if territory still has owner
-            print(f"Error: Defending territory {defending_territory.name} has no armies.")
-            return False
-
-        if num_attacker_dice == 0:
-            return False
-
-        attacker_rolls = self._roll_dice(num_attacker_dice)
-        defender_rolls = self._roll_dice(num_defender_dice)
-
-        print(f"{attacking_player.name} attacks {defending_territory.name} from {attacking_territory.name}!")
-        print(f"Attacker ({attacking_territory.armies} armies, using {attacker_armies_for_attack} for this wave, rolling {num_attacker_dice} dice): {attacker_rolls}")
-        print(f"Defender ({defending_territory.armies} armies, rolling {num_defender_dice} dice): {defender_rolls}")
-
-        attacker_losses = 0
-        defender_losses = 0
-
-        # Compare dice
-        for i in range(min(len(attacker_rolls), len(defender_rolls))):
-            if attacker_rolls[i] > defender_rolls[i]:
-                defender_losses += 1
-            else:
-                attacker_losses += 1
-        
-        attacking_territory.armies -= attacker_losses
-        defending_territory.armies -= defender_losses
-
-        print(f"Result: Attacker loses {attacker_losses} armies, Defender loses {defender_losses} armies.")
-        print(f"{attacking_territory.name} now has {attacking_territory.armies} armies.")
-        print(f"{defending_territory.name} now has {defending_territory.armies} armies.")
-
-        # If territory is conquered, break any existing treaties
-        if defending_territory.armies <= 0:
-            print(f"{defending_territory.name} has been conquered by {attacking_player.name}!")
-            
-            # Break alliance if one exists
-            if self.diplomacy.has_active_alliance(attacking_player.name, defending_player.name):
-                # Find and break the alliance
-                for treaty in self.diplomacy.get_player_treaties(attacking_player.name):
-                    if (treaty.treaty_type == TreatyType.ALLIANCE and 
-                        treaty.involves_player(defending_player.name)):
-                        self.diplomacy.break_treaty(treaty)
-                        print(f"Alliance between {attacking_player.name} and {defending_player.name} has been broken!")
-                        break
-            
-            # Change territory ownership
-            defending_territory.owner = attacking_player.name
-            defending_player.remove_territory(defending_territory.name)
-            attacking_player.add_territory(defending_territory.name)
-
-            # Attacker must move at least num_attacker_dice armies, up to attacker_armies_for_attack
-            # and leave at least 1 behind in the attacking_territory.
-            min_move = num_attacker_dice 
-            # Max armies to move is all but one from the original attacking stack,
-            # but not more than what was committed to the attack wave that succeeded.
-            armies_to_move = min(min_move, attacking_territory.armies - 1)  # Ensure at least 1 left
-            armies_to_move = max(1, armies_to_move)  # Must move at least 1 if territory is taken
-
-            if attacking_territory.armies > armies_to_move:  # if we have more than 1 army to move (after ensuring 1 is left)
-                defending_territory.armies = armies_to_move
-                attacking_territory.armies -= armies_to_move
-                print(f"{attacking_player.name} moves {armies_to_move} armies into {defending_territory.name}.")
-            else:  # Not enough armies to move the dice count and leave 1, so move all but 1
-                armies_to_move = attacking_territory.armies - 1
-                if armies_to_move > 0:
-                    defending_territory.armies = armies_to_move
-                    attacking_territory.armies -= armies_to_move
-                    print(f"{attacking_player.name} moves {armies_to_move} armies into {defending_territory.name}.")
-                else:  # This should not happen if attack was possible
-                    defending_territory.armies = 1  # Must occupy with at least 1
-                    attacking_territory.armies -= 1  # This might make it 0, which is an issue.
-                    print(f"Error in army movement logic post-conquest for {defending_territory.name}")
-
-            if defending_player.is_eliminated():
-                print(f"!!!!!!!!!! {defending_player.name} has been eliminated! !!!!!!!!!!")
-                # Break all treaties involving the eliminated player
-                for treaty in list(self.diplomacy.get_player_treaties(defending_player.name)):
-                    self.diplomacy.break_treaty(treaty)
-                    print(f"Treaty broken due to player elimination: {treaty}")
-                    
-        return True
+    def _roll_attack_dice(self, num_attacker_dice: int, num_defender_dice: int) -> tuple[list[int], list[int]]:
+        """Rolls both sides' dice for one attack in a single batch; attacker dice are drawn first."""
+        # randrange(1, 7) draws exactly what randint(1, 6) would, minus a call layer
+        roll = random.randrange
+        rolls = [roll(1, 7) for _ in range(num_attacker_dice + num_defender_dice)]
+        attacker_rolls = rolls[:num_attacker_dice]
+        defender_rolls = rolls[num_attacker_dice:]
+        attacker_rolls.sort(reverse=True)
+        defender_rolls.sort(reverse=True)
+        return attacker_rolls, defender_rolls
 
-    def _attack_phase(self, player: Player):
-        print(f"--- {player.name}'s Turn --- Phase: Attack ---")
-        if self.use_visualization:
-            self.visualization.draw_board(self.players, player, "Attack")
-            self.visualization.pause(0.5)
-            
-        attack_count = 0
-        max_attacks = 20  # Safety limit for very aggressive AIs
-        
-        # Get AI strategy for this player
-        ai_strategy = self.ai_strategies.get(player.name)
-        
-        while attack_count < max_attacks:  # Loop for multiple attacks
-            attack_count += 1
-            
-            # Use AI strategy to determine best attack targets
-            best_attack = None
-            
-            if ai_strategy:
-                # Get prioritized attack targets
-                attack_targets = ai_strategy.get_attack_targets(
-                    player.name, list(player.territories_owned)
-                )
-                
-                # Filter out targets protected by treaties
-                filtered_targets = []
-                for from_terr_name, to_terr_name, armies_for_attack_wave in attack_targets:
-                    from_terr_obj = self.game_board.get_territory(from_terr_name)
-                    to_terr_obj = self.game_board.get_territory(to_terr_name)
-                    
-                    if from_terr_obj and to_terr_obj:
-                        defending_player_name = to_terr_obj.owner
-                        
-                        # Skip if there's an alliance with the defending player
-                        if self.diplomacy.has_active_alliance(player.name, defending_player_name):
-                            continue
-                            
-                        # Skip if there's a territory treaty covering these territories
-                        if self.diplomacy.has_territory_treaty(
-                            player.name, from_terr_name,
-                            defending_player_name, to_terr_name
-                        ):
-                            continue
-                            
-                        # If not protected by treaty, add to filtered targets
-                        filtered_targets.append((from_terr_name, to_terr_name, armies_for_attack_wave))
-                
-                # Choose the best attack if any are available
-                if filtered_targets:
-                    from_terr_name, to_terr_name, armies_for_attack_wave = filtered_targets[0]
-                    from_terr_obj = self.game_board.get_territory(from_terr_name)
-                    to_terr_obj = self.game_board.get_territory(to_terr_name)
-                    
-                    if from_terr_obj and to_terr_obj and from_terr_obj.armies > 1:
-                        best_attack = (from_terr_obj, to_terr_obj, armies_for_attack_wave)
-            else:
-                # Fallback to the old method if no AI strategy is available
-                # Find attacks where attacker has significant advantage
-                can_attack = False
-                possible_attacks = []
-                
-                for terr_name in player.territories_owned:
-                    terr_obj = self.game_board.get_territory(terr_name)
-                    if terr_obj and terr_obj.armies > 1:
-                        adj_territories = self.game_board.get_adjacent_territories(terr_name)
-                        for adj_name in adj_territories:
-                            adj_terr_obj = self.game_board.get_territory(adj_name)
-                            if adj_terr_obj and adj_terr_obj.owner != player.name:
-                                # Skip if protected by treaty
-                                defending_player_name = adj_terr_obj.owner
-                                
-                                # Skip if there's an alliance with the defending player
-                                if self.diplomacy.has_active_alliance(player.name, defending_player_name):
-                                    continue
-                                    
-                                # Skip if there's a territory treaty covering these territories
-                                if self.diplomacy.has_territory_treaty(
-                                    player.name, terr_name,
-                                    defending_player_name, adj_name
-                                ):
-                                    continue
-                                
-                                possible_attacks.append((terr_name, adj_name, terr_obj.armies - 1))
-                                can_attack = True
-                
-                if can_attack and possible_attacks:
-                    # Find best attack based on advantage ratio
-                    best_advantage = 1.0
-                    random.shuffle(possible_attacks)
-                    
-                    for from_terr_name, to_terr_name, available_attack_armies in possible_attacks:
-                        from_terr_obj = self.game_board.get_territory(from_terr_name)
-                        to_terr_obj = self.game_board.get_territory(to_terr_name)
-                        
-                        if from_terr_obj and to_terr_obj and to_terr_obj.armies > 0:
-                            advantage_ratio = from_terr_obj.armies / to_terr_obj.armies
-                            
-                            if advantage_ratio > best_advantage:
-                                best_advantage = advantage_ratio
-                                best_attack = (from_terr_obj, to_terr_obj, min(available_attack_armies, 3))
-                    
-                    # If no good attacks found, consider opportunistic attacks
-                    if not best_attack:
-                        for from_terr_name, to_terr_name, available_attack_armies in possible_attacks:
-                            from_terr_obj = self.game_board.get_territory(from_terr_name)
-                            to_terr_obj = self.game_board.get_territory(to_terr_name)
-                            
-                            if from_terr_obj and to_terr_obj and from_terr_obj.armies > to_terr_obj.armies:
-                                best_attack = (from_terr_obj, to_terr_obj, min(available_attack_armies, 3))
-                                break
-            
-            # If no good attack found, end the attack phase
-            if not best_attack:
-                print(f"{player.name} evaluates options and chooses not to attack further this turn.")
-                break
-            
-            # Execute the chosen attack
-            attacking_territory, defending_territory, armies_for_attack_wave = best_attack
-            defending_player_name = defending_territory.owner
-            defending_player = next((p for p in self.players if p.name == defending_player_name), None)
-            
-            if not defending_player:
-                print(f"Error: Could not find defending player object for {defending_player_name}")
-                break
-            
-            # Get state before attack
-            pre_attack_owner = defending_territory.owner
-            
-            # Resolve the attack
-            attack_result = self._resolve_attack(player, defending_player, attacking_territory, defending_territory, armies_for_attack_wave)
-            if not attack_result:
-                print(f"{player.name} cannot attack {defending_player.name} due to diplomatic restrictions.")
-                # Try another attack
-                continue
-            
-            # Update visualization
-            if self.use_visualization:
-                self.visualization.draw_board(self.players, player, "Attack")
-                self.visualization.pause(0.3)
-            
-            # Decide whether to continue attacking
-            territory_captured = defending_territory.owner == player.name
-            
-            # Use AI strategy to decide whether to continue attacking
-            should_continue = False
-            
-            if territory_captured:
-                # After a conquest, more likely to continue
-                should_continue = random.random() < 0.8
-                if should_continue:
-                    print(f"{player.name} is encouraged by the conquest and continues attacking!")
-                else:
-                    print(f"{player.name} decides to end the attack phase.")
-                    break
-            else:
-                # After a failed attack, less likely to continue
-                should_continue = random.random() < 0.5
-                if should_continue:
-                    print(f"{player.name} will try another attack despite the setback.")
-                else:
-                    print(f"{player.name} decides to end the attack phase.")
-                    break
-        
-        # If we've reached the max number of attacks, print a message
-        if attack_count >= max_attacks:
-            print(f"{player.name} has reached the maximum number of attacks for this turn.")
-
-    def _fortify_phase(self, player: Player):
-        if self.use_visualization:
-            self.visualization.draw_board(self.players, player, "Fortify")
-            self.visualization.pause(0.5)
-        
-        print(f"--- {player.name}'s Turn ({player.color}) --- Phase: Fortify ---")
-        if not player.territories_owned or len(player.territories_owned) <= 1:
-            print(f"{player.name} has too few territories to fortify.")
-            return
-        
-        # Use AI strategy to determine best fortification move
-        ai_strategy = self.ai_strategies.get(player.name)
-        best_move = None
-        
-        if ai_strategy:
-            # Get the best fortification move
-            best_move = ai_strategy.get_best_fortification_move(
-                player.name, list(player.territories_owned)
-            )
-        else:
-            # Fallback to the old method if no AI strategy is available
-            # ...existing fortification logic...
-            # Strategy: Find an owned territory with >1 army, and move some armies to an adjacent owned territory.
-            # Prioritize moving from a territory with many armies to a weaker adjacent one, or towards a front.
-            # Simple AI: Find any valid move and execute it.
-            
-            possible_fortifications = [] # List of (from_territory_obj, to_territory_obj, max_armies_to_move)
-
-            for source_name in player.territories_owned:
-                source_territory = self.game_board.get_territory(source_name)
-                if source_territory and source_territory.armies > 1:
-                    # Simple adjacent fortification for now:
-                    q = [(source_territory, [source_territory.name])] # (current_territory, path_taken)
-                    visited_for_path = {source_territory.name} # Territories visited in current BFS from source
-
-                    # BFS to find all reachable owned territories from source_territory
-                    reachable_owned_territories_from_source = []
-
-                    head = 0
-                    while head < len(q):
-                        current_terr_obj, _ = q[head]
-                        head += 1
-
-                        for adj_name in self.game_board.get_adjacent_territories(current_terr_obj.name):
-                            adj_terr_obj = self.game_board.get_territory(adj_name)
-                            if adj_terr_obj and adj_terr_obj.owner == player.name and adj_name not in visited_for_path:
-                                visited_for_path.add(adj_name)
-                                # Add to reachable if it's not the source itself
-                                if adj_name != source_name:
-                                    reachable_owned_territories_from_source.append(adj_terr_obj)
-                                # Continue BFS to find all connected territories
-                                q.append((adj_terr_obj, [])) # Path not needed here, just reachability
-
-                    for dest_territory in reachable_owned_territories_from_source:
-                        # Can move source_territory.armies - 1
-                        armies_available_to_move = source_territory.armies - 1
-                        if armies_available_to_move > 0:
-                            possible_fortifications.append((source_territory, dest_territory, armies_available_to_move))
-
-            if possible_fortifications:
-                # Sort by number of armies to move (which is based on source.armies -1)
-                possible_fortifications.sort(key=lambda x: x[2], reverse=True) # Sort by armies_to_move desc
-                
-                # Pick the one that can move most armies, from a random selection if multiple have same max
-                max_movable = possible_fortifications[0][2]
-                top_options = [move for move in possible_fortifications if move[2] == max_movable]
-                best_choice = random.choice(top_options)
-                
-                source, dest, armies_to_move = best_choice
-                best_move = (source.name, dest.name, armies_to_move)
-        
-        # Execute the fortification move if one was found
-        if best_move:
-            source_name, dest_name, armies_to_move = best_move
-            source = self.game_board.get_territory(source_name)
-            dest = self.game_board.get_territory(dest_name)
-            
-            if source and dest and source.armies > armies_to_move:
-                print(f"{player.name} chooses to fortify by moving {armies_to_move} armies from {source_name} to {dest_name}.")
-                source.armies -= armies_to_move
-                dest.armies += armies_to_move
-                print(f"{source_name} now has {source.armies} armies. {dest_name} now has {dest.armies} armies.")
-            else:
-                print(f"Warning: Invalid fortification move from {source_name} to {dest_name}.")
-        else:
-            print(f"{player.name} chooses not to fortify (no beneficial move found by AI).")
-        
-        # Update visualization after fortification
-        if self.use_visualization:
-            self.visualization.draw_board(self.players, player, "Fortify Complete")
-            self.visualization.pause(0.5)
-
-    def play_turn(self):
-        current_player = self.get_current_player()
-        if current_player.is_eliminated():  # Check if player was eliminated before their turn starts
-            print(f"{current_player.name} ({current_player.color}) is eliminated and skips their turn.")
-            return False  # Game continues, but this player is out
-            
-        # Reset conquest flag at the beginning of the turn
-        current_player.reset_conquest_flag()
-
-        # Update diplomacy at the start of the turn
-        expired_treaties = self.diplomacy.update_turn()
-        if expired_treaties:
-            for treaty in expired_treaties:
-                player1, player2 = treaty.get_involved_players()
-                print(f"Treaty between {player1} and {player2} has expired: {treaty}")
-        
-        # Diplomacy Phase - Added before Card Trading
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Diplomacy ---")
-        self._diplomacy_phase(current_player)
-        
-        # Card Trading Phase - Before Reinforcement
-        card_bonus = 0
-        if current_player.cards:
-            print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Card Trading ---")
-            print(f"{current_player.name} has {len(current_player.cards)} cards: {current_player.cards}")
-            
-            # Handle card trading (mandatory if 5+ cards, optional otherwise)
-            card_bonus = self._handle_card_trading(current_player)
-            if card_bonus > 0:
-                current_player.add_reinforcements(card_bonus)
-                print(f"{current_player.name} received {card_bonus} reinforcements from card trading")
-
-        # Reinforcement Phase
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Reinforce ---")
-        self._reinforcement_phase(current_player)
-        
-        # Check if player was eliminated
-        if current_player.is_eliminated():
-            print(f"{current_player.name} ({current_player.color}) was eliminated during the reinforcement phase.")
-            return False  # Game continues, player is out
-
-        # Attack Phase
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Attack ---")
-        self._attack_phase(current_player)
-
-        # Award a Risk card if the player conquered at least one territory
-        if current_player.conquered_territory_this_turn:
-            card = self.draw_card()
-            if card:
-                current_player.add_card(card)
-                print(f"{current_player.name} receives a Risk card for conquering a territory this turn: {card}")
-
-        # Check for player elimination and card transfer after attack phase
-        for other_player in self.players:
-            if other_player != current_player and other_player.is_eliminated() and other_player.cards:
-                # Transfer cards from eliminated player to the conquering player
-                print(f"{current_player.name} receives {len(other_player.cards)} cards from eliminated player {other_player.name}")
-                current_player.cards.extend(other_player.cards)
-                other_player.cards = []
-                
-                # Check for mandatory card trading if player now has 5+ cards
-                if len(current_player.cards) >= 5:
-                    print(f"{current_player.name} must trade cards after eliminating {other_player.name} (now has {len(current_player.cards)} cards)")
-                    while len(current_player.cards) >= 5:
-                        card_bonus = self._handle_card_trading(current_player)
-                        if card_bonus > 0:
-                            # In official Risk, these armies can be placed immediately
-                            # For simplicity, we'll add them to the player's next turn
-                            current_player.add_reinforcements(card_bonus)
-                            print(f"{current_player.name} received {card_bonus} reinforcements from mandatory card trading after elimination")
-
-        if self.check_win_condition():  # Check win condition after attack
-            return True
-        
-        # Check if player was eliminated during their attack phase (e.g. lost all territories)
-        if current_player.is_eliminated():
-            print(f"{current_player.name} ({current_player.color}) was eliminated during their attack phase.")
-            return False  # Game continues, player is out
-
-        # Fortify Phase
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Fortify ---")
-        self._fortify_phase(current_player)
-
-        # Final win condition check for the turn
-        if self.check_win_condition():
-            return True
-            
-        return False  # Game continues
-    
     def _diplomacy_phase(self, player):
         """Handle diplomatic actions for a player's turn"""
         # First, check for and respond to incoming treaty proposals
         incoming_proposals = self.diplomacy.get_player_proposals(player.name)
         if incoming_proposals:
-            print(f"{player.name} has {len(incoming_proposals)} diplomatic proposals to consider:")
+            if self.verbose:
+                print(f"{player.name} has {len(incoming_proposals)} diplomatic proposals to consider:")
+            ai_strategy = player.ai_strategy
+            threshold = 0.6  # Accept if score > 0.6
+            # Proposals are answered one at a time: a rejection lowers trust, which the next evaluation reads
             for treaty, from_player in incoming_proposals:
-                print(f"- From {from_player}: {treaty}")
+                if self.verbose:
+                    print(f"- From {from_player}: {treaty}")
                 
                 # AI decision making for accepting/rejecting treaties
                 accept = False
-                ai_strategy = self.ai_strategies.get(player.name)
                 
                 if ai_strategy:
                     # Use AI strategy to evaluate proposals
                     evaluation_score = self.diplomacy.evaluate_treaty_proposal(treaty, ai_strategy)
                     
                     # The higher the score, the more likely to accept
-                    threshold = 0.6  # Accept if score > 0.6
                     accept = evaluation_score > threshold
                     
-                    print(f"  {player.name} evaluates the proposal (score: {evaluation_score:.2f}) and ", end="")
+                    if self.verbose:
+                        print(f"  {player.name} evaluates the proposal (score: {evaluation_score:.2f}) and ", end="")
                 else:
                     # Simple random decision if no AI strategy
                     accept = random.random() > 0.4  # 60% chance to accept
-                    print(f"  {player.name} ", end="")
+                    if self.verbose:
+                        print(f"  {player.name} ", end="")
                 
                 if accept:
                     self.diplomacy.accept_treaty(treaty)
-                    print("accepts the treaty.")
+                    if self.verbose:
+                        print("accepts the treaty.")
                 else:
                     self.diplomacy.reject_treaty(treaty)
-                    print("rejects the treaty.")
+                    if self.verbose:
+                        print("rejects the treaty.")
         
         # Then, decide whether to propose new treaties
         if random.random() < 0.3:  # 30% chance to propose a treaty each turn
@@ -951,16 +521,19 @@ class GameManager:
                 
                 if treaty_type == "territory":
                     # Find suitable territories for a territory treaty
-                    player_territories = list(player.territories_owned)
-                    partner_territories = list(partner.territories_owned)
+                    player_territories = player.territories_owned_tuple
+                    partner_territories = partner.territories_owned_tuple
                     
-                    # Find adjacent territories
+                    # Find adjacent territories: walk each of the player's territories' neighbours and keep
+                    # the partner's, listed in the partner's territory order so the random pick is unchanged
                     suitable_pairs = []
+                    partner_order = {terr_name: i for i, terr_name in enumerate(partner_territories)}
+                    adjacencies = self.game_board.adjacencies
                     for p1_terr in player_territories:
-                        for p2_terr in partner_territories:
-                            # Check if territories are adjacent
-                            if p2_terr in self.game_board.adjacencies.get(p1_terr, []):
-                                suitable_pairs.append((p1_terr, p2_terr))
+                        shared = [p2_terr for p2_terr in adjacencies.get(p1_terr, ()) if p2_terr in partner_order]
+                        if len(shared) > 1:
+                            shared.sort(key=partner_order.__getitem__)
+                        suitable_pairs.extend((p1_terr, p2_terr) for p2_terr in shared)
                     
                     if suitable_pairs:
                         # Choose a random pair
@@ -969,13 +542,15 @@ class GameManager:
                         # Create and propose the treaty
                         treaty = TerritoryTreaty(player.name, partner.name, terr1, terr2, duration=3)
                         self.diplomacy.propose_treaty(treaty)
-                        print(f"{player.name} proposes a territory treaty to {partner.name}: {treaty}")
+                        if self.verbose:
+                            print(f"{player.name} proposes a territory treaty to {partner.name}: {treaty}")
                 
                 elif treaty_type == "alliance":
                     # Create and propose an alliance
                     treaty = Alliance(player.name, partner.name, duration=5)
                     self.diplomacy.propose_treaty(treaty)
-                    print(f"{player.name} proposes an alliance to {partner.name}: {treaty}")
+                    if self.verbose:
+                        print(f"{player.name} proposes an alliance to {partner.name}: {treaty}")
 
     def _resolve_attack(self, attacking_player: Player, defending_player: Player, 
                         attacking_territory: 'Territory', defending_territory: 'Territory', 
@@ -986,7 +561,8 @@ class GameManager:
         """
         # Check for diplomatic treaties before allowing attack
         if self.diplomacy.has_active_alliance(attacking_player.name, defending_player.name):
-            print(f"{attacking_player.name} cannot attack {defending_player.name} due to an active alliance.")
+            if self.verbose:
+                print(f"{attacking_player.name} cannot attack {defending_player.name} due to an active alliance.")
             return False
             
         if self.diplomacy.has_territory_treaty(
@@ -994,7 +570,8 @@ class GameManager:
             defending_player.name, defending_territory.name
         ):
             # If there's a territory treaty, the attack is not allowed
-            print(f"{attacking_player.name} cannot attack from {attacking_territory.name} to {defending_territory.name} due to a territory treaty.")
+            if self.verbose:
+                print(f"{attacking_player.name} cannot attack from {attacking_territory.name} to {defending_territory.name} due to a territory treaty.")
             return False
             
         # Original attack resolution logic continues from here
@@ -1002,108 +579,87 @@ class GameManager:
             return False
 
         # Determine number of dice
-        # Attacker: 1 to 3 dice, must have more armies than dice rolled
-        num_attacker_dice = 0
-        if attacker_armies_for_attack >= 3 and attacking_territory.armies > 3: # Need >3 armies to roll 3 dice (3 attacking, 1 stays)
-            num_attacker_dice = 3
-        elif attacker_armies_for_attack >= 2 and attacking_territory.armies > 2: # Need >2 armies to roll 2 dice
-            num_attacker_dice = 2
-        elif attacker_armies_for_attack >= 1 and attacking_territory.armies > 1: # Need >1 army to roll 1 die
-            num_attacker_dice = 1
-        else:
-            print(f"Attack cancelled: {attacking_player.name} does not have enough armies in {attacking_territory.name} to attack with {attacker_armies_for_attack} units.")
+        # Attacker: 1 to 3 dice, no more than the wave size, and at least one army must stay behind
+        num_attacker_dice = min(3, attacker_armies_for_attack, attacking_territory.armies - 1)
+        if num_attacker_dice < 1:
+            if self.verbose:
+                print(f"Attack cancelled: {attacking_player.name} does not have enough armies in {attacking_territory.name} to attack with {attacker_armies_for_attack} units.")
             return False # Not enough armies to attack as intended
 
         # Defender: 1 or 2 dice, based on armies in territory
-        num_defender_dice = 0
-        if defending_territory.armies >= 2:
-            num_defender_dice = 2
-        elif defending_territory.armies == 1:
-            num_defender_dice = 1
-        else: # Should not happen if territory still has owner
+        num_defender_dice = min(2, defending_territory.armies)
+        if num_defender_dice < 1: # Should not happen if territory still has owner
             print(f"Error: Defending territory {defending_territory.name} has no armies.")
             return False
 
-        if num_attacker_dice == 0:
-            return False
-
-        attacker_rolls = self._roll_dice(num_attacker_dice)
-        defender_rolls = self._roll_dice(num_defender_dice)
-
-        print(f"{attacking_player.name} attacks {defending_territory.name} from {attacking_territory.name}!")
-        print(f"Attacker ({attacking_territory.armies} armies, using {attacker_armies_for_attack} for this wave, rolling {num_attacker_dice} dice): {attacker_rolls}")
-        print(f"Defender ({defending_territory.armies} armies, rolling {num_defender_dice} dice): {defender_rolls}")
+        attacker_rolls, defender_rolls = self._roll_attack_dice(num_attacker_dice, num_defender_dice)
 
-        attacker_losses = 0
-        defender_losses = 0
+        if self.verbose:
+            print(f"{attacking_player.name} attacks {defending_territory.name} from {attacking_territory.name}!")
+            print(f"Attacker ({attacking_territory.armies} armies, using {attacker_armies_for_attack} for this wave, rolling {num_attacker_dice} dice): {attacker_rolls}")
+            print(f"Defender ({defending_territory.armies} armies, rolling {num_defender_dice} dice): {defender_rolls}")
 
-        # Compare dice
-        for i in range(min(len(attacker_rolls), len(defender_rolls))):
-            if attacker_rolls[i] > defender_rolls[i]:
-                defender_losses += 1
-            else:
-                attacker_losses += 1
+        attacker_losses, defender_losses = DICE_OUTCOMES[tuple(attacker_rolls), tuple(defender_rolls)]
         
-        attacking_territory.armies -= attacker_losses
-        defending_territory.armies -= defender_losses
+        self.game_board.add_armies(attacking_territory, -attacker_losses)
+        self.game_board.add_armies(defending_territory, -defender_losses)
 
-        print(f"Result: Attacker loses {attacker_losses} armies, Defender loses {defender_losses} armies.")
-        print(f"{attacking_territory.name} now has {attacking_territory.armies} armies.")
-        print(f"{defending_territory.name} now has {defending_territory.armies} armies.")
+        if self.verbose:
+            print(f"Result: Attacker loses {attacker_losses} armies, Defender loses {defender_losses} armies.")
+            print(f"{attacking_territory.name} now has {attacking_territory.armies} armies.")
+            print(f"{defending_territory.name} now has {defending_territory.armies} armies.")
 
-        # If territory is conquered, break any existing treaties
+        # If territory is conquered, take it over and break any treaties that ends
         if defending_territory.armies <= 0:
-            print(f"{defending_territory.name} has been conquered by {attacking_player.name}!")
-            
-            # Break alliance if one exists
-            if self.diplomacy.has_active_alliance(attacking_player.name, defending_player.name):
-                # Find and break the alliance
-                for treaty in self.diplomacy.get_player_treaties(attacking_player.name):
-                    if (treaty.treaty_type == TreatyType.ALLIANCE and 
-                        treaty.involves_player(defending_player.name)):
-                        self.diplomacy.break_treaty(treaty)
-                        print(f"Alliance between {attacking_player.name} and {defending_player.name} has been broken!")
-                        break
-            
-            # Change territory ownership
-            defending_territory.owner = attacking_player.name
-            defending_player.remove_territory(defending_territory.name)
-            attacking_player.add_territory(defending_territory.name)
-
-            # Attacker must move at least num_attacker_dice armies, up to attacker_armies_for_attack
-            # and leave at least 1 behind in the attacking_territory.
-            min_move = num_attacker_dice 
-            # Max armies to move is all but one from the original attacking stack,
-            # but not more than what was committed to the attack wave that succeeded.
-            armies_to_move = min(min_move, attacking_territory.armies - 1)  # Ensure at least 1 left
-            armies_to_move = max(1, armies_to_move)  # Must move at least 1 if territory is taken
-
-            if attacking_territory.armies > armies_to_move:  # if we have more than 1 army to move (after ensuring 1 is left)
-                defending_territory.armies = armies_to_move
-                attacking_territory.armies -= armies_to_move
-                print(f"{attacking_player.name} moves {armies_to_move} armies into {defending_territory.name}.")
-            else:  # Not enough armies to move the dice count and leave 1, so move all but 1
-                armies_to_move = attacking_territory.armies - 1
-                if armies_to_move > 0:
-                    defending_territory.armies = armies_to_move
-                    attacking_territory.armies -= armies_to_move
-                    print(f"{attacking_player.name} moves {armies_to_move} armies into {defending_territory.name}.")
-                else:  # This should not happen if attack was possible
-                    defending_territory.armies = 1  # Must occupy with at least 1
-                    attacking_territory.armies -= 1  # This might make it 0, which is an issue.
-                    print(f"Error in army movement logic post-conquest for {defending_territory.name}")
-
-            if defending_player.is_eliminated():
-                print(f"!!!!!!!!!! {defending_player.name} has been eliminated! !!!!!!!!!!")
-                # Break all treaties involving the eliminated player
-                for treaty in list(self.diplomacy.get_player_treaties(defending_player.name)):
-                    self.diplomacy.break_treaty(treaty)
-                    print(f"Treaty broken due to player elimination: {treaty}")
+            if self.verbose:
+                print(f"{defending_territory.name} has been conquered by {attacking_player.name}!")
+            self._apply_conquest(attacking_player, defending_player, attacking_territory, defending_territory,
+                                 num_attacker_dice)
                     
         return True
 
+    def _apply_conquest(self, attacking_player: Player, defending_player: Player,
+                        attacking_territory: 'Territory', defending_territory: 'Territory', num_attacker_dice: int):
+        """Apply every state change of a conquest: treaties, ownership, the army move and elimination."""
+        # Change territory ownership first, so the elimination check is known before touching diplomacy
+        self._set_territory_owner(defending_territory, attacking_player.name)
+        defending_player.remove_territory(defending_territory.name)
+        attacking_player.add_territory(defending_territory.name)
+        eliminated = defending_player.is_eliminated()
+        if eliminated:
+            # Their cards pass to the attacker once the attack phase is over
+            self._eliminated_this_turn.append(defending_player)
+        broken_alliance, elimination_breaks = self.diplomacy.on_conquest(
+            attacking_player.name, defending_player.name, eliminated
+        )
+        if broken_alliance and self.verbose:
+            print(f"Alliance between {attacking_player.name} and {defending_player.name} has been broken!")
+
+        # Attacker moves in as many armies as dice rolled, leaving at least 1 behind. Rolling n dice needs
+        # more than n armies and a conquest costs the attacker fewer than n, so at least 1 army always moves.
+        armies_to_move = min(num_attacker_dice, attacking_territory.armies - 1)
+        assert armies_to_move >= 1, f"Conquest of {defending_territory.name} left no armies to move in"
+        self.game_board.set_armies(defending_territory, armies_to_move)
+        self.game_board.add_armies(attacking_territory, -armies_to_move)
+        if self.verbose:
+            print(f"{attacking_player.name} moves {armies_to_move} armies into {defending_territory.name}.")
+
+        if eliminated and self.verbose:
+            print(f"!!!!!!!!!! {defending_player.name} has been eliminated! !!!!!!!!!!")
+            for treaty in elimination_breaks:
+                print(f"Treaty broken due to player elimination: {treaty}")
+
+    @staticmethod
+    def _update_movable(movable: set, territory: 'Territory', player: Player):
+        """Keep a set of the player's territories with armies to spare in step with one territory"""
+        if territory.owner_id == player.pid and territory.armies > 1:
+            movable.add(territory.key)
+        else:
+            movable.discard(territory.key)
+
     def _attack_phase(self, player: Player):
-        print(f"--- {player.name}'s Turn --- Phase: Attack ---")
+        if self.verbose:
+            print(f"--- {player.name}'s Turn --- Phase: Attack ---")
         if self.use_visualization:
             self.visualization.draw_board(self.players, player, "Attack")
             self.visualization.pause(0.5)
@@ -1112,116 +668,122 @@ class GameManager:
         max_attacks = 20  # Safety limit for very aggressive AIs
         
         # Get AI strategy for this player
-        ai_strategy = self.ai_strategies.get(player.name)
+        ai_strategy = player.ai_strategy
+        get_territory = self.game_board.territories.get  # Same lookup as GameBoard.get_territory
+        draw = random.random  # Continue-attacking draws, taken in turn order from the shared game stream
+        treaties_seen = None  # DiplomacyManager.mutation_id the treaty snapshots below were taken at
+        if not ai_strategy:
+            # Front-line territories that can spare an army, updated after each attack rather than rescanned
+            movable = set()
+            for terr_name in self.game_board.frontline.get(player.name, ()):
+                self._update_movable(movable, get_territory(terr_name), player)
+            # Live view of this player's (own, foreign) neighbour pairs, kept current by the board
+            border_edges = self.game_board.border_edges.setdefault(player.name, set())
         
         while attack_count < max_attacks:  # Loop for multiple attacks
             attack_count += 1
             
             # Use AI strategy to determine best attack targets
             best_attack = None
+            # Snapshot this player's treaties for the target filters; a conquest can break one,
+            # so refresh them whenever the active treaties have changed
+            if self.diplomacy.mutation_id != treaties_seen:
+                treaties_seen = self.diplomacy.mutation_id
+                allies = self.diplomacy.allies_of(player.name)
+                treaty_pairs = self.diplomacy.territory_treaty_pairs(player.name)
             
             if ai_strategy:
                 # Get prioritized attack targets
                 attack_targets = ai_strategy.get_attack_targets(
-                    player.name, list(player.territories_owned)
+                    player.name, player.territories_owned_tuple
                 )
                 
-                # Filter out targets protected by treaties
-                filtered_targets = []
+                # Take the highest-priority target not protected by a treaty; the rest are never needed
                 for from_terr_name, to_terr_name, armies_for_attack_wave in attack_targets:
-                    from_terr_obj = self.game_board.get_territory(from_terr_name)
-                    to_terr_obj = self.game_board.get_territory(to_terr_name)
+                    from_terr_obj = get_territory(from_terr_name)
+                    to_terr_obj = get_territory(to_terr_name)
                     
                     if from_terr_obj and to_terr_obj:
                         defending_player_name = to_terr_obj.owner
                         
                         # Skip if there's an alliance with the defending player
-                        if self.diplomacy.has_active_alliance(player.name, defending_player_name):
+                        if defending_player_name in allies:
                             continue
                             
                         # Skip if there's a territory treaty covering these territories
-                        if self.diplomacy.has_territory_treaty(
-                            player.name, from_terr_name,
-                            defending_player_name, to_terr_name
-                        ):
+                        if (from_terr_name, defending_player_name, to_terr_name) in treaty_pairs:
                             continue
-                            
-                        # If not protected by treaty, add to filtered targets
-                        filtered_targets.append((from_terr_name, to_terr_name, armies_for_attack_wave))
-                
-                # Choose the best attack if any are available
-                if filtered_targets:
-                    from_terr_name, to_terr_name, armies_for_attack_wave = filtered_targets[0]
-                    from_terr_obj = self.game_board.get_territory(from_terr_name)
-                    to_terr_obj = self.game_board.get_territory(to_terr_name)
-                    
-                    if from_terr_obj and to_terr_obj and from_terr_obj.armies > 1:
-                        best_attack = (from_terr_obj, to_terr_obj, armies_for_attack_wave)
+                        
+                        # Attack from here only if there are armies to spare; otherwise stop attacking
+                        if from_terr_obj.armies > 1:
+                            best_attack = (from_terr_obj, to_terr_obj, armies_for_attack_wave)
+                        break
             else:
                 # Fallback to the old method if no AI strategy is available
                 # Find attacks where attacker has significant advantage
                 can_attack = False
                 possible_attacks = []
                 
-                for terr_name in player.territories_owned:
-                    terr_obj = self.game_board.get_territory(terr_name)
-                    if terr_obj and terr_obj.armies > 1:
-                        adj_territories = self.game_board.get_adjacent_territories(terr_name)
-                        for adj_name in adj_territories:
-                            adj_terr_obj = self.game_board.get_territory(adj_name)
-                            if adj_terr_obj and adj_terr_obj.owner != player.name:
-                                # Skip if protected by treaty
-                                defending_player_name = adj_terr_obj.owner
-                                
-                                # Skip if there's an alliance with the defending player
-                                if self.diplomacy.has_active_alliance(player.name, defending_player_name):
-                                    continue
-                                    
-                                # Skip if there's a territory treaty covering these territories
-                                if self.diplomacy.has_territory_treaty(
-                                    player.name, terr_name,
-                                    defending_player_name, adj_name
-                                ):
-                                    continue
-                                
-                                possible_attacks.append((terr_name, adj_name, terr_obj.armies - 1))
-                                can_attack = True
+                # Only the player's border edges can be attacked across
+                for terr_name, adj_name in border_edges:
+                    if terr_name not in movable:
+                        continue
+                    terr_obj = get_territory(terr_name)
+                    adj_terr_obj = get_territory(adj_name)
+                    if terr_obj and adj_terr_obj:
+                        # Skip if protected by treaty
+                        defending_player_name = adj_terr_obj.owner
+                        
+                        # Skip if there's an alliance with the defending player
+                        if defending_player_name in allies:
+                            continue
+                            
+                        # Skip if there's a territory treaty covering these territories
+                        if (terr_name, defending_player_name, adj_name) in treaty_pairs:
+                            continue
+                        
+                        possible_attacks.append((terr_obj, adj_terr_obj, terr_obj.armies - 1))
+                        can_attack = True
                 
                 if can_attack and possible_attacks:
-                    # Find best attack based on advantage ratio
+                    # One pass finds both the best advantage ratio (above 1.0) and the first opportunistic
+                    # attack to fall back on. Ties for the best ratio are broken by reservoir sampling.
                     best_advantage = 1.0
-                    random.shuffle(possible_attacks)
-                    
-                    for from_terr_name, to_terr_name, available_attack_armies in possible_attacks:
-                        from_terr_obj = self.game_board.get_territory(from_terr_name)
-                        to_terr_obj = self.game_board.get_territory(to_terr_name)
-                        
-                        if from_terr_obj and to_terr_obj and to_terr_obj.armies > 0:
-                            advantage_ratio = from_terr_obj.armies / to_terr_obj.armies
-                            
+                    best_option = None
+                    tied_options = 0
+                    opportunistic_option = None
+                    for attack in possible_attacks:
+                        from_armies = attack[0].armies
+                        to_armies = attack[1].armies
+                        if opportunistic_option is None and from_armies > to_armies:
+                            opportunistic_option = attack
+                        if to_armies > 0:
+                            advantage_ratio = from_armies / to_armies
                             if advantage_ratio > best_advantage:
                                 best_advantage = advantage_ratio
-                                best_attack = (from_terr_obj, to_terr_obj, min(available_attack_armies, 3))
+                                best_option = attack
+                                tied_options = 1
+                            elif best_option and advantage_ratio == best_advantage:
+                                tied_options += 1
+                                if random.randrange(tied_options) == 0:
+                                    best_option = attack
                     
                     # If no good attacks found, consider opportunistic attacks
-                    if not best_attack:
-                        for from_terr_name, to_terr_name, available_attack_armies in possible_attacks:
-                            from_terr_obj = self.game_board.get_territory(from_terr_name)
-                            to_terr_obj = self.game_board.get_territory(to_terr_name)
-                            
-                            if from_terr_obj and to_terr_obj and from_terr_obj.armies > to_terr_obj.armies:
-                                best_attack = (from_terr_obj, to_terr_obj, min(available_attack_armies, 3))
-                                break
+                    chosen_option = best_option or opportunistic_option
+                    if chosen_option:
+                        from_terr_obj, to_terr_obj, available_attack_armies = chosen_option
+                        best_attack = (from_terr_obj, to_terr_obj, min(available_attack_armies, 3))
             
             # If no good attack found, end the attack phase
             if not best_attack:
-                print(f"{player.name} evaluates options and chooses not to attack further this turn.")
+                if self.verbose:
+                    print(f"{player.name} evaluates options and chooses not to attack further this turn.")
                 break
             
             # Execute the chosen attack
             attacking_territory, defending_territory, armies_for_attack_wave = best_attack
             defending_player_name = defending_territory.owner
-            defending_player = next((p for p in self.players if p.name == defending_player_name), None)
+            defending_player = self._players_by_name.get(defending_player_name)
             
             if not defending_player:
                 print(f"Error: Could not find defending player object for {defending_player_name}")
@@ -1233,9 +795,13 @@ class GameManager:
             # Resolve the attack
             attack_result = self._resolve_attack(player, defending_player, attacking_territory, defending_territory, armies_for_attack_wave)
             if not attack_result:
-                print(f"{player.name} cannot attack {defending_player.name} due to diplomatic restrictions.")
+                if self.verbose:
+                    print(f"{player.name} cannot attack {defending_player.name} due to diplomatic restrictions.")
                 # Try another attack
                 continue
+            if not ai_strategy:
+                self._update_movable(movable, attacking_territory, player)
+                self._update_movable(movable, defending_territory, player)
             
             # Update visualization
             if self.use_visualization:
@@ -1243,50 +809,45 @@ class GameManager:
                 self.visualization.pause(0.3)
             
             # Decide whether to continue attacking
-            territory_captured = defending_territory.owner == player.name
+            territory_captured = defending_territory.owner_id == player.pid
             
-            # Use AI strategy to decide whether to continue attacking
-            should_continue = False
-            
-            if territory_captured:
-                # After a conquest, more likely to continue
-                should_continue = random.random() < 0.8
-                if should_continue:
+            # One Bernoulli draw per attack: after a conquest, more likely to continue than after a failed attack
+            should_continue = draw() < CONTINUE_ATTACK_CHANCE[territory_captured]
+            if not should_continue:
+                if self.verbose:
+                    print(f"{player.name} decides to end the attack phase.")
+                break
+            if self.verbose:
+                if territory_captured:
                     print(f"{player.name} is encouraged by the conquest and continues attacking!")
                 else:
-                    print(f"{player.name} decides to end the attack phase.")
-                    break
-            else:
-                # After a failed attack, less likely to continue
-                should_continue = random.random() < 0.5
-                if should_continue:
                     print(f"{player.name} will try another attack despite the setback.")
-                else:
-                    print(f"{player.name} decides to end the attack phase.")
-                    break
         
         # If we've reached the max number of attacks, print a message
         if attack_count >= max_attacks:
-            print(f"{player.name} has reached the maximum number of attacks for this turn.")
+            if self.verbose:
+                print(f"{player.name} has reached the maximum number of attacks for this turn.")
 
     def _fortify_phase(self, player: Player):
         if self.use_visualization:
             self.visualization.draw_board(self.players, player, "Fortify")
             self.visualization.pause(0.5)
         
-        print(f"--- {player.name}'s Turn ({player.color}) --- Phase: Fortify ---")
+        if self.verbose:
+            print(f"--- {player.name}'s Turn ({player.color}) --- Phase: Fortify ---")
         if not player.territories_owned or len(player.territories_owned) <= 1:
-            print(f"{player.name} has too few territories to fortify.")
+            if self.verbose:
+                print(f"{player.name} has too few territories to fortify.")
             return
         
         # Use AI strategy to determine best fortification move
-        ai_strategy = self.ai_strategies.get(player.name)
+        ai_strategy = player.ai_strategy
         best_move = None
         
         if ai_strategy:
             # Get the best fortification move
             best_move = ai_strategy.get_best_fortification_move(
-                player.name, list(player.territories_owned)
+                player.name, player.territories_owned_tuple
             )
         else:
             # Fallback to the old method if no AI strategy is available
@@ -1295,50 +856,57 @@ class GameManager:
             # Prioritize moving from a territory with many armies to a weaker adjacent one, or towards a front.
             # Simple AI: Find any valid move and execute it.
             
-            possible_fortifications = [] # List of (from_territory_obj, to_territory_obj, max_armies_to_move)
-
-            for source_name in player.territories_owned:
-                source_territory = self.game_board.get_territory(source_name)
-                if source_territory and source_territory.armies > 1:
-                    # Simple adjacent fortification for now:
-                    q = [(source_territory, [source_territory.name])] # (current_territory, path_taken)
-                    visited_for_path = {source_territory.name} # Territories visited in current BFS from source
-
-                    # BFS to find all reachable owned territories from source_territory
-                    reachable_owned_territories_from_source = []
-
-                    head = 0
-                    while head < len(q):
-                        current_terr_obj, _ = q[head]
-                        head += 1
-
-                        for adj_name in self.game_board.get_adjacent_territories(current_terr_obj.name):
-                            adj_terr_obj = self.game_board.get_territory(adj_name)
-                            if adj_terr_obj and adj_terr_obj.owner == player.name and adj_name not in visited_for_path:
-                                visited_for_path.add(adj_name)
-                                # Add to reachable if it's not the source itself
-                                if adj_name != source_name:
-                                    reachable_owned_territories_from_source.append(adj_terr_obj)
-                                # Continue BFS to find all connected territories
-                                q.append((adj_terr_obj, [])) # Path not needed here, just reachability
-
-                    for dest_territory in reachable_owned_territories_from_source:
-                        # Can move source_territory.armies - 1
-                        armies_available_to_move = source_territory.armies - 1
-                        if armies_available_to_move > 0:
-                            possible_fortifications.append((source_territory, dest_territory, armies_available_to_move))
-
-            if possible_fortifications:
-                # Sort by number of armies to move (which is based on source.armies -1)
-                possible_fortifications.sort(key=lambda x: x[2], reverse=True) # Sort by armies_to_move desc
-                
-                # Pick the one that can move most armies, from a random selection if multiple have same max
-                max_movable = possible_fortifications[0][2]
-                top_options = [move for move in possible_fortifications if move[2] == max_movable]
-                best_choice = random.choice(top_options)
-                
-                source, dest, armies_to_move = best_choice
-                best_move = (source.name, dest.name, armies_to_move)
+            # Armies can move between any two owned territories connected through owned
+            # territory, so label the connected components of the player's holdings once
+            board = self.game_board
+            owner_ids = board.owner_ids
+            component_of = {}  # Territory ID -> index into components
+            components = []  # Lists of Territory objects, one per connected group
+            for terr_name in player.territories_owned:
+                start_id = board.territory_ids.get(terr_name)
+                if start_id is None or start_id in component_of or owner_ids[start_id] != player.pid:
+                    continue
+                component_of[start_id] = len(components)
+                members = [start_id]
+                queue = deque([start_id])
+                while queue:
+                    current_id = queue.popleft()
+                    for adj_id in board.adjacency_ids[current_id]:
+                        if adj_id not in component_of and owner_ids[adj_id] == player.pid:
+                            component_of[adj_id] = len(components)
+                            members.append(adj_id)
+                            queue.append(adj_id)
+                components.append([board.territory_list[member_id] for member_id in members])
+
+            # Any source with more than one army can reach every other territory in its group.
+            # Pick the move that can shift the most armies, at random among equally good ones.
+            # Only the tied sources are kept; each stands for one move per other member of its group.
+            max_movable = 0
+            tied_sources = []  # (source territory, its component)
+            tied_moves = 0
+            for component in components:
+                if len(component) < 2:
+                    continue
+                for source in component:
+                    armies_available_to_move = source.armies - 1
+                    if armies_available_to_move < max_movable or armies_available_to_move <= 0:
+                        continue
+                    if armies_available_to_move > max_movable:
+                        max_movable = armies_available_to_move
+                        tied_sources = []
+                        tied_moves = 0
+                    tied_sources.append((source, component))
+                    tied_moves += len(component) - 1
+
+            if tied_sources:
+                # Draw a move index uniformly across all tied (source, destination) pairs
+                move_index = random.randrange(tied_moves)
+                for source, component in tied_sources:
+                    if move_index < len(component) - 1:
+                        break
+                    move_index -= len(component) - 1
+                destinations = [dest for dest in component if dest is not source]
+                best_move = (source.name, destinations[move_index].name, max_movable)
         
         # Execute the fortification move if one was found
         if best_move:
@@ -1347,14 +915,17 @@ class GameManager:
             dest = self.game_board.get_territory(dest_name)
             
             if source and dest and source.armies > armies_to_move:
-                print(f"{player.name} chooses to fortify by moving {armies_to_move} armies from {source_name} to {dest_name}.")
-                source.armies -= armies_to_move
-                dest.armies += armies_to_move
-                print(f"{source_name} now has {source.armies} armies. {dest_name} now has {dest.armies} armies.")
+                if self.verbose:
+                    print(f"{player.name} chooses to fortify by moving {armies_to_move} armies from {source_name} to {dest_name}.")
+                self.game_board.add_armies(source, -armies_to_move)
+                self.game_board.add_armies(dest, armies_to_move)
+                if self.verbose:
+                    print(f"{source_name} now has {source.armies} armies. {dest_name} now has {dest.armies} armies.")
             else:
                 print(f"Warning: Invalid fortification move from {source_name} to {dest_name}.")
         else:
-            print(f"{player.name} chooses not to fortify (no beneficial move found by AI).")
+            if self.verbose:
+                print(f"{player.name} chooses not to fortify (no beneficial move found by AI).")
         
         # Update visualization after fortification
         if self.use_visualization:
@@ -1364,7 +935,8 @@ class GameManager:
     def play_turn(self):
         current_player = self.get_current_player()
         if current_player.is_eliminated():  # Check if player was eliminated before their turn starts
-            print(f"{current_player.name} ({current_player.color}) is eliminated and skips their turn.")
+            if self.verbose:
+                print(f"{current_player.name} ({current_player.color}) is eliminated and skips their turn.")
             return False  # Game continues, but this player is out
             
         # Reset conquest flag at the beginning of the turn
@@ -1372,38 +944,44 @@ class GameManager:
 
         # Update diplomacy at the start of the turn
         expired_treaties = self.diplomacy.update_turn()
-        if expired_treaties:
+        if expired_treaties and self.verbose:
             for treaty in expired_treaties:
                 player1, player2 = treaty.get_involved_players()
                 print(f"Treaty between {player1} and {player2} has expired: {treaty}")
         
         # Diplomacy Phase - Added before Card Trading
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Diplomacy ---")
+        if self.verbose:
+            print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Diplomacy ---")
         self._diplomacy_phase(current_player)
         
         # Card Trading Phase - Before Reinforcement
         card_bonus = 0
         if current_player.cards:
-            print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Card Trading ---")
-            print(f"{current_player.name} has {len(current_player.cards)} cards: {current_player.cards}")
+            if self.verbose:
+                print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Card Trading ---")
+                print(f"{current_player.name} has {len(current_player.cards)} cards: {current_player.cards}")
             
             # Handle card trading (mandatory if 5+ cards, optional otherwise)
             card_bonus = self._handle_card_trading(current_player)
             if card_bonus > 0:
                 current_player.add_reinforcements(card_bonus)
-                print(f"{current_player.name} received {card_bonus} reinforcements from card trading")
+                if self.verbose:
+                    print(f"{current_player.name} received {card_bonus} reinforcements from card trading")
 
         # Reinforcement Phase
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Reinforce ---")
+        if self.verbose:
+            print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Reinforce ---")
         self._reinforcement_phase(current_player)
         
         # Check if player was eliminated
         if current_player.is_eliminated():
-            print(f"{current_player.name} ({current_player.color}) was eliminated during the reinforcement phase.")
+            if self.verbose:
+                print(f"{current_player.name} ({current_player.color}) was eliminated during the reinforcement phase.")
             return False  # Game continues, player is out
 
         # Attack Phase
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Attack ---")
+        if self.verbose:
+            print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Attack ---")
         self._attack_phase(current_player)
 
         # Award a Risk card if the player conquered at least one territory
@@ -1411,37 +989,45 @@ class GameManager:
             card = self.draw_card()
             if card:
                 current_player.add_card(card)
-                print(f"{current_player.name} receives a Risk card for conquering a territory this turn: {card}")
+                if self.verbose:
+                    print(f"{current_player.name} receives a Risk card for conquering a territory this turn: {card}")
 
-        # Check for player elimination and card transfer after attack phase
-        for other_player in self.players:
-            if other_player != current_player and other_player.is_eliminated() and other_player.cards:
+        # Transfer cards from players eliminated during the attack phase
+        eliminated_players, self._eliminated_this_turn = self._eliminated_this_turn, []
+        for other_player in eliminated_players:
+            if other_player.cards:
                 # Transfer cards from eliminated player to the conquering player
-                print(f"{current_player.name} receives {len(other_player.cards)} cards from eliminated player {other_player.name}")
-                current_player.cards.extend(other_player.cards)
-                other_player.cards = []
+                if self.verbose:
+                    print(f"{current_player.name} receives {len(other_player.cards)} cards from eliminated player {other_player.name}")
+                current_player.add_cards(other_player.cards)
+                other_player.clear_cards()
                 
                 # Check for mandatory card trading if player now has 5+ cards
                 if len(current_player.cards) >= 5:
-                    print(f"{current_player.name} must trade cards after eliminating {other_player.name} (now has {len(current_player.cards)} cards)")
-                    while len(current_player.cards) >= 5:
+                    if self.verbose:
+                        print(f"{current_player.name} must trade cards after eliminating {other_player.name} (now has {len(current_player.cards)} cards)")
+                    # Any 5 cards hold a set, so each trade removes 3 until fewer than 5 remain
+                    for _ in range((len(current_player.cards) - 5) // 3 + 1):
                         card_bonus = self._handle_card_trading(current_player)
                         if card_bonus > 0:
                             # In official Risk, these armies can be placed immediately
                             # For simplicity, we'll add them to the player's next turn
                             current_player.add_reinforcements(card_bonus)
-                            print(f"{current_player.name} received {card_bonus} reinforcements from mandatory card trading after elimination")
+                            if self.verbose:
+                                print(f"{current_player.name} received {card_bonus} reinforcements from mandatory card trading after elimination")
 
         if self.check_win_condition():  # Check win condition after attack
             return True
         
         # Check if player was eliminated during their attack phase (e.g. lost all territories)
         if current_player.is_eliminated():
-            print(f"{current_player.name} ({current_player.color}) was eliminated during their attack phase.")
+            if self.verbose:
+                print(f"{current_player.name} ({current_player.color}) was eliminated during their attack phase.")
             return False  # Game continues, player is out
 
         # Fortify Phase
-        print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Fortify ---")
+        if self.verbose:
+            print(f"\n--- {current_player.name}'s Turn ({current_player.color}) --- Phase: Fortify ---")
         self._fortify_phase(current_player)
 
         # Final win condition check for the turn
@@ -1451,18 +1037,26 @@ class GameManager:
         return False  # Game continues
 
     def check_win_condition(self) -> bool: # Removed player argument
-        active_players = [p for p in self.players if not p.is_eliminated()]
+        # One pass over the players finds both the survivors and anyone holding every territory
+        total_territories = len(self.game_board.territories)
+        active_count = 0
+        last_active = None
+        world_conqueror = None
+        for player in self.players:
+            if not player.is_eliminated():
+                active_count += 1
+                last_active = player
+                if world_conqueror is None and player.get_controlled_territories_count() == total_territories:
+                    world_conqueror = player
         
-        if len(active_players) == 1:
-            winner = active_players[0]
-            print(f"\n!!!!!!!!!! {winner.name} HAS WON THE GAME! Only one player remains. !!!!!!!!!!")
+        if active_count == 1:
+            print(f"\n!!!!!!!!!! {last_active.name} HAS WON THE GAME! Only one player remains. !!!!!!!!!!")
             return True
         
         # Original condition: one player owns all territories (still valid)
-        for player in active_players:
-            if player.get_controlled_territories_count() == len(self.game_board.territories):
-                print(f"\n!!!!!!!!!! {player.name} HAS CONQUERED THE WORLD! !!!!!!!!!!")
-                return True
+        if world_conqueror:
+            print(f"\n!!!!!!!!!! {world_conqueror.name} HAS CONQUERED THE WORLD! !!!!!!!!!!")
+            return True
         return False
 
     def start_main_game_loop(self):
@@ -1484,18 +1078,20 @@ class GameManager:
             while turn_count < max_turns and (not self.use_visualization or self.visualization.running):
                 turn_count += 1
                 current_player_for_turn = self.get_current_player()
-                print(f"\n=== Turn {turn_count} - Player: {current_player_for_turn.name} ({current_player_for_turn.color}) ===")
+                if self.verbose:
+                    print(f"\n=== Turn {turn_count} - Player: {current_player_for_turn.name} ({current_player_for_turn.color}) ===")
                 
                 game_over = self.play_turn()
                 if game_over:
                     print(f"\n--- Game Over After {current_player_for_turn.name}'s Turn ---")
                     if self.use_visualization:
-                        winner = [p for p in self.players if not p.is_eliminated()][0]
+                        winner = next(p for p in self.players if not p.is_eliminated())
                         self.visualization.draw_board(self.players, winner, "WINNER!")
                         self.visualization.pause(5)  # Show the final state for 5 seconds
                     break
                 
-                print(f"\n--- Board State After {current_player_for_turn.name}'s Turn ({current_player_for_turn.color}) ---")
+                if self.verbose:
+                    print(f"\n--- Board State After {current_player_for_turn.name}'s Turn ({current_player_for_turn.color}) ---")
                 self.game_board.display_board_state() # Display board after each player's turn
                 
                 self.next_turn()
@@ -1,5 +1,9 @@
 import pygame
+import functools
+import os
+import struct
 import sys
+import tempfile
 import time
 import math
 from game_board import GameBoard
@@ -49,6 +53,8 @@ FONT_SIZE = 14
 LARGE_FONT_SIZE = 24
 TERRITORY_RADIUS = 22
 LINE_WIDTH = 2
+# Quadratic Bezier weights for the 21 samples of a curved connection
+BEZIER_WEIGHTS = tuple(((1-t)**2, 2*(1-t)*t, t*t) for t in (i/100 for i in range(0,101,5)))
 
 # New colors for continent styling
 CONTINENT_OUTLINE_COLOR = (0, 0, 0, 220)  # Black outline, fairly opaque
@@ -351,153 +357,272 @@ TERRITORY_SHAPES = {
     ]
 }
 
+# Short labels drawn on the map and on cards
+TERRITORY_ABBREVIATIONS = {
+    "Alaska": "AK",
+    "NorthwestTerritory": "NW Terr.",
+    "Greenland": "Green.",
+    "Alberta": "AB",
+    "Ontario": "ON",
+    "Quebec": "QC",
+    "WesternUS": "W. US",
+    "EasternUS": "E. US",
+    "CentralAmerica": "C. America",
+    "Venezuela": "Ven.",
+    "Peru": "Per.",
+    "Brazil": "Bra.",
+    "Argentina": "Arg.",
+    "Iceland": "Ice.",
+    "Scandinavia": "Scan.",
+    "GreatBritain": "G.B.",
+    "NorthernEurope": "N. Euro.",
+    "Ukraine": "Ukr.",
+    "WesternEurope": "W. Euro.",
+    "SouthernEurope": "S. Euro.",
+    "NorthAfrica": "N. Afr.",
+    "Egypt": "Eg.",
+    "EastAfrica": "E. Afr.",
+    "Congo": "Congo",
+    "SouthAfrica": "S. Afr.",
+    "Madagascar": "Mad.",
+    "Ural": "Ural",
+    "Siberia": "Sibe.",
+    "Yakutsk": "Yak.",
+    "Kamchatka": "Kam.",
+    "Irkutsk": "Irk.",
+    "Mongolia": "Mong.",
+    "Japan": "Jap.",
+    "Afghanistan": "Afg.",
+    "China": "Chi.",
+    "MiddleEast": "M.E.",
+    "India": "Ind.",
+    "Siam": "Siam",
+    "Indonesia": "Indo.",
+    "NewGuinea": "N. Guinea",
+    "WesternAustralia": "W. Aus.",
+    "EasternAustralia": "E. Aus.",
+}
+
 # NEW – path to the Risk board image
 BOARD_IMAGE_PATH = "risk_board.png"
 
+@functools.lru_cache(maxsize=32)
+def get_font(name, size):
+    """Load a system font once; SysFont searches the installed fonts and opens the file on every call"""
+    return pygame.font.SysFont(name, size)
+
 class GameVisualization:
     def __init__(self, game_board):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         pygame.display.set_caption("Risk Simulator")
 
-        self.font = pygame.font.SysFont("Arial", FONT_SIZE)
-        self.large_font = pygame.font.SysFont("Arial", LARGE_FONT_SIZE)
+        self.font = get_font("Arial", FONT_SIZE)
+        self.large_font = get_font("Arial", LARGE_FONT_SIZE)
+        self.card_terr_font = get_font("Arial", 10)
+        # HUD text mostly repeats frame to frame, so rendered strings are kept by (font, text, colour)
+        self._render_text = functools.lru_cache(maxsize=512)(
+            lambda font, text, color: font.render(text, True, color))
         self.game_board = game_board
-        self.clock = pygame.time.Clock()
         self.running = True
 
         # prepare board bitmap
         self._load_and_scale_board()
+        # the board never moves, so every territory's screen position is fixed too
+        self._screen_coords = {name: self._board_to_screen(pt) for name, pt in TERRITORY_COORDS.items()}
+        # screen-space polylines for every connection, fixed for the same reason
+        self._edge_points = {
+            (terr1, terr2): self._connection_points(terr1, terr2)
+            for terr1, neighbors in self.game_board.adjacencies.items()
+            for terr2 in neighbors
+            if terr1 < terr2 and terr1 in TERRITORY_COORDS and terr2 in TERRITORY_COORDS
+        }
+        # everything that never changes during a game is drawn once and blitted each frame
+        self._build_static_background()
+        # player name -> solid colour square for the HUD, see _color_swatch
+        self._color_swatches = {}
+        # hand size -> (card positions, panel background) for the cards panel
+        self._card_layouts = {}
+        # (card type, width, height) -> pre-drawn card face, see _card_face
+        self._card_faces = {}
+        # fixed parts of the reinforcements indicator
+        self._reinf_bg = pygame.Surface((200, 60), pygame.SRCALPHA)
+        self._reinf_bg.fill((230, 230, 230, 200))
+        self._reinf_bg = self._reinf_bg.convert_alpha()  # display's pixel format, so blits need no conversion
+        self._reinf_header = self.font.render("REINFORCEMENTS", True, (0, 0, 0))
+        # (player name, reinforcements) -> composited indicator, oldest dropped past 32 entries
+        self._hud_cache = {}
+        # what the last frame showed, so an identical redraw can be skipped
+        self._last_drawn_state = None
+        # screen areas the HUD panels covered last frame
+        self._last_hud_rects = []
 
     def _load_and_scale_board(self):
-        img_orig = pygame.image.load(BOARD_IMAGE_PATH).convert_alpha()
-        rect = img_orig.get_rect()
-        scale = min(SCREEN_WIDTH/rect.w, SCREEN_HEIGHT/rect.h)
-        new_size = (int(rect.w * scale), int(rect.h * scale))
+        # decoding and resampling the PNG is slow, so the scaled result is cached as raw RGBA
+        # kept in the user's own cache directory, not the shared temp dir
+        cache_dir = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                                 "risk_simulator")
+        cache_path = os.path.join(cache_dir, "risk_board_%dx%d_%d.rgba" % (
+            SCREEN_WIDTH, SCREEN_HEIGHT, os.stat(BOARD_IMAGE_PATH).st_mtime_ns))
+        header = struct.Struct("<IId")  # scaled width, scaled height, scale factor
+        try:
+            with open(cache_path, "rb") as f:
+                width, height, scale = header.unpack(f.read(header.size))
+                new_size = (width, height)
+                self._board_img = pygame.image.frombuffer(f.read(), new_size, "RGBA").convert_alpha()
+        except (OSError, struct.error, ValueError, pygame.error):
+            img_orig = pygame.image.load(BOARD_IMAGE_PATH).convert_alpha()
+            rect = img_orig.get_rect()
+            scale = min(SCREEN_WIDTH/rect.w, SCREEN_HEIGHT/rect.h)
+            new_size = (int(rect.w * scale), int(rect.h * scale))
+            self._board_img = pygame.transform.smoothscale(img_orig, new_size)
+            tmp_file = None
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                # written under a unique name and renamed into place, so a concurrent start never reads a partial file
+                with tempfile.NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as tmp_file:
+                    tmp_file.write(header.pack(new_size[0], new_size[1], scale))
+                    tmp_file.write(pygame.image.tostring(self._board_img, "RGBA"))
+                os.replace(tmp_file.name, cache_path)
+            except OSError:
+                # no cache this time; the next start will just load the PNG again
+                if tmp_file is not None:
+                    try:
+                        os.remove(tmp_file.name)
+                    except OSError:
+                        pass
         self._board_scale = scale
-        self._board_img = pygame.transform.smoothscale(img_orig, new_size)
         self._board_pos = ((SCREEN_WIDTH - new_size[0])//2, (SCREEN_HEIGHT - new_size[1])//2)
 
+    def _build_static_background(self):
+        """Pre-render the ocean, board image and adjacency lines, plus each territory's label"""
+        self._static_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._static_bg.fill(BACKGROUND_COLOR)
+        self._static_bg.blit(self._board_img, self._board_pos)
+        self.draw_connections(self._static_bg)
+        self._label_cache = {
+            name: self.font.render(self._abbreviate_name(name), True, TEXT_COLOR)
+            for name in TERRITORY_COORDS
+        }
+        # fill colour per owner ID + 1 (index 0 is unowned), extended as the board registers players
+        self._owner_colors = [TERRITORY_COLORS[None]]
+        # army count -> (rendered number, translucent backing), filled in as counts first appear
+        self._army_label_cache = {}
+        # translucent backings by size; counts with the same rendered width share one
+        self._army_bg_cache = {}
+
     def _board_to_screen(self, pt):
         return (int(pt[0] * self._board_scale) + self._board_pos[0],
                 int(pt[1] * self._board_scale) + self._board_pos[1])
 
-    def draw_connection(self, t1, t2):
-        # draw curved or straight antialiased line between two territories
-        if t1 not in TERRITORY_COORDS or t2 not in TERRITORY_COORDS:
-            return
-        x1, y1 = self._board_to_screen(TERRITORY_COORDS[t1])
-        x2, y2 = self._board_to_screen(TERRITORY_COORDS[t2])
+    def _connection_points(self, t1, t2):
+        # straight line for close territories, a curve bowed to one side for distant ones
+        x1, y1 = self._screen_coords[t1]
+        x2, y2 = self._screen_coords[t2]
         dx, dy = x2 - x1, y2 - y1
         dist = math.hypot(dx, dy)
         if dist < 100:
-            pygame.draw.aaline(self.screen, CONNECTION_COLOR, (x1, y1), (x2, y2))
-            return
+            return [(x1, y1), (x2, y2)]
         midx, midy = (x1+x2)/2, (y1+y2)/2
         curve = min(dist * 0.15, 50)
         nx, ny = -dy/dist, dx/dist
         cx, cy = midx + nx*curve, midy + ny*curve
-        pts = []
-        for t in (i/100 for i in range(0,101,5)):
-            bx = (1-t)**2*x1 + 2*(1-t)*t*cx + t*t*x2
-            by = (1-t)**2*y1 + 2*(1-t)*t*cy + t*t*y2
-            pts.append((bx, by))
-        pygame.draw.aalines(self.screen, CONNECTION_COLOR, False, pts)
+        return [(a*x1 + b*cx + c*x2, a*y1 + b*cy + c*y2) for a, b, c in BEZIER_WEIGHTS]
 
-    def draw_connections(self):
-        """Draw all adjacency lines by iterating over board adjacencies"""
-        for terr1, neighbors in self.game_board.adjacencies.items():
-            for terr2 in neighbors:
-                # Draw each connection only once
-                if terr1 < terr2:
-                    self.draw_connection(terr1, terr2)
+    def draw_connections(self, surface=None):
+        """Draw all adjacency lines from the precomputed connection polylines"""
+        # _edge_points holds each connection once, so no per-edge dedup is needed here
+        surface = surface or self.screen
+        for pts in self._edge_points.values():
+            pygame.draw.aalines(surface, CONNECTION_COLOR, False, pts)
 
-    def draw_territory(self, name, territory):
-        # filled circle + outline over the board image
-        if name not in TERRITORY_COORDS:
+    def draw_territory(self, name, territory, blit_list=None):
+        # filled circle + outline over the board image; text is queued on blit_list when one is given
+        pos = self._screen_coords.get(name)
+        if pos is None:
             return
-        x, y = self._board_to_screen(TERRITORY_COORDS[name])
-        color = TERRITORY_COLORS.get(territory.owner, TERRITORY_COLORS[None])
+        x, y = pos
+        color = self._owner_colors[territory.owner_id + 1]
         pygame.draw.circle(self.screen, color, (x, y), TERRITORY_RADIUS)
         pygame.draw.circle(self.screen, BORDER_COLOR, (x, y), TERRITORY_RADIUS, LINE_WIDTH)
         # label
-        short = self._abbreviate_name(name)
-        lbl = self.font.render(short, True, TEXT_COLOR)
-        self.screen.blit(lbl, (x-lbl.get_width()//2, y-TERRITORY_RADIUS-15))
+        lbl = self._label_cache[name]
+        blits = [(lbl, (x-lbl.get_width()//2, y-TERRITORY_RADIUS-15))]
         # armies
         if territory.armies:
-            army = self.font.render(str(territory.armies), True, TEXT_COLOR)
-            bg = pygame.Surface((army.get_width()+6, army.get_height()+2), pygame.SRCALPHA)
-            bg.fill((255,255,255,180))
-            self.screen.blit(bg, (x-bg.get_width()//2, y-bg.get_height()//2))
-            self.screen.blit(army, (x-army.get_width()//2, y-army.get_height()//2))
+            army, bg = self._army_label(territory.armies)
+            blits.append((bg, (x-bg.get_width()//2, y-bg.get_height()//2)))
+            blits.append((army, (x-army.get_width()//2, y-army.get_height()//2)))
+        if blit_list is None:
+            self.screen.blits(blits, doreturn=False)
+        else:
+            blit_list.extend(blits)
 
-    # keep your full first _abbreviate_name; delete any duplicate below
-    def _abbreviate_name(self, name):
-        abbreviations = {
-            "Alaska": "AK",
-            "NorthwestTerritory": "NW Terr.",
-            "Greenland": "Green.",
-            "Alberta": "AB",
-            "Ontario": "ON",
-            "Quebec": "QC",
-            "WesternUS": "W. US",
-            "EasternUS": "E. US",
-            "CentralAmerica": "C. America",
-            "Venezuela": "Ven.",
-            "Peru": "Per.",
-            "Brazil": "Bra.",
-            "Argentina": "Arg.",
-            "Iceland": "Ice.",
-            "Scandinavia": "Scan.",
-            "GreatBritain": "G.B.",
-            "NorthernEurope": "N. Euro.",
-            "Ukraine": "Ukr.",
-            "WesternEurope": "W. Euro.",
-            "SouthernEurope": "S. Euro.",
-            "NorthAfrica": "N. Afr.",
-            "Egypt": "Eg.",
-            "EastAfrica": "E. Afr.",
-            "Congo": "Congo",
-            "SouthAfrica": "S. Afr.",
-            "Madagascar": "Mad.",
-            "Ural": "Ural",
-            "Siberia": "Sibe.",
-            "Yakutsk": "Yak.",
-            "Kamchatka": "Kam.",
-            "Irkutsk": "Irk.",
-            "Mongolia": "Mong.",
-            "Japan": "Jap.",
-            "Afghanistan": "Afg.",
-            "China": "Chi.",
-            "MiddleEast": "M.E.",
-            "India": "Ind.",
-            "Siam": "Siam",
-            "Indonesia": "Indo.",
-            "NewGuinea": "N. Guinea",
-            "WesternAustralia": "W. Aus.",
-            "EasternAustralia": "E. Aus.",
-        }
-        return abbreviations.get(name, name)
+    def _refresh_owner_colors(self):
+        # player IDs are only ever appended, so only new players need a colour looked up
+        player_ids = self.game_board.player_ids
+        if len(self._owner_colors) <= len(player_ids):
+            for name, player_id in player_ids.items():
+                if player_id + 1 >= len(self._owner_colors):
+                    self._owner_colors.append(TERRITORY_COLORS.get(name, TERRITORY_COLORS[None]))
+
+    def _army_label(self, armies):
+        # render each army count (and its backing) only the first time it is shown
+        label = self._army_label_cache.get(armies)
+        if label is None:
+            army = self.font.render(str(armies), True, TEXT_COLOR)
+            bg_size = (army.get_width()+6, army.get_height()+2)
+            bg = self._army_bg_cache.get(bg_size)
+            if bg is None:
+                bg = pygame.Surface(bg_size, pygame.SRCALPHA)
+                bg.fill((255,255,255,180))
+                bg = self._army_bg_cache[bg_size] = bg.convert_alpha()
+            label = self._army_label_cache[armies] = (army, bg)
+        return label
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _abbreviate_name(name, max_len=None):
+        """Short display name for a territory, optionally cut to max_len characters"""
+        short = TERRITORY_ABBREVIATIONS.get(name, name)
+        return short[:max_len] if max_len else short
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _truncate_name(name, max_len):
+        """Player name for the HUD, cut to max_len characters with an ellipsis if longer"""
+        return name[:max_len-3] + "..." if len(name) > max_len else name
 
     def draw_board(self, players=None, current_player=None, phase=None, diplomacy=None):
-        # 1) ocean
-        self.screen.fill(BACKGROUND_COLOR)
-        # 2) board image
-        self.screen.blit(self._board_img, self._board_pos)
-        # 3) adjacency lines
-        self.draw_connections()
+        # the board and diplomacy bump mutation_id on every change; the panels also show reinforcements and cards
+        state = (self.game_board.mutation_id, current_player, phase,
+                 diplomacy.mutation_id if diplomacy else None,
+                 tuple((p.reinforcements, len(p.cards)) for p in players) if players is not None else None)
+        if state == self._last_drawn_state:
+            pygame.display.flip()
+            return
+        # if only the player panels changed, only their areas need to reach the window
+        hud_only = self._last_drawn_state is not None and state[:4] == self._last_drawn_state[:4]
+        self._last_drawn_state = state
+        # 1-3) ocean, board image and adjacency lines, pre-rendered
+        self.screen.blit(self._static_bg, (0, 0))
         # 4) territories
+        self._refresh_owner_colors()
+        # circles are drawn as we go; all labels and army counts then go out in one batched blit
+        blit_list = []
         for nm, terr in self.game_board.territories.items():
-            self.draw_territory(nm, terr)
+            self.draw_territory(nm, terr, blit_list)
+        self.screen.blits(blit_list, doreturn=False)
         # 5) UI overlays unchanged
+        hud_rects = []
         if players is not None:
-            self.draw_player_stats(players)
+            hud_rects.append(self.draw_player_stats(players))
             
             # Draw cards panel for the current player
             if current_player:
-                self.draw_cards_panel(players, current_player)
-                self.draw_reinforcements_indicator(current_player)
+                hud_rects.append(self.draw_cards_panel(players, current_player))
+                hud_rects.append(self.draw_reinforcements_indicator(current_player))
+            hud_rects = [rect for rect in hud_rects if rect]
             
             # Draw diplomacy panel if available
             if diplomacy:
@@ -522,8 +647,14 @@ class GameVisualization:
             controls_text = self.font.render("Press ESC to exit", True, (200, 200, 200))
             self.screen.blit(controls_text, (20, SCREEN_HEIGHT - info_box_height + 55))
         
-        # Update the display
-        pygame.display.flip()
+        # Update the display: just the panels (where they are now and where they were) when nothing
+        # else changed and that is clearly less than the whole screen, otherwise everything
+        dirty_rects = hud_rects + self._last_hud_rects
+        self._last_hud_rects = hud_rects
+        if hud_only and sum(rect.w * rect.h for rect in dirty_rects) < SCREEN_WIDTH * SCREEN_HEIGHT // 2:
+            pygame.display.update(dirty_rects)
+        else:
+            pygame.display.flip()
     
     def check_events(self):
         for event in pygame.event.get():
@@ -538,16 +669,20 @@ class GameVisualization:
     
     def close(self):
         self.running = False
+        get_font.cache_clear()  # fonts don't survive pygame.quit()
         pygame.quit()
         
     def pause(self, seconds=0.5):
         """Pause for a specified number of seconds while checking for exit events"""
-        start_time = time.time()
-        while time.time() - start_time < seconds:
+        # sleep in short slices between event checks instead of ticking a frame clock
+        end_time = time.monotonic() + seconds
+        while True:
             if not self.check_events():
                 return False
-            self.clock.tick(30)
-        return True
+            remaining_ms = int((end_time - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                return True
+            pygame.time.wait(min(remaining_ms, 50))
 
     def draw_player_stats(self, players):
         sidebar_x = SCREEN_WIDTH - 200
@@ -566,19 +701,16 @@ class GameVisualization:
         for player in players:
             if player.is_eliminated():
                 continue
-            player_color = TERRITORY_COLORS.get(player.name, (150, 150, 150))
-            pygame.draw.rect(self.screen, player_color, (sidebar_x + 10, y_offset, 15, 15))
-            name_to_display = player.name
-            if len(name_to_display) > 13:
-                name_to_display = name_to_display[:10] + "..."
-            name_text = self.font.render(name_to_display, True, (0, 0, 0))
+            self.screen.blit(self._color_swatch(player.name), (sidebar_x + 10, y_offset))
+            name_text = self._render_text(self.font, self._truncate_name(player.name, 13), (0, 0, 0))
             self.screen.blit(name_text, (sidebar_x + 30, y_offset))
             territories = len(player.territories_owned)
-            total_armies = sum(self.game_board.territories[t].armies for t in player.territories_owned)
+            total_armies = self.game_board.army_totals.get(player.name, 0)
             reinforcement_text = f"+{player.reinforcements}" if player.reinforcements > 0 else ""
             stat_text = self.font.render(f"{territories}🌐 {total_armies}⚔ {reinforcement_text}", True, (60, 60, 60))
             self.screen.blit(stat_text, (sidebar_x + 30, y_offset + 14))
             y_offset += 25
+        return pygame.Rect(sidebar_x, sidebar_y, sidebar_width, sidebar_height)
 
     def draw_cards_panel(self, players, current_player):
         if not current_player or current_player.is_eliminated() or not current_player.cards:
@@ -594,47 +726,80 @@ class GameVisualization:
         pygame.draw.line(self.screen, (100, 100, 100),
                         (cards_x + 10, cards_y + 20),
                         (cards_x + panel_width - 10, cards_y + 20), 2)
-        cards_per_row = min(4, len(current_player.cards))
-        rows_needed = (len(current_player.cards) + cards_per_row - 1) // cards_per_row
-        total_cards_height = rows_needed * (card_height + card_spacing) + 10
-        cards_bg_height = total_cards_height + 30
-        cards_surface = pygame.Surface((panel_width, cards_bg_height), pygame.SRCALPHA)
-        cards_surface.fill((230, 230, 230, 200))
+        # card positions and the panel background depend only on the hand size
+        num_cards = len(current_player.cards)
+        layout = self._card_layouts.get(num_cards)
+        if layout is None:
+            cards_per_row = min(4, num_cards)
+            rows_needed = (num_cards + cards_per_row - 1) // cards_per_row
+            total_cards_height = rows_needed * (card_height + card_spacing) + 10
+            cards_bg_height = total_cards_height + 30
+            cards_surface = pygame.Surface((panel_width, cards_bg_height), pygame.SRCALPHA)
+            cards_surface.fill((230, 230, 230, 200))
+            slots = [(cards_x + 10 + (i % cards_per_row) * (card_width + card_spacing),
+                      cards_y + 30 + (i // cards_per_row) * (card_height + card_spacing))
+                     for i in range(num_cards)]
+            layout = self._card_layouts[num_cards] = (slots, cards_surface.convert_alpha())
+        slots, cards_surface = layout
+        cards_bg_height = cards_surface.get_height()
         self.screen.blit(cards_surface, (cards_x, cards_y))
-        for i, card in enumerate(current_player.cards):
-            row = i // cards_per_row
-            col = i % cards_per_row
-            card_x = cards_x + 10 + col * (card_width + card_spacing)
-            card_y = cards_y + 30 + row * (card_height + card_spacing)
-            card_color = CARD_COLORS.get(card.type, (200, 200, 200))
-            pygame.draw.rect(self.screen, card_color, (card_x, card_y, card_width, card_height))
-            pygame.draw.rect(self.screen, (0, 0, 0), (card_x, card_y, card_width, card_height), 1)
-            type_text = self.font.render(card.type[0], True, (0, 0, 0))
-            self.screen.blit(type_text, (card_x + (card_width - type_text.get_width()) // 2, card_y + 5))
+        # card faces and labels go out in one batched blit
+        blit_list = []
+        for card, (card_x, card_y) in zip(current_player.cards, slots):
+            blit_list.append((self._card_face(card.type, card_width, card_height), (card_x, card_y)))
             if card.territory:
                 terr_name = self._abbreviate_name(card.territory, 5)
-                terr_text = pygame.font.SysFont("Arial", 10).render(terr_name, True, (0, 0, 0))
-                self.screen.blit(terr_text, (card_x + (card_width - terr_text.get_width()) // 2, card_y + card_height - 15))
+                terr_text = self._render_text(self.card_terr_font, terr_name, (0, 0, 0))
+                blit_list.append((terr_text, (card_x + (card_width - terr_text.get_width()) // 2, card_y + card_height - 15)))
+        self.screen.blits(blit_list, doreturn=False)
+        return pygame.Rect(cards_x, cards_y, panel_width, cards_bg_height)
+
+    def _card_face(self, card_type, card_width, card_height):
+        # a card's background, border and type letter depend only on its type, so each is drawn once
+        key = (card_type, card_width, card_height)
+        face = self._card_faces.get(key)
+        if face is None:
+            face = pygame.Surface((card_width, card_height)).convert()
+            face.fill(CARD_COLORS.get(card_type, (200, 200, 200)))
+            pygame.draw.rect(face, (0, 0, 0), (0, 0, card_width, card_height), 1)
+            type_text = self.font.render(card_type[0], True, (0, 0, 0))
+            face.blit(type_text, ((card_width - type_text.get_width()) // 2, 5))
+            self._card_faces[key] = face
+        return face
+
+    def _color_swatch(self, player_name):
+        # 15x15 player colour square, filled once per player rather than drawn every frame
+        swatch = self._color_swatches.get(player_name)
+        if swatch is None:
+            swatch = self._color_swatches[player_name] = pygame.Surface((15, 15)).convert()
+            swatch.fill(TERRITORY_COLORS.get(player_name, (150, 150, 150)))
+        return swatch
 
     def draw_reinforcements_indicator(self, current_player):
         if not current_player or current_player.reinforcements <= 0:
             return
         x, y = 10, 10
-        width, height = 200, 60
-        reinforcement_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        reinforcement_surface.fill((230, 230, 230, 200))
-        self.screen.blit(reinforcement_surface, (x, y))
-        header_text = self.font.render("REINFORCEMENTS", True, (0, 0, 0))
-        self.screen.blit(header_text, (x + 10, y + 10))
-        reinforcement_text = self.large_font.render(f"{current_player.reinforcements}", True, (200, 0, 0))
-        self.screen.blit(reinforcement_text, (x + 20, y + 30))
-        player_color = TERRITORY_COLORS.get(current_player.name, (150, 150, 150))
-        pygame.draw.rect(self.screen, player_color, (x + width - 100, y + 30, 15, 15))
-        name_to_display = current_player.name
-        if len(name_to_display) > 10:
-            name_to_display = name_to_display[:7] + "..."
-        name_text = self.font.render(name_to_display, True, (0, 0, 0))
-        self.screen.blit(name_text, (x + width - 80, y + 30))
+        # the whole panel depends only on the player and their count, so it is composited once per pair
+        key = (current_player.name, current_player.reinforcements)
+        panel = self._hud_cache.get(key)
+        if panel is None:
+            panel = self._compose_reinforcements_indicator(*key)
+            if len(self._hud_cache) >= 32:
+                del self._hud_cache[next(iter(self._hud_cache))]  # drop the oldest
+            self._hud_cache[key] = panel
+        self.screen.blit(panel, (x, y))
+        return panel.get_rect(topleft=(x, y))
+
+    def _compose_reinforcements_indicator(self, player_name, reinforcements):
+        panel = self._reinf_bg.copy()
+        width = panel.get_width()
+        panel.blits([
+            (self._color_swatch(player_name), (width - 100, 30)),
+            (self._reinf_header, (10, 10)),
+            (self.large_font.render(f"{reinforcements}", True, (200, 0, 0)), (20, 30)),
+            (self.font.render(self._truncate_name(player_name, 10), True, (0, 0, 0)), (width - 80, 30)),
+        ], doreturn=False)
+        return panel
 
     def draw_diplomacy_panel(self, players, diplomacy):
         # stub: implement if needed or skip
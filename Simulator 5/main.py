@@ -1,17 +1,61 @@
+import contextlib
+import multiprocessing
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
 from game_manager import GameManager
 
+# Define players as historical military leaders: (Name, Color)
+PLAYER_CONFIGURATIONS = [
+    ("Napoleon Bonaparte", "Red"),     # Aggressive strategy
+    ("Genghis Khan", "Yellow"),        # Opportunistic strategy  
+    ("Alexander the Great", "Purple"), # Aggressive strategy
+    ("Sun Tzu", "Green"),              # Balanced strategy
+    ("Hannibal Barca", "Blue"),        # Opportunistic strategy
+    ("Queen Elizabeth I", "Orange")    # Defensive strategy
+]
+
+def run_one_game(seed):
+    """Play one seeded game without visualization or output; returns {player name: territories held}
+
+    The outcome also depends on the process's hash seed, since territory sets are iterated in
+    hash order; the same seed only replays the same game under a fixed PYTHONHASHSEED.
+    """
+    random.seed(seed)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        game = GameManager(PLAYER_CONFIGURATIONS, use_visualization=False, verbose=False)
+        game.start_main_game_loop()
+    return {p.name: p.get_controlled_territories_count() for p in game.players}
+
+def run_games(seeds, max_workers=None, hash_seed=0):
+    """Play independent seeded games across worker processes; results come back in seed order
+
+    Workers are spawned with PYTHONHASHSEED pinned to hash_seed, so a batch reproduces its results.
+    The hash seed can only be set before an interpreter starts, so it is passed through os.environ
+    for the duration of the call. It must only be called from the main thread, and any other
+    subprocess started while it runs inherits the pinned seed too.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        raise RuntimeError("run_games must be called from the main thread")
+    # Games share no state, so each one runs in its own process (and its own random stream)
+    previous_hash_seed = os.environ.get("PYTHONHASHSEED")
+    os.environ["PYTHONHASHSEED"] = str(hash_seed)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            return list(executor.map(run_one_game, seeds))
+    finally:
+        if previous_hash_seed is None:
+            del os.environ["PYTHONHASHSEED"]
+        else:
+            os.environ["PYTHONHASHSEED"] = previous_hash_seed
+
 def main():
     print("Initializing Risk Simulator...")
     
-    # Define players as historical military leaders: (Name, Color)
-    player_configurations = [
-        ("Napoleon Bonaparte", "Red"),     # Aggressive strategy
-        ("Genghis Khan", "Yellow"),        # Opportunistic strategy  
-        ("Alexander the Great", "Purple"), # Aggressive strategy
-        ("Sun Tzu", "Green"),              # Balanced strategy
-        ("Hannibal Barca", "Blue"),        # Opportunistic strategy
-        ("Queen Elizabeth I", "Orange")    # Defensive strategy
-    ]
+    player_configurations = PLAYER_CONFIGURATIONS
 
     if not 2 <= len(player_configurations) <= 6:
         print("Error: Number of players must be between 2 and 6.")
@@ -26,4 +70,4 @@ def main():
     print("\nRisk Simulator main execution finished.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
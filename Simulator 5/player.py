@@ -1,10 +1,18 @@
 \
 class Player:
+    # Fixed attribute set: no per-instance __dict__, and attribute reads skip the dict lookup
+    __slots__ = ('name', 'color', 'pid', 'ai_strategy', 'territories_owned', '_territories_tuple', 'cards',
+                 'card_type_counts', 'reinforcements', 'conquered_territory_this_turn')
+
     def __init__(self, name: str, color: str):
         self.name = name
         self.color = color
-        self.territories_owned = set() # Set of Territory objects or names
+        self.pid = -1 # Integer ID on the game board (see GameBoard.get_player_id), assigned by the GameManager
+        self.ai_strategy = None # AI strategy controlling this player, assigned by the GameManager
+        self.territories_owned = set() # Set of territory names; membership tests are O(1), iteration order is arbitrary
+        self._territories_tuple = None # Cached snapshot of territories_owned, see territories_owned_tuple
         self.cards = [] # For Risk cards
+        self.card_type_counts = [0, 0, 0, 0] # Cards held per type ID (infantry, cavalry, artillery, wild)
         self.reinforcements = 0
         self.conquered_territory_this_turn = False  # Track if player conquered a territory this turn
 
@@ -13,11 +21,19 @@ class Player:
 
     def add_territory(self, territory_name: str):
         self.territories_owned.add(territory_name)
+        self._territories_tuple = None
         self.conquered_territory_this_turn = True  # Set flag when territory is conquered
 
     def remove_territory(self, territory_name: str):
-        if territory_name in self.territories_owned:
-            self.territories_owned.remove(territory_name)
+        self.territories_owned.discard(territory_name)
+        self._territories_tuple = None
+
+    @property
+    def territories_owned_tuple(self) -> tuple:
+        """territories_owned as a tuple, rebuilt only after a territory is added or removed"""
+        if self._territories_tuple is None:
+            self._territories_tuple = tuple(self.territories_owned)
+        return self._territories_tuple
 
     def get_controlled_territories_count(self) -> int:
         return len(self.territories_owned)
@@ -25,13 +41,14 @@ class Player:
     def add_reinforcements(self, count: int):
         self.reinforcements += count
 
-    def place_army(self, territory_name: str, board: 'GameBoard'):
-        """Places one army on a territory, decrementing reinforcements."""
-        if territory_name in self.territories_owned and self.reinforcements > 0:
+    def place_army(self, territory_name: str, board: 'GameBoard', count: int = 1):
+        """Places armies (one by default) on a territory, decrementing reinforcements."""
+        count = min(count, self.reinforcements)
+        if territory_name in self.territories_owned and count > 0:
             territory = board.get_territory(territory_name)
-            if territory and territory.owner == self.name:
-                territory.armies += 1
-                self.reinforcements -= 1
+            if territory and territory.owner_id == self.pid:
+                board.add_armies(territory, count)
+                self.reinforcements -= count
                 return True
         return False
 
@@ -41,6 +58,17 @@ class Player:
     def add_card(self, card):
         """Add a Risk card to the player's hand."""
         self.cards.append(card)
+        self.card_type_counts[card.type_id] += 1
+        
+    def add_cards(self, cards):
+        """Add several Risk cards to the player's hand."""
+        for card in cards:
+            self.add_card(card)
+        
+    def clear_cards(self):
+        """Empty the player's hand."""
+        self.cards = []
+        self.card_type_counts = [0, 0, 0, 0]
         
     def get_cards(self):
         """Return the player's hand of Risk cards."""
@@ -48,9 +76,15 @@ class Player:
         
     def remove_cards(self, cards_to_remove):
         """Remove specific cards from the player's hand."""
-        for card in cards_to_remove:
-            if card in self.cards:
-                self.cards.remove(card)
+        # Cards compare by identity, so one filtering pass replaces a list.remove scan per card
+        to_remove = {id(card) for card in cards_to_remove}
+        kept = []
+        for card in self.cards:
+            if id(card) in to_remove:
+                self.card_type_counts[card.type_id] -= 1
+            else:
+                kept.append(card)
+        self.cards[:] = kept
     
     def reset_conquest_flag(self):
         """Reset the conquered territory flag at the start of a turn."""